@@ -0,0 +1,179 @@
+import io
+import struct
+import subprocess
+import wave
+import imageio_ffmpeg
+import numpy as np
+from typing import List, Sequence, Tuple
+
+# Integer sample widths decode_wav reads without ffmpeg, with their full-scale value
+_SAMPLE_FORMATS = {1: (np.uint8, 128.0), 2: (np.int16, 32768.0), 4: (np.int32, 2.0**31)}
+
+
+class PCMBuffer:
+    """Decoded audio: float32 samples shaped (frames, channels) in [-1, 1]."""
+
+    def __init__(self, samples: np.ndarray, sample_rate: int):
+        if samples.ndim == 1:
+            samples = samples.reshape(-1, 1)
+        self.samples = samples
+        self.sample_rate = sample_rate
+
+    @classmethod
+    def silence(
+        cls, duration: float, sample_rate: int = 24000, channels: int = 1
+    ) -> "PCMBuffer":
+        """A buffer of silence of the given duration."""
+        frames = int(round(duration * sample_rate))
+        return cls(np.zeros((frames, channels), dtype=np.float32), sample_rate)
+
+    @property
+    def frames(self) -> int:
+        return self.samples.shape[0]
+
+    @property
+    def channels(self) -> int:
+        return self.samples.shape[1]
+
+    @property
+    def duration(self) -> float:
+        """Exact duration in seconds."""
+        return self.frames / self.sample_rate
+
+    def resample(self, sample_rate: int) -> "PCMBuffer":
+        """Linearly resample to another rate; returns self if already there."""
+        if sample_rate == self.sample_rate:
+            return self
+        frames = int(round(self.frames * sample_rate / self.sample_rate))
+        positions = np.arange(frames) * (self.sample_rate / sample_rate)
+        source = np.arange(self.frames)
+        samples = np.empty((frames, self.channels), dtype=np.float32)
+        for channel in range(self.channels):
+            samples[:, channel] = np.interp(positions, source, self.samples[:, channel])
+        return PCMBuffer(samples, sample_rate)
+
+    def with_channels(self, channels: int) -> "PCMBuffer":
+        """Up-mix mono or down-mix to mono; returns self if already matching."""
+        if channels == self.channels:
+            return self
+        if self.channels == 1:
+            return PCMBuffer(
+                np.repeat(self.samples, channels, axis=1), self.sample_rate
+            )
+        if channels == 1:
+            return PCMBuffer(
+                self.samples.mean(axis=1, keepdims=True, dtype=np.float32),
+                self.sample_rate,
+            )
+        raise ValueError(f"Cannot convert {self.channels} channels to {channels}")
+
+    def to_wav(self) -> bytes:
+        """Encode as 16-bit PCM WAV bytes."""
+        pcm = (np.clip(self.samples, -1.0, 1.0) * 32767).astype("<i2")
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as w:
+            w.setnchannels(self.channels)
+            w.setsampwidth(2)
+            w.setframerate(self.sample_rate)
+            w.writeframes(pcm.tobytes())
+        return buffer.getvalue()
+
+
+def decode_wav(data: bytes) -> PCMBuffer:
+    """Decode audio bytes to PCM without touching disk.
+
+    8, 16 and 32-bit integer PCM WAV is decoded directly. Anything the
+    wave module cannot read (float or extensible WAV, AIFF from pyttsx3 on
+    macOS, ...) is decoded by ffmpeg through pipes.
+    """
+    try:
+        with wave.open(io.BytesIO(data), "rb") as w:
+            channels = w.getnchannels()
+            width = w.getsampwidth()
+            sample_rate = w.getframerate()
+            raw = w.readframes(w.getnframes())
+    except (wave.Error, EOFError):
+        return _decode_with_ffmpeg(data)
+    if width not in _SAMPLE_FORMATS:
+        return _decode_with_ffmpeg(data)
+
+    dtype, scale = _SAMPLE_FORMATS[width]
+    # View the frame bytes in place; the float conversion is the only copy
+    ints = np.frombuffer(raw, dtype=np.dtype(dtype).newbyteorder("<"))
+    samples = ints.astype(np.float32)
+    if width == 1:
+        samples -= 128.0
+    samples /= scale
+    return PCMBuffer(samples.reshape(-1, channels), sample_rate)
+
+
+def _decode_with_ffmpeg(data: bytes) -> PCMBuffer:
+    # Sun AU output: a fixed header with rate and channels, then float samples
+    command = [imageio_ffmpeg.get_ffmpeg_exe(), "-loglevel", "error"]
+    command += ["-i", "pipe:0", "-f", "au", "-c:a", "pcm_f32be", "pipe:1"]
+    result = subprocess.run(command, input=data, capture_output=True)
+    if result.returncode != 0 or len(result.stdout) < 24:
+        error = result.stderr.decode("utf-8", "replace").strip()
+        raise ValueError(f"Could not decode audio: {error}")
+    offset, _, _, sample_rate, channels = struct.unpack(">IIIII", result.stdout[4:24])
+    samples = np.frombuffer(result.stdout, dtype=">f4", offset=offset)
+    return PCMBuffer(samples.astype(np.float32).reshape(-1, channels), sample_rate)
+
+
+def _common_format(buffers: Sequence[PCMBuffer]) -> Tuple[int, int]:
+    return (
+        max(b.sample_rate for b in buffers),
+        max(b.channels for b in buffers),
+    )
+
+
+def concatenate(buffers: Sequence[PCMBuffer], gap: float = 0.0) -> PCMBuffer:
+    """Join buffers end to end, with optional silence between them.
+
+    The output is allocated once and every segment is written into its
+    slice, so segments are copied exactly once.
+    """
+    if not buffers:
+        raise ValueError("Nothing to concatenate")
+    sample_rate, channels = _common_format(buffers)
+    buffers = [b.resample(sample_rate).with_channels(channels) for b in buffers]
+    gap_frames = int(round(gap * sample_rate))
+    total = sum(b.frames for b in buffers) + gap_frames * (len(buffers) - 1)
+
+    out = np.zeros((total, channels), dtype=np.float32)
+    position = 0
+    for b in buffers:
+        out[position : position + b.frames] = b.samples
+        position += b.frames + gap_frames
+    return PCMBuffer(out, sample_rate)
+
+
+def segment_offsets(buffers: Sequence[PCMBuffer], gap: float = 0.0) -> List[float]:
+    """Start time of each buffer when concatenated with the given gap."""
+    offsets, position = [], 0.0
+    for b in buffers:
+        offsets.append(position)
+        position += b.duration + gap
+    return offsets
+
+
+def mix(tracks: Sequence[Tuple[PCMBuffer, float]], gain: float = 1.0) -> PCMBuffer:
+    """Sum (buffer, start_seconds) tracks into one buffer, clipped to [-1, 1]."""
+    if not tracks:
+        raise ValueError("Nothing to mix")
+    sample_rate, channels = _common_format([b for b, _ in tracks])
+    placed = []
+    total = 0
+    for buffer, start in tracks:
+        buffer = buffer.resample(sample_rate).with_channels(channels)
+        offset = int(round(start * sample_rate))
+        placed.append((buffer, offset))
+        total = max(total, offset + buffer.frames)
+
+    out = np.zeros((total, channels), dtype=np.float32)
+    for buffer, offset in placed:
+        out[offset : offset + buffer.frames] += buffer.samples
+    if gain != 1.0:
+        out *= gain
+    np.clip(out, -1.0, 1.0, out=out)
+    return PCMBuffer(out, sample_rate)
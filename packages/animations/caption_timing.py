@@ -0,0 +1,203 @@
+import srt
+import numpy as np
+from datetime import timedelta
+from typing import List, Dict, Any, Iterable, Iterator, Sequence, Tuple
+from .audio import PCMBuffer
+
+# Fallback pacing when no audio is available: 0.1s per character
+SECONDS_PER_CHAR = 0.1
+
+WordTiming = Tuple[float, float, str]
+
+
+def format_timestamp(seconds: float, separator: str = ".") -> str:
+    """Format seconds as HH:MM:SS.mmm (use separator="," for SRT)."""
+    millis = int(round(seconds * 1000))
+    hours, millis = divmod(millis, 3_600_000)
+    minutes, millis = divmod(millis, 60_000)
+    secs, millis = divmod(millis, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{millis:03d}"
+
+
+def voiced_runs(
+    buffer: PCMBuffer, frame: float = 0.02, threshold: float = 0.05
+) -> List[Tuple[float, float]]:
+    """(start, end) seconds of non-silent stretches, from per-frame RMS energy.
+
+    A frame counts as voiced if its RMS exceeds `threshold` times the
+    loudest frame's RMS.
+    """
+    hop = max(1, int(round(frame * buffer.sample_rate)))
+    mono = buffer.samples.mean(axis=1)
+    frames = len(mono) // hop
+    if frames == 0:
+        return []
+    energy = np.sqrt(np.mean(mono[: frames * hop].reshape(frames, hop) ** 2, axis=1))
+    peak = energy.max()
+    if peak == 0:
+        return []
+    voiced = energy > peak * threshold
+
+    # Rising and falling edges of the voiced mask
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], voiced.astype(np.int8), [0]))))
+    step = hop / buffer.sample_rate
+    return [(start * step, end * step) for start, end in edges.reshape(-1, 2)]
+
+
+def word_timings(
+    text: str, buffer: PCMBuffer, frame: float = 0.02, threshold: float = 0.05
+) -> List[WordTiming]:
+    """Estimate (start, end, word) timings for text spoken in buffer.
+
+    Words are spread over the voiced stretches in proportion to their
+    length, so pauses in the audio become gaps between words.
+    """
+    words = text.split()
+    runs = voiced_runs(buffer, frame, threshold) or [(0.0, buffer.duration)]
+    if not words:
+        return []
+
+    bounds = np.cumsum([0] + [len(w) for w in words]) / sum(len(w) for w in words)
+    run_lengths = np.array([end - start for start, end in runs])
+    voiced_edges = np.concatenate(([0.0], np.cumsum(run_lengths)))
+    points = bounds * voiced_edges[-1]
+
+    def to_time(position: float, end: bool) -> float:
+        i = min(np.searchsorted(voiced_edges, position) - 1, len(runs) - 1)
+        i = max(i, 0)
+        # A word ending on a run boundary ends in that run; one starting there
+        # starts in the next
+        if not end and i + 1 < len(runs) and np.isclose(position, voiced_edges[i + 1]):
+            i += 1
+        elif end and i > 0 and np.isclose(position, voiced_edges[i]):
+            i -= 1
+        return runs[i][0] + (position - voiced_edges[i])
+
+    return [
+        (to_time(points[i], False), to_time(points[i + 1], True), word)
+        for i, word in enumerate(words)
+    ]
+
+
+class Cue:
+    """One caption cue with optional word-level timings (absolute seconds)."""
+
+    def __init__(
+        self,
+        index: int,
+        start: float,
+        end: float,
+        text: str,
+        words: List[WordTiming] = None,
+    ):
+        self.index = index
+        self.start = start
+        self.end = end
+        self.text = text
+        self.words = words or []
+
+    def __repr__(self) -> str:
+        return f"Cue({self.index}, {self.start:.3f}, {self.end:.3f}, {self.text!r})"
+
+
+def iter_cues(
+    segments: Iterable[Dict[str, Any]],
+    durations: Iterable[float] = None,
+    audio: Iterable[PCMBuffer] = None,
+    gap: float = 0.0,
+    words: bool = False,
+) -> Iterator[Cue]:
+    """Lay segments end to end using the best timing available, lazily.
+
+    Each segment's duration comes from `durations`, else the length of its
+    `audio` buffer, else a "duration" key on the segment, else the
+    0.1s-per-character estimate, so measured narration always wins over
+    a declared length. With words=True and audio given, cues also
+    carry word timings from an energy analysis of the audio. All inputs may
+    be iterators; cues are yielded as soon as their segment arrives.
+    """
+    durations = iter(durations) if durations is not None else None
+    audio = iter(audio) if audio is not None else None
+    start = 0.0
+    for i, seg in enumerate(segments):
+        buffer = next(audio) if audio is not None else None
+        if durations is not None:
+            duration = next(durations)
+        elif buffer is not None:
+            duration = buffer.duration
+        elif seg.get("duration") is not None:
+            duration = seg["duration"]
+        else:
+            duration = len(seg["text"]) * SECONDS_PER_CHAR
+
+        timings = []
+        if words and buffer is not None:
+            timings = [
+                (start + w_start, start + w_end, word)
+                for w_start, w_end, word in word_timings(seg["text"], buffer)
+            ]
+        yield Cue(i + 1, start, start + duration, seg["text"], timings)
+        start += duration + gap
+
+
+def iter_srt_blocks(cues: Iterable[Cue]) -> Iterator[str]:
+    """SRT blocks for cues, skipped and renumbered the way srt.compose does.
+
+    Cues with blank text, a negative start or no duration are dropped and
+    the rest are numbered from 1. Cues arrive in start order, so unlike
+    srt.compose this streams without sorting.
+    """
+    index = 0
+    for cue in cues:
+        start, end = timedelta(seconds=cue.start), timedelta(seconds=cue.end)
+        if not cue.text.strip() or start < timedelta(0) or start >= end:
+            continue
+        index += 1
+        yield srt.Subtitle(index=index, start=start, end=end, content=cue.text).to_srt()
+
+
+def webvtt_block(cue: Cue, word_tags: bool = False) -> str:
+    """One cue as a WebVTT block; word_tags adds inline <timestamp> tags."""
+    text = cue.text
+    if word_tags and cue.words:
+        text = " ".join(
+            word if i == 0 else f"<{format_timestamp(start)}>{word}"
+            for i, (start, _, word) in enumerate(cue.words)
+        )
+    return f"{format_timestamp(cue.start)} --> {format_timestamp(cue.end)}\n{text}\n"
+
+
+class CaptionTimeline:
+    """Cue timeline computed once and rendered to every caption format."""
+
+    def __init__(self, cues: List[Cue]):
+        self.cues = cues
+
+    @classmethod
+    def from_segments(
+        cls,
+        segments: Sequence[Dict[str, Any]],
+        durations: Sequence[float] = None,
+        audio: Sequence[PCMBuffer] = None,
+        gap: float = 0.0,
+        words: bool = False,
+    ) -> "CaptionTimeline":
+        """Compute every cue up front; see iter_cues for the timing rules."""
+        return cls(list(iter_cues(segments, durations, audio, gap, words)))
+
+    @property
+    def duration(self) -> float:
+        return self.cues[-1].end if self.cues else 0.0
+
+    def to_srt(self) -> str:
+        """Render as SRT."""
+        return "".join(iter_srt_blocks(self.cues))
+
+    def to_webvtt(self, word_tags: bool = False) -> str:
+        """Render as WebVTT."""
+        blocks = [webvtt_block(cue, word_tags) for cue in self.cues]
+        return "\n".join(["WEBVTT", ""] + blocks)
+
+    def to_transcript(self) -> str:
+        """Render as a plain text transcript."""
+        return "\n".join(cue.text for cue in self.cues)
@@ -1,56 +1,167 @@
-import srt
-from typing import List, Dict, Any
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Iterable, Iterator, Sequence, TextIO, Tuple
+from .audio import PCMBuffer
+from .caption_timing import (
+    CaptionTimeline,
+    format_timestamp,
+    iter_cues,
+    iter_srt_blocks,
+    webvtt_block,
+)
+
+# File extension for each caption format written by the batch mode
+CAPTION_EXTENSIONS = {"srt": ".srt", "vtt": ".vtt", "transcript": ".txt"}
 
 
 class CaptionGenerator:
-    """Generate SRT/WebVTT captions and transcripts from TTS segments."""
+    """Generate SRT/WebVTT captions and transcripts from TTS segments.
+
+    Cue timings come from real audio durations when they are supplied and
+    fall back to a 0.1s-per-character estimate otherwise.
+    """
 
     def __init__(self, language: str = "en"):
         self.language = language
 
-    def generate_srt(self, segments: List[Dict[str, Any]]) -> str:
-        """Generate SRT caption file from text segments with timings."""
-        subtitles = []
-        start_time = 0.0
-        for i, seg in enumerate(segments):
-            # Estimate duration based on text length (rough heuristic)
-            duration = len(seg["text"]) * 0.1  # 0.1s per character
-            end_time = start_time + duration
-
-            subtitle = srt.Subtitle(
-                index=i + 1,
-                start=srt.timedelta(seconds=start_time),
-                end=srt.timedelta(seconds=end_time),
-                content=seg["text"],
-            )
-            subtitles.append(subtitle)
-            start_time = end_time
+    def timeline(
+        self,
+        segments: List[Dict[str, Any]],
+        durations: Sequence[float] = None,
+        audio: Sequence[PCMBuffer] = None,
+        words: bool = False,
+    ) -> CaptionTimeline:
+        """Compute the cue timeline for segments once."""
+        return CaptionTimeline.from_segments(segments, durations, audio, words=words)
 
-        return srt.compose(subtitles)
+    def generate_srt(
+        self,
+        segments: List[Dict[str, Any]],
+        durations: Sequence[float] = None,
+        audio: Sequence[PCMBuffer] = None,
+    ) -> str:
+        """Generate SRT caption file from text segments with timings."""
+        return self.timeline(segments, durations, audio).to_srt()
 
-    def generate_webvtt(self, segments: List[Dict[str, Any]]) -> str:
+    def generate_webvtt(
+        self,
+        segments: List[Dict[str, Any]],
+        durations: Sequence[float] = None,
+        audio: Sequence[PCMBuffer] = None,
+    ) -> str:
         """Generate WebVTT caption file."""
-        vtt_lines = ["WEBVTT", ""]
-        start_time = 0.0
-        for seg in segments:
-            duration = len(seg["text"]) * 0.1
-            end_time = start_time + duration
-            vtt_lines.append(
-                f"{self._format_time(start_time)} --> {self._format_time(end_time)}"
-            )
-            vtt_lines.append(seg["text"])
-            vtt_lines.append("")
-            start_time = end_time
-        return "\n".join(vtt_lines)
+        return self.timeline(segments, durations, audio).to_webvtt()
 
     def generate_transcript(self, segments: List[Dict[str, Any]]) -> str:
         """Generate a plain text transcript."""
         return "\n".join(seg["text"] for seg in segments)
 
+    def generate_all(
+        self,
+        segments: List[Dict[str, Any]],
+        durations: Sequence[float] = None,
+        audio: Sequence[PCMBuffer] = None,
+        words: bool = False,
+    ) -> Dict[str, str]:
+        """Generate SRT, WebVTT and transcript from a single timing pass."""
+        timeline = self.timeline(segments, durations, audio, words=words)
+        return {
+            "srt": timeline.to_srt(),
+            "vtt": timeline.to_webvtt(word_tags=words),
+            "transcript": timeline.to_transcript(),
+        }
+
+    def write_srt(
+        self,
+        segments: Iterable[Dict[str, Any]],
+        out: TextIO,
+        durations: Iterable[float] = None,
+        audio: Iterable[PCMBuffer] = None,
+    ) -> int:
+        """Stream SRT cues to out as segments arrive; returns the cue count.
+
+        Blank and zero-length cues are skipped, as srt.compose does.
+        """
+        count = 0
+        for block in iter_srt_blocks(iter_cues(segments, durations, audio)):
+            out.write(block)
+            count += 1
+        return count
+
+    def write_webvtt(
+        self,
+        segments: Iterable[Dict[str, Any]],
+        out: TextIO,
+        durations: Iterable[float] = None,
+        audio: Iterable[PCMBuffer] = None,
+    ) -> int:
+        """Stream WebVTT cues to out as segments arrive; returns the cue count."""
+        out.write("WEBVTT\n")
+        count = 0
+        for cue in iter_cues(segments, durations, audio):
+            out.write("\n" + webvtt_block(cue))
+            count += 1
+        return count
+
+    def write_transcript(self, segments: Iterable[Dict[str, Any]], out: TextIO) -> int:
+        """Stream a plain text transcript to out; returns the line count."""
+        count = 0
+        for seg in segments:
+            out.write(("\n" if count else "") + seg["text"])
+            count += 1
+        return count
+
     def _format_time(self, seconds: float) -> str:
         """Format seconds as WebVTT time (HH:MM:SS.mmm)."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millis = int((seconds % 1) * 1000)
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
+        return format_timestamp(seconds)
+
+
+def _caption_job(
+    name: str, segments: List[Dict[str, Any]], output_dir: str, formats: Sequence[str]
+) -> Tuple[str, Dict[str, str]]:
+    """Write every requested caption format for one episode."""
+    gen = CaptionGenerator()
+    writers = {
+        "srt": gen.write_srt,
+        "vtt": gen.write_webvtt,
+        "transcript": gen.write_transcript,
+    }
+    paths = {}
+    for fmt in formats:
+        path = os.path.join(output_dir, name + CAPTION_EXTENSIONS[fmt])
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            writers[fmt](segments, f)
+        os.replace(tmp_path, path)
+        paths[fmt] = path
+    return name, paths
+
+
+def caption_batch(
+    episodes: Iterable[Tuple[str, List[Dict[str, Any]]]],
+    output_dir: str,
+    formats: Sequence[str] = ("srt", "vtt", "transcript"),
+    workers: int = None,
+    window: int = 64,
+) -> Iterator[Tuple[str, Dict[str, str]]]:
+    """Caption many (name, segments) episodes across a process pool.
+
+    Episodes are consumed lazily with at most `window` in flight, so memory
+    stays bounded for any catalog size. Yields (name, {format: path}) in
+    input order.
+    """
+    unknown = set(formats) - set(CAPTION_EXTENSIONS)
+    if unknown:
+        raise ValueError(f"Unknown caption formats: {sorted(unknown)}")
+    os.makedirs(output_dir, exist_ok=True)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for name, segments in episodes:
+            pending.append(
+                executor.submit(_caption_job, name, segments, output_dir, formats)
+            )
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
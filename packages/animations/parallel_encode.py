@@ -0,0 +1,129 @@
+import os
+import shutil
+import tempfile
+import imageio_ffmpeg
+import numpy as np
+from moviepy.video.io.ffmpeg_writer import FFMPEG_VideoWriter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Callable, List, Tuple
+from .scene_cache import concat_segments
+
+# Shared by every chunk so their streams can be joined by stream copy
+CHUNK_SETTINGS = {"codec": "libx264", "pixel_format": "yuv420p", "preset": "medium"}
+
+
+def serial_frame_count(duration: float, fps: float) -> int:
+    """Frames a serial write_videofile emits: one per 1/fps that starts in the clip."""
+    # Same rounding as Clip.iter_frames
+    return int(duration * fps)
+
+
+def plan_chunks(total: int, chunks: int) -> List[Tuple[int, int]]:
+    """Split frames [0, total) into (start_frame, end_frame) ranges.
+
+    Frames are spread as evenly as possible over `chunks` ranges (fewer
+    only if there are fewer frames than chunks). Each chunk is encoded
+    separately and so starts on its own keyframe.
+    """
+    if total <= 0:
+        return []
+    chunks = max(1, min(chunks, total))
+    size, extra = divmod(total, chunks)
+    ranges, start = [], 0
+    for i in range(chunks):
+        end = start + size + (1 if i < extra else 0)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def _encode_chunk(
+    clip_factory: Callable, start: int, end: int, fps: float, path: str
+) -> str:
+    """Encode exactly frames [start, end) of a freshly built clip, video only.
+
+    Frames are sampled at the same times a serial encode uses, so chunk
+    boundaries never drop or duplicate a frame.
+    """
+    clip = clip_factory()
+    try:
+        with FFMPEG_VideoWriter(
+            path,
+            clip.size,
+            fps,
+            codec=CHUNK_SETTINGS["codec"],
+            preset=CHUNK_SETTINGS["preset"],
+            pixel_format=CHUNK_SETTINGS["pixel_format"],
+        ) as writer:
+            for index in range(start, end):
+                frame = clip.get_frame(index / fps)
+                writer.write_frame(frame.astype(np.uint8, copy=False))
+    finally:
+        clip.close()
+    return path
+
+
+def encode_parallel(
+    clip_factory: Callable,
+    output_path: str,
+    fps: float = 24,
+    workers: int = None,
+    chunks: int = None,
+    verify: bool = True,
+) -> Dict[str, Any]:
+    """Encode a clip by splitting its timeline across a process pool.
+
+    MoviePy clips cannot be pickled, so each worker calls clip_factory (a
+    picklable callable, e.g. a module-level function or functools.partial)
+    to build its own copy and encodes one keyframe-aligned chunk of video.
+    The audio track is encoded once in this process. Chunks are then joined
+    and muxed with the audio by stream copy, without re-encoding. With
+    verify=True the result's frame count and duration are checked against
+    what a serial encode produces before the file is moved into place, so a
+    failed check leaves nothing at output_path.
+    """
+    workers = workers or os.cpu_count() or 1
+    clip = clip_factory()
+    duration = clip.duration
+    frames = serial_frame_count(duration, fps)
+    ranges = plan_chunks(frames, chunks or workers)
+    if not ranges:
+        clip.close()
+        raise ValueError(f"Clip of {duration}s has no frames at {fps} fps")
+
+    directory = os.path.dirname(os.path.abspath(output_path))
+    scratch = tempfile.mkdtemp(prefix=".encode-", dir=directory)
+    try:
+        audio_path = None
+        if clip.audio is not None:
+            audio_path = os.path.join(scratch, "audio.m4a")
+            clip.audio.write_audiofile(audio_path, codec="aac", logger=None)
+
+        paths = [os.path.join(scratch, f"chunk{i:04d}.mp4") for i in range(len(ranges))]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_encode_chunk, clip_factory, start, end, fps, path)
+                for (start, end), path in zip(ranges, paths)
+            ]
+            for future in futures:
+                future.result()
+
+        joined = os.path.join(scratch, "output" + os.path.splitext(output_path)[1])
+        concat_segments(paths, joined, audio_path)
+        if verify:
+            verify_encode(joined, frames, frames / fps)
+        os.replace(joined, output_path)
+    finally:
+        clip.close()
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    return {"chunks": len(ranges), "frames": frames, "duration": duration}
+
+
+def verify_encode(path: str, frames: int, duration: float, tolerance: float = 0.05):
+    """Raise ValueError unless path has exactly `frames` frames and the duration."""
+    actual_frames, actual_seconds = imageio_ffmpeg.count_frames_and_secs(path)
+    if actual_frames != frames:
+        raise ValueError(f"{path}: {actual_frames} frames, expected {frames}")
+    if abs(actual_seconds - duration) > tolerance:
+        raise ValueError(f"{path}: {actual_seconds:.3f}s, expected {duration:.3f}s")
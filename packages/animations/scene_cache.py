@@ -0,0 +1,243 @@
+import os
+import json
+import hashlib
+import math
+import shutil
+import subprocess
+import tempfile
+import imageio_ffmpeg
+import moviepy as mp
+import numpy as np
+from PIL import Image, ImageDraw
+from typing import Dict, Any, Iterable, List, Sequence
+from .audio import PCMBuffer
+from .scenes.base_scene import LeetCodeScene
+from .thumbnails import load_font
+from .video_renderer import audio_clip
+
+# Every segment is encoded with identical stream parameters so the final
+# file can be assembled by stream copy
+SEGMENT_SETTINGS = {
+    "size": (1280, 720),
+    "fps": 24,
+    "codec": "libx264",
+    "audio_codec": "aac",
+    "audio_fps": 44100,
+    "pixel_format": "yuv420p",
+}
+# Bump when the way scenes are drawn changes, to invalidate cached segments
+SEGMENT_FORMAT_VERSION = 1
+
+
+def scene_key(scene: LeetCodeScene, audio: PCMBuffer = None) -> str:
+    """Content hash of everything that determines a constructed scene's segment."""
+    audio_digest = None
+    if audio is not None:
+        digest = hashlib.sha256(np.ascontiguousarray(audio.samples).tobytes())
+        audio_digest = [digest.hexdigest(), audio.sample_rate]
+    payload = {
+        "version": SEGMENT_FORMAT_VERSION,
+        # Everything draw_scene_frame reads from the scene
+        "title": scene.episode_data.get("title"),
+        "mobjects": [[type(m).__name__, m.to_dict()] for m in scene.mobjects],
+        "duration": scene.duration,
+        "theme": scene.theme,
+        "audio": audio_digest,
+        "settings": SEGMENT_SETTINGS,
+    }
+    data = json.dumps(payload, sort_keys=True, default=repr).encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def draw_scene_frame(scene: LeetCodeScene, size=(1280, 720)) -> np.ndarray:
+    """Draw a constructed scene's mobjects as a still RGB frame."""
+    theme = scene.theme
+    img = Image.new("RGB", size, theme.get("background", "#1a1a1a"))
+    draw = ImageDraw.Draw(img)
+    color = theme.get("text", "#ffffff")
+    draw.text(
+        (50, 40), scene.episode_data.get("title", ""), fill=color, font=load_font(48)
+    )
+    for i, mobj in enumerate(scene.mobjects):
+        data = mobj.to_dict()
+        detail = data.get("items", data.get("value", ""))
+        draw.text(
+            (50, 140 + 60 * i),
+            f"{type(mobj).__name__} {detail}".rstrip(),
+            fill=data.get("color", color),
+            font=load_font(32),
+        )
+    return np.asarray(img)
+
+
+class SceneCache:
+    """Directory of encoded scene segments named by their scene_key.
+
+    Hits bump a segment's mtime, and prune() removes the least recently
+    used segments once the directory exceeds `max_bytes`.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = 2 * 1024 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def path(self, key: str) -> str:
+        """Where the segment for key lives (whether or not it exists yet)."""
+        return os.path.join(self.cache_dir, f"{key}.mp4")
+
+    def get(self, key: str) -> str:
+        """Path of the cached segment, or None on a miss."""
+        path = self.path(key)
+        try:
+            os.utime(path)
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return path
+
+    def prune(self, keep: Iterable[str] = ()) -> int:
+        """Remove least recently used segments until the cache fits max_bytes.
+
+        Paths in `keep` (e.g. the segments of the render in progress) stay.
+        """
+        keep = {os.path.abspath(path) for path in keep}
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if not name.endswith(".mp4"):
+                continue
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        size = sum(entry[1] for entry in entries)
+        removed = 0
+        for _, entry_size, path in sorted(entries):
+            if size <= self.max_bytes:
+                break
+            if os.path.abspath(path) in keep:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            size -= entry_size
+            removed += 1
+        self.evictions += removed
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+def encode_scene_segment(
+    scene: LeetCodeScene, path: str, audio: PCMBuffer = None
+) -> None:
+    """Encode one constructed scene to path, atomically.
+
+    Narration is padded with silence to the segment length (scenes without
+    narration get a silent track) and normalized to one rate and channel
+    layout, so every segment has identical streams. The segment lasts as
+    long as the scene or its narration, whichever is longer, rounded up to
+    a whole frame.
+    """
+    settings = SEGMENT_SETTINGS
+    duration = max(scene.duration, audio.duration if audio else 0.0)
+    # Whole frames only, so audio and video stay aligned across segments
+    fps = settings["fps"]
+    duration = max(math.ceil(round(duration * fps, 6)), 1) / fps
+    track = PCMBuffer.silence(duration, settings["audio_fps"], channels=2)
+    if audio is not None:
+        audio = audio.resample(settings["audio_fps"]).with_channels(2)
+        frames = min(audio.frames, track.frames)
+        track.samples[:frames] = audio.samples[:frames]
+
+    clip = mp.ImageClip(draw_scene_frame(scene, settings["size"])).with_duration(
+        duration
+    )
+    clip = clip.with_audio(audio_clip(track))
+    directory = os.path.dirname(os.path.abspath(path))
+    scratch = tempfile.mkdtemp(prefix=".segment-", dir=directory)
+    try:
+        tmp_path = os.path.join(scratch, "segment.mp4")
+        clip.write_videofile(
+            tmp_path,
+            fps=settings["fps"],
+            codec=settings["codec"],
+            audio_codec=settings["audio_codec"],
+            audio_fps=settings["audio_fps"],
+            pixel_format=settings["pixel_format"],
+            temp_audiofile_path=scratch,
+            logger=None,
+        )
+        os.replace(tmp_path, path)
+    finally:
+        clip.close()
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+def concat_segments(
+    paths: Sequence[str], output_path: str, audio_path: str = None
+) -> None:
+    """Join segments with ffmpeg's concat demuxer using stream copy.
+
+    With audio_path, the segments' video is muxed with that audio track
+    instead of their own.
+    """
+    with tempfile.TemporaryDirectory(prefix="concat-") as scratch:
+        list_path = os.path.join(scratch, "segments.txt")
+        with open(list_path, "w") as f:
+            for path in paths:
+                escaped = os.path.abspath(path).replace("'", "'\\''")
+                f.write(f"file '{escaped}'\n")
+        command = [imageio_ffmpeg.get_ffmpeg_exe(), "-y", "-loglevel", "error"]
+        command += ["-f", "concat", "-safe", "0", "-i", list_path]
+        if audio_path:
+            command += ["-i", audio_path, "-map", "0:v", "-map", "1:a"]
+        command += ["-c", "copy", output_path]
+        subprocess.run(command, check=True, capture_output=True)
+
+
+def render_scenes(
+    scenes: Sequence[LeetCodeScene],
+    output_path: str,
+    cache: SceneCache,
+    narration: Sequence[PCMBuffer] = None,
+) -> Dict[str, List[str]]:
+    """Render scenes to one video, re-encoding only scenes whose inputs changed.
+
+    Each scene is constructed, hashed and encoded to its own cached segment;
+    the output is then assembled by stream copy and the cache is pruned to
+    its size bound. Returns the keys that were encoded and those reused
+    from the cache.
+    """
+    report = {"encoded": [], "reused": []}
+    segments = []
+    for i, scene in enumerate(scenes):
+        scene.render()
+        audio = narration[i] if narration is not None else None
+        key = scene_key(scene, audio)
+        path = cache.get(key)
+        if path is None:
+            path = cache.path(key)
+            encode_scene_segment(scene, path, audio)
+            report["encoded"].append(key)
+        else:
+            report["reused"].append(key)
+        segments.append(path)
+    concat_segments(segments, output_path)
+    cache.prune(keep=segments)
+    return report
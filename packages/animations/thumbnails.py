@@ -1,10 +1,43 @@
 from PIL import Image, ImageDraw, ImageFont
 import io
-from typing import Dict, Any
+import math
+import os
+import json
+import hashlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, Iterable, List, Tuple
+
+BADGE_COLORS = {"Easy": "#4caf50", "Medium": "#ff9800", "Hard": "#f44336"}
+# Episode fields that affect the rendered thumbnail
+THUMBNAIL_FIELDS = ("title", "difficulty")
+
+# Published variants: video poster, social preview, extension card and icon.
+# "size" of None means the generator's full size.
+DEFAULT_OUTPUTS = [
+    {"name": "poster", "format": "PNG", "size": None},
+    {"name": "social", "format": "JPEG", "size": (1200, 675), "quality": 85},
+    {"name": "card", "format": "WEBP", "size": (640, 360), "quality": 80},
+    {"name": "icon", "format": "PNG", "size": (320, 180)},
+]
+FORMAT_EXTENSIONS = {"PNG": ".png", "JPEG": ".jpg", "WEBP": ".webp"}
+
+
+@lru_cache(maxsize=32)
+def load_font(font_size: int, name: str = "DejaVuSans-Bold.ttf"):
+    """Load a font once per size; FreeType keeps its glyph cache on the font."""
+    try:
+        return ImageFont.truetype(name, font_size)
+    except OSError:
+        return ImageFont.load_default()
 
 
 class ThumbnailGenerator:
-    """Generate dynamic thumbnails from episode metadata."""
+    """Generate dynamic thumbnails from episode metadata.
+
+    The background and difficulty badge are rendered once per difficulty and
+    reused as a template; each thumbnail only draws its title on a copy.
+    """
 
     def __init__(
         self,
@@ -17,37 +50,125 @@ class ThumbnailGenerator:
         self.height = height
         self.bg_color = bg_color
         self.text_color = text_color
+        self._templates: Dict[str, Image.Image] = {}
+        self._generators: Dict[Tuple[int, int], "ThumbnailGenerator"] = {}
 
     def generate_thumbnail(self, episode_data: Dict[str, Any]) -> bytes:
         """Generate thumbnail image bytes."""
-        img = Image.new("RGB", (self.width, self.height), self.bg_color)
+        output = io.BytesIO()
+        self.render(episode_data).save(output, format="PNG")
+        return output.getvalue()
+
+    def render(self, episode_data: Dict[str, Any]) -> Image.Image:
+        """Render the thumbnail as a PIL image."""
+        difficulty = episode_data.get("difficulty", "Unknown")
+        img = self._template(difficulty).copy()
         draw = ImageDraw.Draw(img)
 
         # Add title
         title = episode_data.get("title", "LeetCode Explainer")
         self._draw_text(draw, title, 50, self.height // 2 - 50, font_size=60)
+        return img
 
-        # Add difficulty badge
-        difficulty = episode_data.get("difficulty", "Unknown")
-        badge_color = {"Easy": "#4caf50", "Medium": "#ff9800", "Hard": "#f44336"}.get(
-            difficulty, "#757575"
-        )
-        self._draw_badge(draw, difficulty, 50, self.height - 100, badge_color)
+    def generate_outputs(
+        self,
+        episode_data: Dict[str, Any],
+        outputs: List[Dict[str, Any]] = None,
+        max_workers: int = 4,
+    ) -> Dict[str, bytes]:
+        """Render once and encode every output variant, keyed by name.
 
-        # Convert to bytes
-        output = io.BytesIO()
-        img.save(output, format="PNG")
-        return output.getvalue()
+        Each output gives a name, a format (PNG, JPEG or WEBP), an optional
+        (width, height) defaulting to the generator's size, and an optional
+        quality for lossy formats. The thumbnail is rendered once per aspect
+        ratio, at the largest requested size with that ratio; every smaller
+        size is downscaled once from its master with Lanczos resampling and
+        shared by all formats at that size.
+        Encoding runs on a thread pool since Pillow releases the GIL there.
+        """
+        outputs = DEFAULT_OUTPUTS if outputs is None else outputs
+        own_size = (self.width, self.height)
+        for spec in outputs:
+            if spec["format"].upper() not in FORMAT_EXTENSIONS:
+                raise ValueError(f"Unsupported thumbnail format: {spec['format']}")
+        sizes = [tuple(spec.get("size") or own_size) for spec in outputs]
+
+        def ratio(size: Tuple[int, int]) -> Tuple[int, int]:
+            divisor = math.gcd(*size)
+            return size[0] // divisor, size[1] // divisor
+
+        # Downscaling across ratios would distort, so each ratio gets a master
+        largest = {}
+        for size in sizes:
+            largest[ratio(size)] = max(largest.get(ratio(size), size), size)
+        images = {
+            size: self._sized(size).render(episode_data) for size in largest.values()
+        }
+        for size in sizes:
+            if size not in images:
+                images[size] = images[largest[ratio(size)]].resize(size, Image.LANCZOS)
+
+        def encode(spec: Dict[str, Any]) -> bytes:
+            image = images[tuple(spec.get("size") or own_size)]
+            options = {}
+            if spec.get("quality") is not None:
+                options["quality"] = spec["quality"]
+            output = io.BytesIO()
+            image.save(output, format=spec["format"].upper(), **options)
+            return output.getvalue()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            encoded = executor.map(encode, outputs)
+            return {spec["name"]: data for spec, data in zip(outputs, encoded)}
+
+    def save_outputs(
+        self,
+        episode_data: Dict[str, Any],
+        output_dir: str,
+        stem: str,
+        outputs: List[Dict[str, Any]] = None,
+    ) -> Dict[str, str]:
+        """Write every output variant as `<stem>-<name>.<ext>`; returns the paths."""
+        outputs = DEFAULT_OUTPUTS if outputs is None else outputs
+        os.makedirs(output_dir, exist_ok=True)
+        extensions = {
+            o["name"]: FORMAT_EXTENSIONS[o["format"].upper()] for o in outputs
+        }
+        paths = {}
+        for name, data in self.generate_outputs(episode_data, outputs).items():
+            path = os.path.join(output_dir, f"{stem}-{name}{extensions[name]}")
+            with open(path, "wb") as f:
+                f.write(data)
+            paths[name] = path
+        return paths
+
+    def _sized(self, size: Tuple[int, int]) -> "ThumbnailGenerator":
+        """This generator, or a same-styled one at another size."""
+        if size == (self.width, self.height):
+            return self
+        generator = self._generators.get(size)
+        if generator is None:
+            generator = ThumbnailGenerator(*size, self.bg_color, self.text_color)
+            self._generators[size] = generator
+        return generator
+
+    def _template(self, difficulty: str) -> Image.Image:
+        """Background with the difficulty badge, rendered once per difficulty."""
+        template = self._templates.get(difficulty)
+        if template is None:
+            template = Image.new("RGB", (self.width, self.height), self.bg_color)
+            badge_color = BADGE_COLORS.get(difficulty, "#757575")
+            self._draw_badge(
+                ImageDraw.Draw(template), difficulty, 50, self.height - 100, badge_color
+            )
+            self._templates[difficulty] = template
+        return template
 
     def _draw_text(
         self, draw: ImageDraw.ImageDraw, text: str, x: int, y: int, font_size: int = 40
     ):
         """Draw text on the image."""
-        try:
-            font = ImageFont.truetype("DejaVuSans-Bold.ttf", font_size)
-        except OSError:
-            font = ImageFont.load_default()
-        draw.text((x, y), text, fill=self.text_color, font=font)
+        draw.text((x, y), text, fill=self.text_color, font=load_font(font_size))
 
     def _draw_badge(
         self, draw: ImageDraw.ImageDraw, text: str, x: int, y: int, color: str
@@ -56,3 +177,84 @@ class ThumbnailGenerator:
         # Simple rectangle badge
         draw.rectangle([x, y, x + 100, y + 40], fill=color)
         self._draw_text(draw, text, x + 10, y + 5, font_size=20)
+
+    def metadata_hash(self, episode_data: Dict[str, Any]) -> str:
+        """Hash of everything that determines this episode's thumbnail."""
+        payload = {
+            "fields": {k: episode_data.get(k) for k in THUMBNAIL_FIELDS},
+            "style": [self.width, self.height, self.bg_color, self.text_color],
+        }
+        return hashlib.sha256(
+            json.dumps(payload, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+
+# Per-process generator for batch rendering, so templates and fonts are reused
+_worker_generator = None
+
+
+def _init_worker(options: Dict[str, Any]) -> None:
+    global _worker_generator
+    _worker_generator = ThumbnailGenerator(**options)
+
+
+def _render_job(job: Tuple[str, Dict[str, Any], str]) -> str:
+    name, episode_data, path = job
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_worker_generator.generate_thumbnail(episode_data))
+    os.replace(tmp_path, path)
+    return name
+
+
+def render_thumbnails(
+    episodes: Iterable[Tuple[str, Dict[str, Any]]],
+    output_dir: str,
+    workers: int = None,
+    force: bool = False,
+    **options,
+) -> Dict[str, int]:
+    """Render `<name>.png` for many (name, episode_data) pairs across processes.
+
+    A manifest of metadata hashes in output_dir lets unchanged episodes be
+    skipped; `options` are passed to ThumbnailGenerator.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    manifest_path = os.path.join(output_dir, ".thumbnails.json")
+    try:
+        with open(manifest_path, "r") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+
+    hasher = ThumbnailGenerator(**options)
+    jobs, hashes = [], {}
+    stats = {"rendered": 0, "unchanged": 0}
+    for name, episode_data in episodes:
+        path = os.path.join(output_dir, f"{name}.png")
+        digest = hasher.metadata_hash(episode_data)
+        if not force and manifest.get(name) == digest and os.path.exists(path):
+            stats["unchanged"] += 1
+            continue
+        fields = {k: episode_data[k] for k in THUMBNAIL_FIELDS if k in episode_data}
+        jobs.append((name, fields, path))
+        hashes[name] = digest
+
+    if len(jobs) > 1 and workers != 1:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(options,)
+        ) as executor:
+            for name in executor.map(_render_job, jobs, chunksize=16):
+                manifest[name] = hashes[name]
+                stats["rendered"] += 1
+    else:
+        _init_worker(options)
+        for job in jobs:
+            manifest[_render_job(job)] = hashes[job[0]]
+            stats["rendered"] += 1
+
+    tmp_path = f"{manifest_path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+    return stats
@@ -1,14 +1,36 @@
 import os
+import tempfile
 from google.cloud import texttospeech
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
 import pyttsx3
+from .audio import PCMBuffer, decode_wav
+from .tts_cache import TTSCache
+from .tts_pool import SynthesisPool
 
 
 class TTSGenerator:
-    """Generate audio from text using Google Cloud TTS with pyttsx3 fallback."""
+    """Generate audio from text using Google Cloud TTS with pyttsx3 fallback.
 
-    def __init__(self, credentials_path: str = None, use_fallback: bool = True):
+    Synthesized lines are cached on disk: in `cache` if given, else in the
+    default per-user TTSCache unless use_cache=False. Entries are keyed by
+    the engine that was requested, so a line that fell back to pyttsx3 is
+    still found on the next call.
+    """
+
+    def __init__(
+        self,
+        credentials_path: str = None,
+        use_fallback: bool = True,
+        cache: TTSCache = None,
+        workers: int = 1,
+        use_cache: bool = True,
+    ):
         self.use_fallback = use_fallback
+        if cache is None and use_cache:
+            cache = TTSCache()
+        self.cache = cache
+        self.workers = workers
+        self._pool = None
         if credentials_path and os.path.exists(credentials_path):
             os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = credentials_path
             self.client = texttospeech.TextToSpeechClient()
@@ -18,40 +40,109 @@ class TTSGenerator:
             self.tts_available = False
 
     def generate_audio(
-        self, text: str, voice_name: str = "en-US-Wavenet-D", speaking_rate: float = 1.0
-    ) -> bytes:
-        """Generate audio bytes from text, using fallback if needed."""
+        self,
+        text: str,
+        voice_name: str = "en-US-Wavenet-D",
+        speaking_rate: float = 1.0,
+        pcm: bool = False,
+    ) -> Union[bytes, PCMBuffer]:
+        """Generate audio bytes from text, using fallback if needed.
+
+        Previously synthesized (cached) lines are returned without calling
+        any engine. With pcm=True the WAV is decoded in
+        memory and a PCMBuffer is returned instead.
+        """
+        if pcm:
+            return decode_wav(self.generate_audio(text, voice_name, speaking_rate))
+        engine = "google" if self.tts_available else "pyttsx3"
+        if self.cache is not None:
+            cached = self.cache.get(
+                self.cache.key(text, voice_name, speaking_rate, engine)
+            )
+            if cached is not None:
+                return cached
+
+        audio, _ = self._synthesize(text, voice_name, speaking_rate)
+        if self.cache is not None:
+            self.cache.put(
+                self.cache.key(text, voice_name, speaking_rate, engine), audio
+            )
+        return audio
+
+    def _synthesize(self, text: str, voice_name: str, speaking_rate: float):
+        """Synthesize with the best available engine; return (audio, engine)."""
         if self.tts_available:
             try:
-                synthesis_input = texttospeech.SynthesisInput(text=text)
-                voice = texttospeech.VoiceSelectionParams(
-                    language_code="en-US", name=voice_name
-                )
-                audio_config = texttospeech.AudioConfig(
-                    audio_encoding=texttospeech.AudioEncoding.LINEAR16,
-                    speaking_rate=speaking_rate,
-                )
-                response = self.client.synthesize_speech(
-                    input=synthesis_input, voice=voice, audio_config=audio_config
-                )
-                return response.audio_content
+                return self._synthesize_cloud(text, voice_name, speaking_rate), "google"
             except Exception as e:
                 if self.use_fallback:
-                    return self._generate_fallback_audio(text)
+                    return self._generate_fallback_audio(text), "pyttsx3"
                 raise e
         else:
-            return self._generate_fallback_audio(text)
+            return self._generate_fallback_audio(text), "pyttsx3"
+
+    def _synthesize_cloud(self, text: str, voice_name: str, speaking_rate: float):
+        """Synthesize with Google Cloud TTS; the client is safe to share."""
+        synthesis_input = texttospeech.SynthesisInput(text=text)
+        voice = texttospeech.VoiceSelectionParams(
+            language_code="en-US", name=voice_name
+        )
+        audio_config = texttospeech.AudioConfig(
+            audio_encoding=texttospeech.AudioEncoding.LINEAR16,
+            speaking_rate=speaking_rate,
+        )
+        response = self.client.synthesize_speech(
+            input=synthesis_input, voice=voice, audio_config=audio_config
+        )
+        return response.audio_content
 
     def _generate_fallback_audio(self, text: str) -> bytes:
         """Generate audio using pyttsx3 as fallback."""
-        engine = pyttsx3.init()
-        engine.save_to_file(text, "temp_audio.wav")
-        engine.runAndWait()
-        with open("temp_audio.wav", "rb") as f:
-            audio = f.read()
-        os.remove("temp_audio.wav")
-        return audio
+        # A private temp file per call, so concurrent renders never collide
+        fd, path = tempfile.mkstemp(prefix="tts-", suffix=".wav")
+        os.close(fd)
+        try:
+            engine = pyttsx3.init()
+            engine.save_to_file(text, path)
+            engine.runAndWait()
+            with open(path, "rb") as f:
+                return f.read()
+        finally:
+            os.remove(path)
+
+    def generate_segments(
+        self,
+        segments: List[Dict[str, Any]],
+        voice_name: str = "en-US-Wavenet-D",
+        speaking_rate: float = 1.0,
+        pcm: bool = False,
+    ) -> List[Union[bytes, PCMBuffer]]:
+        """Generate audio for multiple text segments, reusing cached lines.
+
+        With workers > 1, segments are synthesized concurrently on a
+        persistent pool; results keep the order of `segments`. With pcm=True
+        each segment is returned as a decoded PCMBuffer.
+        """
+        if self.workers > 1 and len(segments) > 1:
+            audios = self.pool.generate_segments(segments, voice_name, speaking_rate)
+        else:
+            audios = [
+                self.generate_audio(seg["text"], voice_name, speaking_rate)
+                for seg in segments
+            ]
+        if pcm:
+            return [decode_wav(audio) for audio in audios]
+        return audios
+
+    @property
+    def pool(self) -> SynthesisPool:
+        """Synthesis pool, started on first use and kept until close()."""
+        if self._pool is None:
+            self._pool = SynthesisPool(self, processes=self.workers)
+        return self._pool
 
-    def generate_segments(self, segments: List[Dict[str, Any]]) -> List[bytes]:
-        """Generate audio for multiple text segments."""
-        return [self.generate_audio(seg["text"]) for seg in segments]
+    def close(self) -> None:
+        """Shut down the synthesis pool, if one was started."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
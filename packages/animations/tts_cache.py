@@ -0,0 +1,120 @@
+import os
+import hashlib
+import tempfile
+from typing import Dict, Any, Optional
+from packages.integrations.cache import default_cache_dir
+
+_DIGEST_SIZE = hashlib.sha256().digest_size
+
+
+class TTSCache:
+    """On-disk cache of synthesized audio keyed by (text, voice, rate, engine).
+
+    Each entry stores a SHA-256 of its payload ahead of the audio bytes and is
+    verified on read; corrupt entries are discarded. Reads bump the file's
+    mtime, so eviction removes the least recently used entries once the
+    cache exceeds `max_bytes`. Defaults to the per-user "tts" cache
+    directory.
+    """
+
+    def __init__(self, cache_dir: str = None, max_bytes: int = 512 * 1024 * 1024):
+        self.cache_dir = cache_dir = cache_dir or default_cache_dir("tts")
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.corrupt = 0
+        self.evictions = 0
+        os.makedirs(cache_dir, exist_ok=True)
+        self._size = sum(size for _, size, _ in self._entries())
+
+    @staticmethod
+    def key(text: str, voice_name: str, speaking_rate: float, engine: str) -> str:
+        """Content-addressed key for one synthesis request."""
+        payload = "\0".join([engine, voice_name, repr(float(speaking_rate)), text])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return cached audio, or None on a miss or failed integrity check."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            self.misses += 1
+            return None
+
+        digest, audio = data[:_DIGEST_SIZE], data[_DIGEST_SIZE:]
+        if hashlib.sha256(audio).digest() != digest:
+            self.corrupt += 1
+            self.misses += 1
+            self._remove(path)
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return audio
+
+    def put(self, key: str, audio: bytes) -> None:
+        """Store audio atomically, evicting old entries if over capacity."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(hashlib.sha256(audio).digest())
+                f.write(audio)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+        self._size += _DIGEST_SIZE + len(audio)
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def evict(self) -> int:
+        """Remove least recently used entries until the cache fits max_bytes."""
+        entries = sorted(self._entries())
+        self._size = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in entries:
+            if self._size <= self.max_bytes:
+                break
+            if self._remove(path):
+                self._size -= size
+                removed += 1
+        self.evictions += removed
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "corrupt": self.corrupt,
+            "evictions": self.evictions,
+            "bytes": self._size,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def _entries(self):
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".audio"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            yield st.st_mtime, st.st_size, path
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.audio")
+
+    def _remove(self, path: str) -> bool:
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
@@ -0,0 +1,152 @@
+import os
+import tempfile
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Any, List
+import pyttsx3
+
+# Per-process pyttsx3 engine, created once by the pool initializer
+_worker_engine = None
+_worker_error = None
+
+
+def _init_worker() -> None:
+    global _worker_engine, _worker_error
+    try:
+        _worker_engine = pyttsx3.init()
+    except Exception as e:  # Surface on the first job instead of breaking the pool
+        _worker_error = e
+
+
+def _synthesize_fallback(text: str) -> bytes:
+    """Synthesize one line with this worker's engine into a private temp file."""
+    if _worker_engine is None:
+        raise RuntimeError(f"pyttsx3 is unavailable in this worker: {_worker_error}")
+    fd, path = tempfile.mkstemp(prefix="tts-", suffix=".wav")
+    os.close(fd)
+    try:
+        _worker_engine.save_to_file(text, path)
+        _worker_engine.runAndWait()
+        with open(path, "rb") as f:
+            return f.read()
+    finally:
+        os.remove(path)
+
+
+class SynthesisPool:
+    """Long-lived workers for concurrent narration synthesis.
+
+    pyttsx3 engines are not thread-safe and are slow to start, so fallback
+    synthesis runs in worker processes that each keep one engine alive. The
+    cloud client is thread-safe and I/O bound, so cloud requests share a
+    thread pool. Results always come back in input order.
+    """
+
+    def __init__(self, generator: Any, processes: int = None, threads: int = 8):
+        self.generator = generator
+        self.processes = processes or os.cpu_count() or 1
+        self.threads = threads
+        self._process_pool = None
+        self._thread_pool = None
+
+    def __enter__(self) -> "SynthesisPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def generate_segments(
+        self,
+        segments: List[Dict[str, Any]],
+        voice_name: str = "en-US-Wavenet-D",
+        speaking_rate: float = 1.0,
+    ) -> List[bytes]:
+        """Synthesize segments concurrently, consulting the generator's cache.
+
+        Identical lines are synthesized once. Results are stored under the
+        requested engine's key, the same one they are looked up by.
+        """
+        cache = self.generator.cache
+        requested = self._engine()
+        futures: Dict[str, Future] = {}
+        results: List[Any] = []
+        for seg in segments:
+            text = seg["text"]
+            if text in futures:
+                results.append(futures[text])
+                continue
+            if cache is not None:
+                cached = cache.get(
+                    cache.key(text, voice_name, speaking_rate, requested)
+                )
+                if cached is not None:
+                    results.append(cached)
+                    continue
+            futures[text] = self._submit(text, voice_name, speaking_rate)
+            results.append(futures[text])
+
+        stored = set()
+        audios = []
+        for seg, result in zip(segments, results):
+            if isinstance(result, Future):
+                audio, _ = result.result()
+                text = seg["text"]
+                if cache is not None and text not in stored:
+                    key = cache.key(text, voice_name, speaking_rate, requested)
+                    cache.put(key, audio)
+                    stored.add(text)
+                result = audio
+            audios.append(result)
+        return audios
+
+    def close(self) -> None:
+        """Shut down worker processes and threads."""
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+            self._process_pool = None
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown()
+            self._thread_pool = None
+
+    def _engine(self) -> str:
+        return "google" if self.generator.tts_available else "pyttsx3"
+
+    def _submit(self, text: str, voice_name: str, speaking_rate: float) -> Future:
+        if self.generator.tts_available:
+            return self._threads().submit(
+                self._synthesize_cloud, text, voice_name, speaking_rate
+            )
+        future: Future = Future()
+        inner = self._processes().submit(_synthesize_fallback, text)
+        inner.add_done_callback(lambda f: self._tag(f, future, "pyttsx3"))
+        return future
+
+    def _synthesize_cloud(self, text: str, voice_name: str, speaking_rate: float):
+        try:
+            return (
+                self.generator._synthesize_cloud(text, voice_name, speaking_rate),
+                "google",
+            )
+        except Exception:
+            if not self.generator.use_fallback:
+                raise
+        return self._processes().submit(_synthesize_fallback, text).result(), "pyttsx3"
+
+    @staticmethod
+    def _tag(inner: Future, outer: Future, engine: str) -> None:
+        error = inner.exception()
+        if error is not None:
+            outer.set_exception(error)
+        else:
+            outer.set_result((inner.result(), engine))
+
+    def _processes(self) -> ProcessPoolExecutor:
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.processes, initializer=_init_worker
+            )
+        return self._process_pool
+
+    def _threads(self) -> ThreadPoolExecutor:
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(max_workers=self.threads)
+        return self._thread_pool
@@ -1,61 +1,84 @@
 import moviepy as mp
-from PIL import Image
-import io
+import numpy as np
+import tempfile
+from functools import partial
 from .thumbnails import ThumbnailGenerator
 from .captions import CaptionGenerator
 from .tts import TTSGenerator
+from .audio import PCMBuffer
 from typing import Dict, Any
 
 
+def audio_clip(buffer: PCMBuffer) -> mp.AudioArrayClip:
+    """Wrap a PCM buffer as a MoviePy clip without going through a file."""
+    return mp.AudioArrayClip(buffer.samples, fps=buffer.sample_rate)
+
+
+def still_clip(frame: np.ndarray, audio: PCMBuffer) -> mp.VideoClip:
+    """A still frame held for the length of its narration."""
+    return (
+        mp.ImageClip(frame).with_duration(audio.duration).with_audio(audio_clip(audio))
+    )
+
+
 class VideoRenderer:
-    """Render a complete video from episode data."""
+    """Render a complete video from episode data.
+
+    Image and audio data stay in memory. The only intermediate file is
+    MoviePy's muxing audio track, which goes to a private scratch directory
+    that is removed when the render finishes, so any number of renders can
+    run side by side.
+    """
 
-    def __init__(self, episode_data: Dict[str, Any]):
+    def __init__(self, episode_data: Dict[str, Any], tts: TTSGenerator = None):
         self.episode_data = episode_data
+        self.tts = tts
+
+    def render_video(
+        self,
+        output_path: str = "test_video.mp4",
+        captions_path: str = None,
+        workers: int = 1,
+    ) -> None:
+        """Render the video with animations, TTS, and captions.
 
-    def render_video(self, output_path: str = "test_video.mp4") -> None:
-        """Render the video with animations, TTS, and captions."""
+        With captions_path, SRT captions timed to the narration are written
+        there as well. With workers > 1 the timeline is encoded in parallel
+        chunks.
+        """
         # Generate thumbnail as background image
         thumb_gen = ThumbnailGenerator()
-        thumb_bytes = thumb_gen.generate_thumbnail(self.episode_data)
-
-        # Save thumbnail to file
-        with open("temp_thumbnail.png", "wb") as f:
-            f.write(thumb_bytes)
+        frame = np.asarray(thumb_gen.render(self.episode_data))
 
         # Generate TTS audio
-        tts_gen = TTSGenerator(use_fallback=True)
+        tts_gen = self.tts or TTSGenerator(use_fallback=True)
         narration = "Let's solve the Two Sum problem using a hash map."
-        audio_bytes = tts_gen.generate_audio(narration)
-
-        # Save audio to file
-        with open("temp_audio.wav", "wb") as f:
-            f.write(audio_bytes)
-
-        # Create video clip from thumbnail (static for demo)
-        thumb_clip = mp.ImageClip("temp_thumbnail.png").with_duration(5.0)
-
-        # Add audio
-        audio_clip = mp.AudioFileClip("temp_audio.wav")
-        video_clip = thumb_clip.with_audio(audio_clip)
+        audio = tts_gen.generate_audio(narration, pcm=True)
 
         # Generate captions
-        cap_gen = CaptionGenerator()
-        segments = [{"text": narration}]
-        srt_content = cap_gen.generate_srt(segments)
-
-        # Save SRT for demo
-        with open("temp_captions.srt", "w") as f:
-            f.write(srt_content)
+        if captions_path:
+            cap_gen = CaptionGenerator()
+            segments = [{"text": narration}]
+            with open(captions_path, "w") as f:
+                cap_gen.write_srt(segments, f, audio=[audio])
 
-        # Export video
-        video_clip.write_videofile(output_path, fps=24)
+        if workers > 1:
+            # Imported here: parallel_encode builds on modules that import this one
+            from .parallel_encode import encode_parallel
 
-        # Clean up
-        import os
+            encode_parallel(partial(still_clip, frame, audio), output_path, 24, workers)
+        else:
+            # Create video clip from thumbnail (static for demo), as long as the
+            # narration, with audio straight from memory
+            video_clip = still_clip(frame, audio)
 
-        os.remove("temp_thumbnail.png")
-        os.remove("temp_audio.wav")
-        os.remove("temp_captions.srt")
+            # Export video; MoviePy's temporary audio track goes to a private dir
+            try:
+                with tempfile.TemporaryDirectory(prefix="render-") as scratch:
+                    video_clip.write_videofile(
+                        output_path, fps=24, temp_audiofile_path=scratch
+                    )
+            finally:
+                video_clip.close()
 
         print(f"Video rendered to {output_path} with captions and audio.")
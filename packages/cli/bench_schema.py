@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Benchmark episode validation: per-call jsonschema.validate vs the compiled fast path."""
+
+import argparse
+import copy
+import json
+import sys
+import time
+import jsonschema
+
+try:
+    from .schema import EPISODE_SCHEMA, validate_episode, validate_many
+except ImportError:  # Executed as a script
+    from schema import EPISODE_SCHEMA, validate_episode, validate_many
+
+SAMPLE_EPISODE = {
+    "id": "two-sum",
+    "title": "Two Sum",
+    "leetcodeSlug": "two-sum",
+    "difficulty": "Easy",
+    "pattern": ["hash-map"],
+    "objectives": ["Recognize complement pairs", "Trade space for time"],
+    "recognitionCues": ["Look for pairs summing to target"],
+    "approaches": [{"name": "Hash Map", "intuition": "Store seen values"}],
+    "codeSnippets": [{"language": "python", "code": "def two_sum(): ..."}],
+    "storyboard": [{"time": "00:00", "visual": "Intro"}],
+    "quizzes": [{"question": "Complexity?", "choices": ["O(n)"], "answer": 0}],
+    "accessibility": {"captions": "auto-generated"},
+    "distribution": {"title": "Two Sum Explained"},
+}
+
+
+def make_catalog(count: int) -> list:
+    """Build `count` distinct episodes."""
+    catalog = []
+    for i in range(count):
+        episode = copy.deepcopy(SAMPLE_EPISODE)
+        episode["id"] = f"episode-{i}"
+        episode["difficulty"] = ("Easy", "Medium", "Hard")[i % 3]
+        catalog.append(episode)
+    return catalog
+
+
+def run(count: int) -> dict:
+    """Time each strategy over a catalog and return the results in seconds."""
+    catalog = make_catalog(count)
+    timings = {}
+
+    start = time.perf_counter()
+    for episode in catalog:
+        jsonschema.validate(instance=episode, schema=EPISODE_SCHEMA)
+    timings["jsonschema.validate"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for episode in catalog:
+        validate_episode(episode)
+    timings["validate_episode"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    errors = validate_many(catalog)
+    timings["validate_many"] = time.perf_counter() - start
+    assert not errors
+
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=10000, help="Episodes to validate")
+    args = parser.parse_args()
+
+    timings = run(args.count)
+    baseline = timings["jsonschema.validate"]
+    report = {
+        name: {"seconds": round(t, 4), "speedup": round(baseline / t, 1) if t else None}
+        for name, t in timings.items()
+    }
+    print(json.dumps({"episodes": args.count, "results": report}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+import hashlib
+import json
+import os
+from typing import Dict, Any, List
+from .content_loader import read_front_matter
+
+EPISODE_EXTENSIONS = (".json", ".md")
+INDEX_FIELDS = ("id", "title", "leetcodeSlug", "difficulty", "pattern")
+
+
+def scan_episode_files(content_dir: str) -> List[str]:
+    """All JSON and Markdown files under content_dir, sorted; hidden files are skipped."""
+    files = []
+    for root, _, names in os.walk(content_dir):
+        files.extend(
+            os.path.join(root, name)
+            for name in names
+            if name.endswith(EPISODE_EXTENSIONS) and not name.startswith(".")
+        )
+    return sorted(files)
+
+
+def read_episode_metadata(file_path: str) -> Dict[str, Any]:
+    """Episode metadata without the Markdown body."""
+    if file_path.endswith(".md"):
+        metadata, _ = read_front_matter(file_path)
+        return metadata
+    with open(file_path, "r") as f:
+        return json.load(f)
+
+
+class CatalogIndex:
+    """Persistent listing of episode metadata, rebuilt incrementally.
+
+    Each entry records slug, difficulty, pattern, mtime, size and content
+    hash. A refresh only re-reads files whose mtime or size changed, and
+    only re-parses those whose hash changed, so listing a large catalog
+    never parses Markdown bodies.
+    """
+
+    def __init__(self, content_dir: str, index_path: str = None):
+        self.content_dir = content_dir
+        self.index_path = index_path or os.path.join(content_dir, ".catalog-index.json")
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        if os.path.exists(self.index_path):
+            with open(self.index_path, "r") as f:
+                self.entries = json.load(f)
+
+    def refresh(self) -> Dict[str, int]:
+        """Bring the index up to date with the content directory and save it."""
+        stats = {"added": 0, "updated": 0, "unchanged": 0, "removed": 0}
+        seen = set()
+        for path in scan_episode_files(self.content_dir):
+            rel_path = os.path.relpath(path, self.content_dir)
+            seen.add(rel_path)
+            st = os.stat(path)
+            entry = self.entries.get(rel_path)
+            if (
+                entry is not None
+                and entry["mtime"] == st.st_mtime_ns
+                and entry["size"] == st.st_size
+            ):
+                stats["unchanged"] += 1
+                continue
+
+            with open(path, "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+            if entry is not None and entry["hash"] == digest:
+                entry.update(mtime=st.st_mtime_ns, size=st.st_size)
+                stats["unchanged"] += 1
+                continue
+
+            new_entry = {"mtime": st.st_mtime_ns, "size": st.st_size, "hash": digest}
+            try:
+                metadata = read_episode_metadata(path)
+                new_entry.update({k: metadata.get(k) for k in INDEX_FIELDS})
+            except Exception as e:
+                new_entry["error"] = str(e)
+            stats["updated" if entry is not None else "added"] += 1
+            self.entries[rel_path] = new_entry
+
+        for rel_path in list(self.entries):
+            if rel_path not in seen:
+                del self.entries[rel_path]
+                stats["removed"] += 1
+
+        self.save()
+        return stats
+
+    def save(self) -> None:
+        """Atomically write the index."""
+        tmp_path = f"{self.index_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.entries, f, sort_keys=True)
+        os.replace(tmp_path, self.index_path)
+
+    def find(
+        self, difficulty: str = None, pattern: str = None, slug: str = None
+    ) -> List[Dict[str, Any]]:
+        """Entries matching every given filter, with their relative path."""
+        matches = []
+        for rel_path, entry in sorted(self.entries.items()):
+            if difficulty is not None and entry.get("difficulty") != difficulty:
+                continue
+            if pattern is not None and pattern not in (entry.get("pattern") or []):
+                continue
+            if slug is not None and entry.get("leetcodeSlug") != slug:
+                continue
+            matches.append(dict(entry, path=rel_path))
+        return matches
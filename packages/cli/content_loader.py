@@ -1,45 +1,186 @@
-import re
 import yaml
 import os
-from typing import Dict, Any
+import stat
+import hashlib
+import tempfile
+from collections.abc import MutableMapping
+from typing import Dict, Any, Iterable, Iterator, List, Tuple
 from .schema import validate_episode
 
+# libyaml's C loader/dumper are much faster; fall back to the pure-Python ones
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+# Shared by every episode write so all files serialize identically
+_YAML_DUMP_OPTIONS = {
+    "Dumper": getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+    "default_flow_style": False,
+}
 
-def load_markdown_episode(file_path: str) -> Dict[str, Any]:
-    """Load and parse a Markdown file with YAML front matter into episode data."""
+# Permissions for newly created episode files (mkstemp creates them 0600)
+NEW_FILE_MODE = 0o644
+
+
+def read_front_matter(file_path: str) -> Tuple[Dict[str, Any], int]:
+    """Parse only the YAML front matter of a Markdown file.
+
+    Reads line by line up to the closing `---` and returns the metadata
+    together with the byte offset where the body starts.
+    """
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"File {file_path} not found")
 
-    with open(file_path, "r") as f:
-        content = f.read()
+    with open(file_path, "rb") as f:
+        if f.readline().rstrip(b"\r\n") != b"---":
+            raise ValueError("No valid YAML front matter found")
+        lines = []
+        for line in f:
+            if line.rstrip(b"\r\n") == b"---":
+                break
+            lines.append(line)
+        else:
+            raise ValueError("No valid YAML front matter found")
+        body_offset = f.tell()
+
+    metadata = yaml.load(b"".join(lines).decode("utf-8"), Loader=_YAML_LOADER)
+    if not isinstance(metadata, dict):
+        raise ValueError("YAML front matter must be a mapping")
+    return metadata, body_offset
+
+
+def read_body(file_path: str, body_offset: int) -> str:
+    """Read the Markdown body starting at a byte offset."""
+    with open(file_path, "rb") as f:
+        f.seek(body_offset)
+        return f.read().decode("utf-8").replace("\r\n", "\n").strip()
+
+
+class LazyEpisode(MutableMapping):
+    """Episode mapping whose Markdown body is read on first access.
+
+    "body" is reserved for the Markdown body; a front matter key of that
+    name is ignored.
+    """
+
+    def __init__(self, metadata: Dict[str, Any], file_path: str, body_offset: int):
+        self._data = {k: v for k, v in metadata.items() if k != "body"}
+        self._file_path = file_path
+        self._body_offset = body_offset
+        self._body_loaded = False
+
+    @property
+    def body_loaded(self) -> bool:
+        """Whether the body has been read from disk yet."""
+        return self._body_loaded
+
+    def _load_body(self) -> None:
+        if not self._body_loaded:
+            self._data["body"] = read_body(self._file_path, self._body_offset)
+            self._body_loaded = True
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "body":
+            self._load_body()
+        return self._data[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key == "body":
+            self._body_loaded = True
+        self._data[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key == "body":
+            self._body_loaded = True
+        del self._data[key]
 
-    # Extract YAML front matter (between ---)
-    match = re.match(r"^---\n(.*?)\n---\n(.*)", content, re.DOTALL)
-    if not match:
-        raise ValueError("No valid YAML front matter found")
+    def __iter__(self) -> Iterator[str]:
+        yield from self._data
+        if not self._body_loaded:
+            yield "body"
 
-    front_matter = match.group(1)
-    body = match.group(2)
+    def __len__(self) -> int:
+        return len(self._data) + (0 if self._body_loaded else 1)
 
-    # Parse YAML
-    metadata = yaml.safe_load(front_matter)
-    episode_data = dict(metadata)
-    episode_data["body"] = body.strip()
+    def __repr__(self) -> str:
+        body = "..." if not self._body_loaded else repr(self._data.get("body"))
+        return f"LazyEpisode({self._file_path!r}, body={body})"
 
-    # Validate against schema
-    validate_episode(episode_data)
-    return episode_data
 
+def load_markdown_episode(file_path: str, lazy: bool = False) -> Dict[str, Any]:
+    """Load and parse a Markdown file with YAML front matter into episode data.
 
-def save_markdown_episode(file_path: str, episode_data: Dict[str, Any]) -> None:
-    """Save episode data as Markdown with YAML front matter."""
+    With lazy=True the body is not read until it is first accessed.
+    """
+    metadata, body_offset = read_front_matter(file_path)
+
+    # Validate against schema (the body is not part of it)
+    validate_episode(metadata)
+
+    episode = LazyEpisode(metadata, file_path, body_offset)
+    if lazy:
+        return episode
+    return dict(episode)
+
+
+def render_markdown_episode(episode_data: Dict[str, Any]) -> str:
+    """Serialize episode data as Markdown with YAML front matter."""
     # Remove body if present for front matter only
     front_matter_data = {k: v for k, v in episode_data.items() if k != "body"}
     body = episode_data.get("body", "")
 
-    # Dump YAML
-    yaml_str = yaml.dump(front_matter_data, default_flow_style=False)
-    content = f"---\n{yaml_str}---\n{body}"
+    yaml_str = yaml.dump(front_matter_data, **_YAML_DUMP_OPTIONS)
+    return f"---\n{yaml_str}---\n{body}"
+
+
+def _file_hash(file_path: str) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def write_if_changed(file_path: str, content: str) -> bool:
+    """Atomically write content unless the file already holds identical bytes.
+
+    Returns True if the file was written. The new content goes to a temp
+    file in the same directory and is renamed over the target, so readers
+    and concurrent writers never see a partial file.
+    """
+    data = content.encode("utf-8")
+    try:
+        if _file_hash(file_path) == hashlib.sha256(data).hexdigest():
+            return False
+        mode = stat.S_IMODE(os.stat(file_path).st_mode)
+    except FileNotFoundError:
+        mode = NEW_FILE_MODE
+
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".md")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return True
+
+
+def save_markdown_episode(file_path: str, episode_data: Dict[str, Any]) -> bool:
+    """Save episode data as Markdown with YAML front matter.
+
+    Unchanged files are left untouched; returns True if the file was written.
+    """
+    return write_if_changed(file_path, render_markdown_episode(episode_data))
+
 
-    with open(file_path, "w") as f:
-        f.write(content)
+def save_markdown_episodes(
+    episodes: Iterable[Tuple[str, Dict[str, Any]]],
+) -> Dict[str, List[str]]:
+    """Save many (file_path, episode_data) pairs, skipping unchanged files."""
+    report = {"written": [], "unchanged": []}
+    for file_path, episode_data in episodes:
+        written = save_markdown_episode(file_path, episode_data)
+        report["written" if written else "unchanged"].append(file_path)
+    return report
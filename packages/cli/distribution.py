@@ -1,4 +1,36 @@
-from typing import Dict, Any, List
+import csv
+import hashlib
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Iterator, Set
+from .catalog_index import scan_episode_files
+from .content_loader import load_markdown_episode
+from .schema import load_episode_from_file
+
+FEED_CSV_FIELDS = [
+    "id",
+    "slug",
+    "title",
+    "difficulty",
+    "leetcode",
+    "leetcode_cn",
+    "chapters",
+    "description",
+]
+# The only episode fields build_feed_record reads
+FEED_SOURCE_FIELDS = (
+    "id",
+    "leetcodeSlug",
+    "title",
+    "difficulty",
+    "pattern",
+    "objectives",
+    "storyboard",
+)
+# Bump when build_feed_record's output changes, to invalidate cached records
+FEED_FORMAT_VERSION = 1
 
 
 def generate_deep_links(episode_data: Dict[str, Any]) -> Dict[str, str]:
@@ -55,3 +87,146 @@ def generate_chapters(episode_data: Dict[str, Any]) -> List[Dict[str, Any]]:
     chapters.sort(key=lambda x: x["time"])
 
     return chapters
+
+
+def build_feed_record(episode_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Publishing metadata for one episode."""
+    return {
+        "id": episode_data.get("id"),
+        "slug": episode_data.get("leetcodeSlug"),
+        "title": episode_data.get("title"),
+        "difficulty": episode_data.get("difficulty"),
+        "description": generate_youtube_description(episode_data),
+        "deep_links": generate_deep_links(episode_data),
+        "chapters": generate_chapters(episode_data),
+    }
+
+
+def _feed_record_for_file(path: str, cache_dir: str = None) -> Dict[str, Any]:
+    """Build (or reuse) the feed record for one content file."""
+    digest = hashlib.sha256(f"feed-v{FEED_FORMAT_VERSION}\0".encode("utf-8"))
+    with open(path, "rb") as f:
+        digest.update(f.read())
+    key = digest.hexdigest()
+    cache_path = os.path.join(cache_dir, f"{key}.json") if cache_dir else None
+    if cache_path and os.path.exists(cache_path):
+        with open(cache_path, "r") as f:
+            return {"path": path, "key": key, "cached": True, "record": json.load(f)}
+
+    try:
+        if path.endswith(".md"):
+            # Lazy, so the Markdown body is never read
+            episode = load_markdown_episode(path, lazy=True)
+        else:
+            episode = load_episode_from_file(path)
+        episode_data = {k: episode[k] for k in FEED_SOURCE_FIELDS if k in episode}
+        record = build_feed_record(episode_data)
+    except Exception as e:
+        return {"path": path, "error": str(e)}
+
+    if cache_path:
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(record, f)
+        os.replace(tmp_path, cache_path)
+    return {"path": path, "key": key, "cached": False, "record": record}
+
+
+def _prune_feed_cache(cache_dir: str, live: Set[str]) -> int:
+    """Remove cached records that no current content file maps to."""
+    removed = 0
+    for name in os.listdir(cache_dir):
+        if name.endswith(".json") and name[: -len(".json")] not in live:
+            try:
+                os.remove(os.path.join(cache_dir, name))
+                removed += 1
+            except OSError:
+                pass
+    return removed
+
+
+def iter_feed_records(
+    content_dir: str, cache_dir: str = None, workers: int = None, window: int = 64
+) -> Iterator[Dict[str, Any]]:
+    """Stream feed results for every episode under content_dir, in path order.
+
+    Episodes are processed in a worker pool with at most `window` results in
+    flight, so memory stays bounded regardless of catalog size. With a
+    cache_dir, records are keyed by the source file's content hash and the
+    feed format version, and only changed episodes are regenerated. Once
+    every record has been consumed, cached records for deleted or changed
+    files are pruned, so a cache_dir should serve one content_dir.
+    """
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+    paths = iter(scan_episode_files(content_dir))
+    live = set()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for path in paths:
+            pending.append(executor.submit(_feed_record_for_file, path, cache_dir))
+            if len(pending) >= window:
+                result = pending.popleft().result()
+                live.add(result.get("key"))
+                yield result
+        while pending:
+            result = pending.popleft().result()
+            live.add(result.get("key"))
+            yield result
+    if cache_dir:
+        _prune_feed_cache(cache_dir, live)
+
+
+def export_feeds(
+    content_dir: str,
+    jsonl_path: str = None,
+    csv_path: str = None,
+    cache_dir: str = None,
+    workers: int = None,
+) -> Dict[str, Any]:
+    """Write JSONL and/or CSV publishing feeds for the whole catalog.
+
+    Records are written as they are produced; invalid episodes are skipped
+    and reported.
+    """
+    stats = {"exported": 0, "regenerated": 0, "errors": []}
+    jsonl_file = open(jsonl_path, "w") if jsonl_path else None
+    csv_file = open(csv_path, "w", newline="") if csv_path else None
+    try:
+        csv_writer = None
+        if csv_file is not None:
+            csv_writer = csv.DictWriter(csv_file, fieldnames=FEED_CSV_FIELDS)
+            csv_writer.writeheader()
+
+        for result in iter_feed_records(content_dir, cache_dir, workers):
+            if "error" in result:
+                stats["errors"].append(
+                    {"path": result["path"], "error": result["error"]}
+                )
+                continue
+            record = result["record"]
+            stats["exported"] += 1
+            if not result["cached"]:
+                stats["regenerated"] += 1
+            if jsonl_file is not None:
+                jsonl_file.write(json.dumps(record) + "\n")
+            if csv_writer is not None:
+                csv_writer.writerow(_csv_row(record))
+    finally:
+        for f in (jsonl_file, csv_file):
+            if f is not None:
+                f.close()
+    return stats
+
+
+def _csv_row(record: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": record["id"],
+        "slug": record["slug"],
+        "title": record["title"],
+        "difficulty": record["difficulty"],
+        "leetcode": record["deep_links"]["leetcode"],
+        "leetcode_cn": record["deep_links"]["leetcode_cn"],
+        "chapters": json.dumps(record["chapters"]),
+        "description": record["description"],
+    }
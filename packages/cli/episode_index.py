@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+from typing import Dict, Any, List
+
+if __package__ in (None, ""):
+    # Executed as a script: make the repository root importable
+    sys.path.insert(
+        0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    )
+from packages.cli.schema import EPISODE_SCHEMA, SCHEMA_HASH, validate_episode
+from packages.cli.catalog_index import read_episode_metadata, scan_episode_files
+
+EPISODE_FIELDS = list(EPISODE_SCHEMA["properties"])
+_JSON_FIELDS = {
+    name
+    for name, spec in EPISODE_SCHEMA["properties"].items()
+    if spec.get("type") in ("array", "object")
+}
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+class EpisodeIndex:
+    """SQLite index materializing EPISODE_SCHEMA fields for every content file.
+
+    Scalar fields are stored as columns, arrays and objects as JSON text.
+    Patterns are also normalized into their own table, and pattern,
+    difficulty and slug are indexed, so catalog queries never touch the
+    content files.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.row_factory = sqlite3.Row
+        self._create_schema()
+
+    def _create_schema(self) -> None:
+        """Create the tables, rebuilding them if the stored schema version differs.
+
+        The version hashes the DDL together with the schema's SCHEMA_HASH, so
+        it changes whenever the columns or the validation rules behind the
+        stored valid flag change; the index holds only derived data, so the
+        next sync simply repopulates it.
+        """
+        columns = ", ".join(f"{_quote(name)} TEXT" for name in EPISODE_FIELDS)
+        ddl = f"""
+            CREATE TABLE IF NOT EXISTS episodes (
+                path TEXT PRIMARY KEY,
+                mtime INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                hash TEXT NOT NULL,
+                valid INTEGER NOT NULL,
+                error TEXT,
+                {columns}
+            );
+            CREATE TABLE IF NOT EXISTS episode_patterns (
+                path TEXT NOT NULL REFERENCES episodes(path) ON DELETE CASCADE,
+                pattern TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_episodes_difficulty ON episodes(difficulty);
+            CREATE INDEX IF NOT EXISTS idx_episodes_slug ON episodes(leetcodeSlug);
+            CREATE INDEX IF NOT EXISTS idx_patterns_pattern ON episode_patterns(pattern);
+            CREATE INDEX IF NOT EXISTS idx_patterns_path ON episode_patterns(path);
+            """
+        version = hashlib.sha256(f"{SCHEMA_HASH}\n{ddl}".encode("utf-8")).hexdigest()
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS index_meta (key TEXT PRIMARY KEY, value TEXT)"
+        )
+        row = self.conn.execute(
+            "SELECT value FROM index_meta WHERE key = 'schema_version'"
+        ).fetchone()
+        with self.conn:
+            if row is None or row["value"] != version:
+                self.conn.execute("DROP TABLE IF EXISTS episode_patterns")
+                self.conn.execute("DROP TABLE IF EXISTS episodes")
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO index_meta (key, value) "
+                    "VALUES ('schema_version', ?)",
+                    (version,),
+                )
+        self.conn.executescript(ddl)
+
+    def sync(self, content_dir: str) -> Dict[str, int]:
+        """Update the index from content_dir, re-parsing only changed files."""
+        stats = {"added": 0, "updated": 0, "unchanged": 0, "removed": 0}
+        known = {
+            row["path"]: row
+            for row in self.conn.execute("SELECT path, mtime, size, hash FROM episodes")
+        }
+        seen = set()
+        with self.conn:
+            for path in scan_episode_files(content_dir):
+                rel_path = os.path.relpath(path, content_dir)
+                seen.add(rel_path)
+                st = os.stat(path)
+                row = known.get(rel_path)
+                if row is not None and (row["mtime"], row["size"]) == (
+                    st.st_mtime_ns,
+                    st.st_size,
+                ):
+                    stats["unchanged"] += 1
+                    continue
+
+                with open(path, "rb") as f:
+                    digest = hashlib.sha256(f.read()).hexdigest()
+                if row is not None and row["hash"] == digest:
+                    self.conn.execute(
+                        "UPDATE episodes SET mtime = ?, size = ? WHERE path = ?",
+                        (st.st_mtime_ns, st.st_size, rel_path),
+                    )
+                    stats["unchanged"] += 1
+                    continue
+
+                self._store(path, rel_path, st, digest)
+                stats["updated" if row is not None else "added"] += 1
+
+            for rel_path in set(known) - seen:
+                self.conn.execute(
+                    "DELETE FROM episode_patterns WHERE path = ?", (rel_path,)
+                )
+                self.conn.execute("DELETE FROM episodes WHERE path = ?", (rel_path,))
+                stats["removed"] += 1
+        return stats
+
+    def _store(self, path: str, rel_path: str, st: os.stat_result, digest: str) -> None:
+        values = {name: None for name in EPISODE_FIELDS}
+        valid, error = 0, None
+        try:
+            metadata = read_episode_metadata(path)
+            for name in EPISODE_FIELDS:
+                value = metadata.get(name)
+                if value is not None and (
+                    name in _JSON_FIELDS or not isinstance(value, (str, int, float))
+                ):
+                    value = json.dumps(value, sort_keys=True)
+                values[name] = value
+            validate_episode(metadata)
+            valid = 1
+        except Exception as e:
+            error = str(e)
+
+        columns = ["path", "mtime", "size", "hash", "valid", "error"] + EPISODE_FIELDS
+        placeholders = ", ".join("?" for _ in columns)
+        self.conn.execute(
+            f"INSERT OR REPLACE INTO episodes ({', '.join(map(_quote, columns))}) "
+            f"VALUES ({placeholders})",
+            [rel_path, st.st_mtime_ns, st.st_size, digest, valid, error]
+            + [values[name] for name in EPISODE_FIELDS],
+        )
+        self.conn.execute("DELETE FROM episode_patterns WHERE path = ?", (rel_path,))
+        patterns = json.loads(values["pattern"]) if values["pattern"] else []
+        if not isinstance(patterns, list):
+            # A scalar such as `pattern: Two Pointers` is a single pattern
+            patterns = [patterns]
+        self.conn.executemany(
+            "INSERT INTO episode_patterns (path, pattern) VALUES (?, ?)",
+            [(rel_path, p) for p in patterns if isinstance(p, str)],
+        )
+
+    def query(
+        self,
+        difficulty: str = None,
+        pattern: str = None,
+        slug: str = None,
+        missing: str = None,
+        valid: bool = None,
+    ) -> List[Dict[str, Any]]:
+        """Episodes matching every given filter, decoded, sorted by path.
+
+        `missing` names a schema field that is absent or empty.
+        """
+        clauses, params = [], []
+        if difficulty is not None:
+            clauses.append("difficulty = ?")
+            params.append(difficulty)
+        if slug is not None:
+            clauses.append("leetcodeSlug = ?")
+            params.append(slug)
+        if pattern is not None:
+            clauses.append(
+                "path IN (SELECT path FROM episode_patterns WHERE pattern = ?)"
+            )
+            params.append(pattern)
+        if missing is not None:
+            if missing not in EPISODE_FIELDS:
+                raise ValueError(f"Unknown episode field: {missing}")
+            column = _quote(missing)
+            clauses.append(f"({column} IS NULL OR {column} IN ('', '[]', '{{}}'))")
+        if valid is not None:
+            clauses.append("valid = ?")
+            params.append(1 if valid else 0)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self.conn.execute(
+            f"SELECT * FROM episodes {where} ORDER BY path", params
+        )
+        return [self._decode(row) for row in rows]
+
+    def _decode(self, row: sqlite3.Row) -> Dict[str, Any]:
+        episode = {"path": row["path"], "valid": bool(row["valid"])}
+        if row["error"]:
+            episode["error"] = row["error"]
+        for name in EPISODE_FIELDS:
+            value = row[name]
+            if value is not None:
+                episode[name] = json.loads(value) if name in _JSON_FIELDS else value
+        return episode
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Index and query episode content.")
+    parser.add_argument(
+        "--db", default="episodes.sqlite", help="Path to the SQLite index"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    sync_parser = commands.add_parser("sync", help="Sync the index from content files")
+    sync_parser.add_argument("content_dir", nargs="?", default="content")
+
+    query_parser = commands.add_parser("query", help="Query indexed episodes")
+    query_parser.add_argument("--difficulty", choices=["Easy", "Medium", "Hard"])
+    query_parser.add_argument("--pattern")
+    query_parser.add_argument("--slug")
+    query_parser.add_argument("--missing", choices=EPISODE_FIELDS)
+    query_parser.add_argument("--invalid", action="store_true")
+    query_parser.add_argument("--json", action="store_true", help="Print JSON")
+    args = parser.parse_args()
+
+    index = EpisodeIndex(args.db)
+    try:
+        if args.command == "sync":
+            print(json.dumps(index.sync(args.content_dir)))
+            return 0
+
+        episodes = index.query(
+            difficulty=args.difficulty,
+            pattern=args.pattern,
+            slug=args.slug,
+            missing=args.missing,
+            valid=False if args.invalid else None,
+        )
+        if args.json:
+            print(json.dumps(episodes, indent=2))
+        else:
+            for episode in episodes:
+                print(
+                    f"{episode['path']}\t{episode.get('leetcodeSlug', '')}\t"
+                    f"{episode.get('title', '')}"
+                )
+        return 0
+    finally:
+        index.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
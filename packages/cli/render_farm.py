@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import multiprocessing
+import os
+import re
+import socket
+import sqlite3
+import sys
+import threading
+import time
+from typing import Dict, Any, Callable, List, Optional, Tuple
+
+if __package__ in (None, ""):
+    # Executed as a script: make the repository root importable
+    sys.path.insert(
+        0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    )
+from packages.cli.schema import load_episode_from_file
+from packages.cli.content_loader import load_markdown_episode
+
+JOB_STATES = ("queued", "running", "done", "failed")
+
+
+class RenderQueue:
+    """Persistent render job queue in SQLite, standing in for Redis.
+
+    Jobs are claimed highest priority first (then oldest) inside an
+    immediate transaction, so several worker processes can share one
+    database. Running jobs send heartbeats; a job whose worker stops
+    heartbeating is put back in the queue by recover_stale. Failed attempts
+    are retried until max_attempts is reached.
+    """
+
+    def __init__(self, db_path: str, timeout: float = 30.0):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path, timeout=timeout, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                episode_path TEXT NOT NULL,
+                output_path TEXT NOT NULL,
+                priority INTEGER NOT NULL DEFAULT 0,
+                status TEXT NOT NULL DEFAULT 'queued',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                max_attempts INTEGER NOT NULL DEFAULT 3,
+                error TEXT,
+                worker TEXT,
+                heartbeat REAL,
+                created REAL NOT NULL,
+                started REAL,
+                finished REAL
+            );
+            CREATE INDEX IF NOT EXISTS idx_jobs_claim
+                ON jobs(status, priority DESC, id);
+            """)
+
+    def submit(
+        self,
+        episode_path: str,
+        output_path: str,
+        priority: int = 0,
+        max_attempts: int = 3,
+    ) -> int:
+        """Queue a render job and return its id."""
+        cursor = self.conn.execute(
+            "INSERT INTO jobs (episode_path, output_path, priority, max_attempts, "
+            "created) VALUES (?, ?, ?, ?, ?)",
+            (episode_path, output_path, priority, max_attempts, time.time()),
+        )
+        return cursor.lastrowid
+
+    def claim(self, worker: str) -> Optional[Dict[str, Any]]:
+        """Atomically take the next queued job, or None if there is none."""
+        now = time.time()
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = self.conn.execute(
+                "SELECT id FROM jobs WHERE status = 'queued' "
+                "ORDER BY priority DESC, id LIMIT 1"
+            ).fetchone()
+            if row is None:
+                self.conn.execute("COMMIT")
+                return None
+            self.conn.execute(
+                "UPDATE jobs SET status = 'running', attempts = attempts + 1, "
+                "worker = ?, heartbeat = ?, started = ?, error = NULL WHERE id = ?",
+                (worker, now, now, row["id"]),
+            )
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        return self.get(row["id"])
+
+    def heartbeat(self, job_id: int, worker: str) -> bool:
+        """Record that the job's worker is still alive.
+
+        Like complete and fail, this only touches a job the worker still
+        owns; False means the job was lost (requeued as stale and possibly
+        claimed by another worker).
+        """
+        cursor = self.conn.execute(
+            "UPDATE jobs SET heartbeat = ? "
+            "WHERE id = ? AND worker = ? AND status = 'running'",
+            (time.time(), job_id, worker),
+        )
+        return cursor.rowcount == 1
+
+    def complete(self, job_id: int, worker: str) -> bool:
+        """Mark a running job as done; False if the worker lost the job."""
+        cursor = self.conn.execute(
+            "UPDATE jobs SET status = 'done', finished = ? "
+            "WHERE id = ? AND worker = ? AND status = 'running'",
+            (time.time(), job_id, worker),
+        )
+        return cursor.rowcount == 1
+
+    def fail(self, job_id: int, worker: str, error: str) -> Optional[str]:
+        """Requeue a failed job, or mark it failed once out of attempts.
+
+        Returns the job's new status, or None if the worker lost the job.
+        """
+        cursor = self.conn.execute(
+            "UPDATE jobs SET error = ?, finished = ?, status = CASE "
+            "WHEN attempts < max_attempts THEN 'queued' ELSE 'failed' END "
+            "WHERE id = ? AND worker = ? AND status = 'running'",
+            (error, time.time(), job_id, worker),
+        )
+        if cursor.rowcount == 0:
+            return None
+        return self.get(job_id)["status"]
+
+    def recover_stale(self, stale_after: float = 60.0) -> int:
+        """Requeue running jobs whose heartbeat is older than stale_after seconds."""
+        cutoff = time.time() - stale_after
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            stale = [
+                row["id"]
+                for row in self.conn.execute(
+                    "SELECT id FROM jobs WHERE status = 'running' AND heartbeat < ?",
+                    (cutoff,),
+                )
+            ]
+            for job_id in stale:
+                self.conn.execute(
+                    "UPDATE jobs SET error = 'worker stopped responding', "
+                    "status = CASE WHEN attempts < max_attempts "
+                    "THEN 'queued' ELSE 'failed' END WHERE id = ?",
+                    (job_id,),
+                )
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        return len(stale)
+
+    def retry_failed(self) -> int:
+        """Give every failed job a fresh set of attempts."""
+        cursor = self.conn.execute(
+            "UPDATE jobs SET status = 'queued', attempts = 0 WHERE status = 'failed'"
+        )
+        return cursor.rowcount
+
+    def get(self, job_id: int) -> Optional[Dict[str, Any]]:
+        """One job by id, or None."""
+        row = self.conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return dict(row) if row is not None else None
+
+    def jobs(self, status: str = None) -> List[Dict[str, Any]]:
+        """All jobs, optionally filtered by status, in claim order."""
+        where, params = ("WHERE status = ?", (status,)) if status else ("", ())
+        rows = self.conn.execute(
+            f"SELECT * FROM jobs {where} ORDER BY priority DESC, id", params
+        )
+        return [dict(row) for row in rows]
+
+    def counts(self) -> Dict[str, int]:
+        """Number of jobs in each state."""
+        counts = dict.fromkeys(JOB_STATES, 0)
+        for row in self.conn.execute(
+            "SELECT status, COUNT(*) AS n FROM jobs GROUP BY status"
+        ):
+            counts[row["status"]] = row["n"]
+        return counts
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+
+def render_episode(episode_path: str, output_path: str) -> None:
+    """Render one episode file to output_path, with SRT captions beside it.
+
+    run_worker points output_path at a private staging name and publishes
+    the files only once it has confirmed it still owns the job.
+    """
+    # Imported here so queue management never has to load MoviePy
+    from packages.animations.video_renderer import VideoRenderer
+
+    if episode_path.endswith(".md"):
+        episode_data = load_markdown_episode(episode_path)
+    else:
+        episode_data = load_episode_from_file(episode_path)
+
+    directory = os.path.dirname(os.path.abspath(output_path))
+    os.makedirs(directory, exist_ok=True)
+    root = os.path.splitext(output_path)[0]
+    VideoRenderer(episode_data).render_video(output_path, captions_path=f"{root}.srt")
+
+
+def _staged_outputs(job: Dict[str, Any], worker: str) -> List[Tuple[str, str]]:
+    """(staging path, published path) for a job's video and captions.
+
+    Staging names are unique per worker and attempt, so a worker that lost
+    the job never writes to the files its new owner is producing.
+    """
+    root, ext = os.path.splitext(job["output_path"])
+    tag = re.sub(r"[^A-Za-z0-9_.-]", "_", f"{worker}.{job['attempts']}")
+    staged_root = f"{root}.{tag}.partial"
+    return [
+        (f"{staged_root}{ext}", job["output_path"]),
+        (f"{staged_root}.srt", f"{root}.srt"),
+    ]
+
+
+def run_worker(
+    db_path: str,
+    worker: str = None,
+    render: Callable[[str, str], None] = render_episode,
+    poll_interval: float = 1.0,
+    heartbeat_interval: float = 10.0,
+    stale_after: float = 60.0,
+    stop_when_empty: bool = True,
+) -> int:
+    """Claim and render jobs until the queue is empty; returns jobs processed."""
+    worker = worker or f"{socket.gethostname()}:{os.getpid()}"
+    queue = RenderQueue(db_path)
+    processed = 0
+    try:
+        while True:
+            queue.recover_stale(stale_after)
+            job = queue.claim(worker)
+            if job is None:
+                if stop_when_empty:
+                    return processed
+                time.sleep(poll_interval)
+                continue
+
+            stop = threading.Event()
+            beat = threading.Thread(
+                target=_heartbeat,
+                args=(db_path, job["id"], worker, heartbeat_interval, stop),
+                daemon=True,
+            )
+            beat.start()
+            staged = _staged_outputs(job, worker)
+            try:
+                render(job["episode_path"], staged[0][0])
+            except Exception as e:
+                owned = queue.fail(job["id"], worker, f"{type(e).__name__}: {e}")
+            else:
+                # Publish only once the job is ours and done: a worker that
+                # lost it must not overwrite its new owner's output
+                owned = queue.complete(job["id"], worker)
+                if owned:
+                    for staged_path, path in staged:
+                        if os.path.exists(staged_path):
+                            os.replace(staged_path, path)
+            finally:
+                stop.set()
+                beat.join()
+                for staged_path, _ in staged:
+                    if os.path.exists(staged_path):
+                        os.remove(staged_path)
+            if not owned:
+                # Requeued as stale meanwhile; its current owner reports it
+                print(f"Job {job['id']} was lost by {worker}", file=sys.stderr)
+            processed += 1
+    finally:
+        queue.close()
+
+
+def _heartbeat(
+    db_path: str, job_id: int, worker: str, interval: float, stop: threading.Event
+):
+    # Own connection: sqlite3 connections must stay on their creating thread
+    queue = RenderQueue(db_path)
+    try:
+        while not stop.wait(interval):
+            if not queue.heartbeat(job_id, worker):
+                break
+    finally:
+        queue.close()
+
+
+def run_workers(db_path: str, processes: int = None, **worker_kwargs) -> None:
+    """Run one worker per process (default: one per core) until they finish."""
+    processes = processes or os.cpu_count() or 1
+    workers = [
+        multiprocessing.Process(
+            target=run_worker, args=(db_path,), kwargs=worker_kwargs, daemon=False
+        )
+        for _ in range(processes)
+    ]
+    for process in workers:
+        process.start()
+    for process in workers:
+        process.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Queue and render episode videos.")
+    parser.add_argument(
+        "--db", default="render-jobs.sqlite", help="Path to the SQLite job queue"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    submit_parser = commands.add_parser("submit", help="Queue episodes for rendering")
+    submit_parser.add_argument("paths", nargs="+", help="Episode files")
+    submit_parser.add_argument("--output-dir", default="renders")
+    submit_parser.add_argument("--priority", type=int, default=0)
+    submit_parser.add_argument("--max-attempts", type=int, default=3)
+
+    status_parser = commands.add_parser("status", help="Show queue state")
+    status_parser.add_argument("--json", action="store_true", help="Print JSON")
+
+    work_parser = commands.add_parser("work", help="Run render workers")
+    work_parser.add_argument(
+        "--workers", type=int, default=None, help="Worker processes (default: cores)"
+    )
+    work_parser.add_argument(
+        "--forever", action="store_true", help="Keep polling for new jobs"
+    )
+    work_parser.add_argument("--stale-after", type=float, default=60.0)
+
+    commands.add_parser("retry", help="Requeue failed jobs")
+    args = parser.parse_args()
+
+    if args.command == "work":
+        run_workers(
+            args.db,
+            args.workers,
+            stale_after=args.stale_after,
+            stop_when_empty=not args.forever,
+        )
+        args.command = "status"
+        args.json = False
+
+    queue = RenderQueue(args.db)
+    try:
+        if args.command == "submit":
+            for path in args.paths:
+                name = os.path.splitext(os.path.basename(path))[0]
+                output_path = os.path.join(args.output_dir, f"{name}.mp4")
+                job_id = queue.submit(
+                    path, output_path, args.priority, args.max_attempts
+                )
+                print(f"{job_id}\t{path} -> {output_path}")
+        elif args.command == "retry":
+            print(f"Requeued {queue.retry_failed()} failed job(s)")
+        else:
+            jobs = queue.jobs()
+            if args.json:
+                print(json.dumps({"counts": queue.counts(), "jobs": jobs}, indent=2))
+            else:
+                for job in jobs:
+                    error = f"\t{job['error']}" if job["error"] else ""
+                    print(
+                        f"{job['id']}\t{job['status']}\tp{job['priority']}\t"
+                        f"{job['attempts']}/{job['max_attempts']}\t"
+                        f"{job['episode_path']}{error}"
+                    )
+                print(json.dumps(queue.counts()))
+        return 0 if queue.counts()["failed"] == 0 else 1
+    finally:
+        queue.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,8 @@
 import json
+import hashlib
+import functools
 import jsonschema
-from typing import Dict, Any
+from typing import Dict, Any, Callable, Iterable, List, Tuple
 
 # Basic JSON Schema for episode content (expandable)
 EPISODE_SCHEMA = {
@@ -24,9 +26,113 @@ EPISODE_SCHEMA = {
 }
 
 
+_TYPE_CHECKS = {
+    "string": lambda v: isinstance(v, str),
+    "array": lambda v: isinstance(v, list),
+    "object": lambda v: isinstance(v, dict),
+    "boolean": lambda v: isinstance(v, bool),
+    "null": lambda v: v is None,
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+}
+_SUPPORTED_KEYWORDS = {"type", "enum", "properties", "required", "items"}
+
+
+def compile_schema(schema: Dict[str, Any]) -> Callable[[Any], bool]:
+    """Compile a schema into a specialized predicate that accepts valid data.
+
+    Only the keywords EPISODE_SCHEMA uses are specialized. A schema using
+    anything else compiles to a predicate that always returns False, which
+    sends every instance through the full jsonschema validator.
+    """
+    if not set(schema) <= _SUPPORTED_KEYWORDS or not isinstance(
+        schema.get("items", {}), dict
+    ):
+        return lambda value: False
+
+    checks = []
+    if "type" in schema:
+        types = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+        type_checks = [_TYPE_CHECKS[t] for t in types]
+        checks.append(lambda v: any(check(v) for check in type_checks))
+    if "enum" in schema:
+        allowed = schema["enum"]
+        checks.append(lambda v: any(v == a and type(v) is type(a) for a in allowed))
+    if "required" in schema:
+        required = tuple(schema["required"])
+        checks.append(
+            lambda v: not isinstance(v, dict) or all(key in v for key in required)
+        )
+    if "properties" in schema:
+        properties = [
+            (name, compile_schema(sub)) for name, sub in schema["properties"].items()
+        ]
+
+        def check_properties(v: Any) -> bool:
+            if not isinstance(v, dict):
+                return True
+            for name, check in properties:
+                if name in v and not check(v[name]):
+                    return False
+            return True
+
+        checks.append(check_properties)
+    if "items" in schema:
+        check_item = compile_schema(schema["items"])
+        checks.append(
+            lambda v: not isinstance(v, list) or all(check_item(i) for i in v)
+        )
+
+    def check(value: Any) -> bool:
+        for c in checks:
+            if not c(value):
+                return False
+        return True
+
+    return check
+
+
+_fast_check = compile_schema(EPISODE_SCHEMA)
+
+# Bump when validation logic changes without the schema changing
+VALIDATOR_VERSION = 1
+# Identifies the rules a stored validation result was produced under
+SCHEMA_HASH = hashlib.sha256(
+    json.dumps(
+        {"schema": EPISODE_SCHEMA, "validator": VALIDATOR_VERSION}, sort_keys=True
+    ).encode("utf-8")
+).hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def get_validator() -> Any:
+    """Return the episode validator, checking and building the schema once."""
+    cls = jsonschema.validators.validator_for(EPISODE_SCHEMA)
+    cls.check_schema(EPISODE_SCHEMA)
+    return cls(EPISODE_SCHEMA)
+
+
 def validate_episode(data: Dict[str, Any]) -> None:
     """Validate episode data against the schema."""
-    jsonschema.validate(instance=data, schema=EPISODE_SCHEMA)
+    if _fast_check(data):
+        return
+    error = jsonschema.exceptions.best_match(get_validator().iter_errors(data))
+    if error is not None:
+        raise error
+
+
+def validate_many(
+    episodes: Iterable[Dict[str, Any]],
+) -> List[Tuple[int, jsonschema.ValidationError]]:
+    """Validate many episodes; return (index, error) for each invalid one."""
+    errors = []
+    for index, data in enumerate(episodes):
+        if _fast_check(data):
+            continue
+        error = jsonschema.exceptions.best_match(get_validator().iter_errors(data))
+        if error is not None:
+            errors.append((index, error))
+    return errors
 
 
 def load_episode_from_file(file_path: str) -> Dict[str, Any]:
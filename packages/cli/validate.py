@@ -1,30 +1,188 @@
 #!/usr/bin/env python3
 import argparse
+import glob
+import hashlib
 import json
+import os
 import sys
-from schema import load_episode_from_file
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List
+
+if __package__ in (None, ""):
+    # Executed as a script: make the repository root importable
+    sys.path.insert(
+        0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    )
+from packages.cli.schema import SCHEMA_HASH, load_episode_from_file
+from packages.cli.content_loader import load_markdown_episode
+from packages.cli.catalog_index import scan_episode_files
+
+
+def expand_paths(paths: List[str]) -> List[str]:
+    """Expand files, directories and glob patterns into episode file paths."""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(scan_episode_files(path))
+        elif glob.has_magic(path):
+            files.extend(
+                match
+                for match in glob.glob(path, recursive=True)
+                if os.path.isfile(match)
+            )
+        else:
+            files.append(path)
+    return sorted(dict.fromkeys(files))
+
+
+def hash_file(path: str) -> str:
+    """SHA-256 of a file's bytes."""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def validate_file(path: str) -> Dict[str, Any]:
+    """Validate one JSON or Markdown episode and return a timed result record."""
+    start = time.perf_counter()
+    result = {"path": path, "valid": False}
+    try:
+        result["hash"] = hash_file(path)
+        if path.endswith(".md"):
+            episode = load_markdown_episode(path)
+        else:
+            episode = load_episode_from_file(path)
+        result.update(valid=True, id=episode["id"], title=episode["title"])
+    except FileNotFoundError:
+        result["error"] = f"File {path} not found."
+    except json.JSONDecodeError as e:
+        result["error"] = f"Invalid JSON in {path}: {e}"
+    except Exception as e:
+        result["error"] = str(e)
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def load_manifest(path: str) -> Dict[str, Dict[str, Any]]:
+    """Load previous results keyed by file path.
+
+    Missing manifests, and manifests written under another schema or
+    validator version, are empty.
+    """
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path, "r") as f:
+        manifest = json.load(f)
+    if manifest.get("schema") != SCHEMA_HASH:
+        return {}
+    return manifest.get("files", {})
+
+
+def save_manifest(path: str, results: List[Dict[str, Any]]) -> None:
+    """Merge results that carry a content hash into the manifest.
+
+    Entries for files not in this run are kept.
+    """
+    files = load_manifest(path)
+    files.update((r["path"], r) for r in results if "hash" in r)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"schema": SCHEMA_HASH, "files": files}, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def validate_paths(
+    paths: List[str], workers: int = None, manifest_path: str = None
+) -> List[Dict[str, Any]]:
+    """Validate many episodes across a process pool, skipping unchanged files.
+
+    Files whose content hash matches the manifest reuse the recorded result
+    and are marked "cached". Results are returned in path order.
+    """
+    manifest = load_manifest(manifest_path)
+    results: Dict[str, Dict[str, Any]] = {}
+    todo = []
+    for path in expand_paths(paths):
+        previous = manifest.get(path)
+        if previous is not None and os.path.isfile(path):
+            start = time.perf_counter()
+            if hash_file(path) == previous.get("hash"):
+                results[path] = dict(
+                    previous, cached=True, seconds=time.perf_counter() - start
+                )
+                continue
+        todo.append(path)
+
+    if len(todo) > 1 and workers != 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for result in executor.map(validate_file, todo, chunksize=16):
+                results[result["path"]] = result
+    else:
+        for path in todo:
+            results[path] = validate_file(path)
+
+    ordered = [results[path] for path in sorted(results)]
+    if manifest_path:
+        save_manifest(manifest_path, ordered)
+    return ordered
+
+
+def build_report(results: List[Dict[str, Any]], seconds: float) -> Dict[str, Any]:
+    """Summarize results as a machine-readable report."""
+    return {
+        "total": len(results),
+        "valid": sum(1 for r in results if r["valid"]),
+        "invalid": sum(1 for r in results if not r["valid"]),
+        "cached": sum(1 for r in results if r.get("cached")),
+        "seconds": seconds,
+        "files": results,
+    }
 
 
 def main():
     parser = argparse.ArgumentParser(
         description="Validate LeetCode episode JSON files."
     )
-    parser.add_argument("file", help="Path to the JSON file to validate")
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        metavar="file",
+        help="Episode files, directories or glob patterns to validate",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Worker processes (default: cores)"
+    )
+    parser.add_argument(
+        "--manifest", help="Manifest of content hashes; unchanged files are skipped"
+    )
+    parser.add_argument("--report", help="Write a JSON report to this path")
+    parser.add_argument(
+        "--json", action="store_true", help="Print the JSON report to stdout"
+    )
     args = parser.parse_args()
 
-    try:
-        episode = load_episode_from_file(args.file)
-        print(f"✓ Valid episode: {episode['title']} ({episode['id']})")
-        return 0
-    except FileNotFoundError:
-        print(f"Error: File {args.file} not found.")
-        return 1
-    except json.JSONDecodeError as e:
-        print(f"Error: Invalid JSON in {args.file}: {e}")
-        return 1
-    except Exception as e:
-        print(f"Error: {e}")
-        return 1
+    start = time.perf_counter()
+    results = validate_paths(args.paths, args.workers, args.manifest)
+    report = build_report(results, time.perf_counter() - start)
+
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for result in results:
+            if result["valid"]:
+                print(f"✓ Valid episode: {result['title']} ({result['id']})")
+            else:
+                print(f"Error: {result['error']}")
+        if len(results) > 1:
+            print(
+                f"{report['valid']}/{report['total']} valid "
+                f"({report['cached']} unchanged) in {report['seconds']:.2f}s"
+            )
+
+    return 0 if results and report["invalid"] == 0 else 1
 
 
 if __name__ == "__main__":
@@ -0,0 +1,135 @@
+import time
+import asyncio
+from typing import Dict, Any, List, Iterable, AsyncIterator
+from .pseudo_leetcode import PseudoLeetCodeInterface
+
+
+class TokenBucket:
+    """Async token-bucket rate limiter: `rate` tokens per second, bursts up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: float = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Wait until `tokens` are available, then consume them."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+
+
+class BatchResult:
+    """Outcome of generating one problem in a batch."""
+
+    def __init__(
+        self,
+        slug: str,
+        script: Dict[str, Any] = None,
+        error: Exception = None,
+        attempts: int = 0,
+        elapsed: float = 0.0,
+    ):
+        self.slug = slug
+        self.script = script
+        self.error = error
+        self.attempts = attempts
+        self.elapsed = elapsed
+
+    @property
+    def ok(self) -> bool:
+        """Whether the problem was generated successfully."""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        status = "ok" if self.ok else f"error={self.error!r}"
+        return f"BatchResult({self.slug!r}, {status}, attempts={self.attempts})"
+
+
+async def generate_catalog(
+    interface: PseudoLeetCodeInterface,
+    slugs: Iterable[str],
+    concurrency: int = 4,
+    rate: float = None,
+    retries: int = 3,
+    backoff: float = 1.0,
+) -> AsyncIterator[BatchResult]:
+    """Fetch and generate UMPIRE scripts concurrently, yielding results as they finish.
+
+    At most `concurrency` problems are in flight at once; `rate` caps attempts
+    per second across all workers. Failed attempts are retried up to `retries`
+    times with exponential backoff, and a problem that still fails is yielded
+    with its error instead of aborting the batch.
+    """
+    bucket = TokenBucket(rate) if rate else None
+    pending: asyncio.Queue = asyncio.Queue()
+    results: asyncio.Queue = asyncio.Queue()
+    total = 0
+    for slug in slugs:
+        pending.put_nowait(slug)
+        total += 1
+
+    async def solve(slug: str) -> BatchResult:
+        start = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            if bucket is not None:
+                await bucket.acquire()
+            try:
+                script = await asyncio.to_thread(interface.solve_problem, slug)
+                return BatchResult(
+                    slug,
+                    script=script,
+                    attempts=attempt,
+                    elapsed=time.monotonic() - start,
+                )
+            except Exception as e:
+                if attempt > retries:
+                    return BatchResult(
+                        slug,
+                        error=e,
+                        attempts=attempt,
+                        elapsed=time.monotonic() - start,
+                    )
+                await asyncio.sleep(backoff * 2 ** (attempt - 1))
+
+    async def worker() -> None:
+        while True:
+            try:
+                slug = pending.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            await results.put(await solve(slug))
+
+    workers = [asyncio.create_task(worker()) for _ in range(max(1, concurrency))]
+    try:
+        for _ in range(total):
+            yield await results.get()
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+def run_batch(
+    interface: PseudoLeetCodeInterface, slugs: Iterable[str], **kwargs
+) -> List[BatchResult]:
+    """Synchronous wrapper around generate_catalog, in completion order."""
+
+    async def collect() -> List[BatchResult]:
+        return [result async for result in generate_catalog(interface, slugs, **kwargs)]
+
+    return asyncio.run(collect())
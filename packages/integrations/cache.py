@@ -0,0 +1,150 @@
+import os
+import json
+import time
+import hashlib
+import tempfile
+from typing import Dict, Any, Optional
+
+
+def default_cache_dir(name: str) -> str:
+    """Per-user directory for one of the pipeline's caches.
+
+    Rooted at $LC_EXPLAINER_CACHE_DIR when set, else ~/.cache/lc-explainer.
+    """
+    root = os.environ.get("LC_EXPLAINER_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "lc-explainer"
+    )
+    return os.path.join(root, name)
+
+
+def make_cache_key(*parts: Any) -> str:
+    """Build a content-addressed key from JSON-serializable parts."""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Persistent on-disk cache for LLM responses, keyed by content hash."""
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_entries: int = 10000,
+        max_age: float = None,
+    ):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.max_age = max_age  # Seconds; None keeps entries forever
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Tracked on writes so set() only scans the directory when it must
+        self._count = sum(1 for name in os.listdir(cache_dir) if name.endswith(".json"))
+        self._swept = time.time()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss."""
+        path = self._path(key)
+        try:
+            with open(path, "r") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        if self._expired(entry):
+            self._count -= self._remove(path)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry["value"]
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value atomically and evict old entries if over capacity.
+
+        Eviction trims a tenth below max_entries, and expired entries are
+        swept at most once per max_age, so the directory scan is amortized
+        over many writes.
+        """
+        entry = {"created": time.time(), "value": value}
+        path = self._path(key)
+        new = not os.path.exists(path)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+        self._count += new
+
+        over = self.max_entries is not None and self._count > self.max_entries
+        stale = self.max_age is not None and time.time() - self._swept > self.max_age
+        if over or stale:
+            self.evict(self.max_entries - self.max_entries // 10 if over else None)
+
+    def evict(self, target: int = None) -> int:
+        """Drop expired entries, then the oldest ones beyond max_entries.
+
+        With target, keeps at most that many entries instead.
+        """
+        self._swept = time.time()
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                entries.append((os.path.getmtime(path), path))
+            except OSError:
+                continue
+
+        removed = 0
+        if self.max_age is not None:
+            cutoff = time.time() - self.max_age
+            for mtime, path in entries:
+                if mtime < cutoff:
+                    removed += self._remove(path)
+            entries = [(m, p) for m, p in entries if m >= cutoff]
+
+        limit = self.max_entries if target is None else target
+        if limit is not None and len(entries) > limit:
+            entries.sort()
+            for _, path in entries[: len(entries) - limit]:
+                removed += self._remove(path)
+            entries = entries[len(entries) - limit :]
+        self._count = len(entries)
+        return removed
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".json"):
+                self._remove(os.path.join(self.cache_dir, name))
+        self._count = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters for this cache instance."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def _expired(self, entry: Dict[str, Any]) -> bool:
+        if self.max_age is None:
+            return False
+        return time.time() - entry.get("created", 0) > self.max_age
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _remove(self, path: str) -> int:
+        try:
+            os.remove(path)
+            return 1
+        except OSError:
+            return 0
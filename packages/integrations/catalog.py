@@ -0,0 +1,208 @@
+import os
+import gzip
+import json
+import hashlib
+import tempfile
+from typing import Dict, Any, List, Iterable, Set
+from .cache import default_cache_dir
+from .fetcher import ProblemFetcher
+
+
+def normalize_problem(data: Dict[str, Any], slug: str = None) -> Dict[str, Any]:
+    """Reduce an upstream problem payload to the fields the pipeline uses."""
+    tags = data.get("tags")
+    if tags is None:
+        tags = [t.get("slug") or t.get("name") for t in data.get("topicTags") or []]
+    return {
+        "titleSlug": data.get("titleSlug") or slug,
+        "title": data.get("title") or data.get("questionTitle"),
+        "difficulty": data.get("difficulty"),
+        "description": data.get("description")
+        or data.get("question")
+        or data.get("content"),
+        "examples": data.get("examples") or data.get("exampleTestcases") or [],
+        "tags": [t for t in tags if t],
+    }
+
+
+def _content_hash(data: Dict[str, Any]) -> str:
+    payload = json.dumps(data, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ProblemCatalog:
+    """Local mirror of problem metadata, indexed by slug, difficulty and tag.
+
+    The whole catalog lives in one gzip-compressed JSON file and is held in
+    memory once loaded, so lookups are plain dictionary accesses. Defaults
+    to catalog.json.gz in the per-user cache directory.
+    """
+
+    def __init__(self, path: str = None):
+        self.path = path or default_cache_dir("catalog.json.gz")
+        self._problems: Dict[str, Dict[str, Any]] = {}
+        self._hashes: Dict[str, str] = {}
+        self._listing_hashes: Dict[str, str] = {}
+        self._by_difficulty: Dict[str, Set[str]] = {}
+        self._by_tag: Dict[str, Set[str]] = {}
+        # Slug -> error message for problems the last sync failed to fetch
+        self.errors: Dict[str, str] = {}
+        if os.path.exists(self.path):
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._problems)
+
+    def __contains__(self, slug: str) -> bool:
+        return slug in self._problems
+
+    def get(self, slug: str) -> Dict[str, Any]:
+        """Return a problem by slug, or None if it is not mirrored."""
+        return self._problems.get(slug)
+
+    def slugs(self) -> List[str]:
+        """All mirrored slugs, sorted."""
+        return sorted(self._problems)
+
+    def find(self, difficulty: str = None, tag: str = None) -> List[Dict[str, Any]]:
+        """Return problems matching every given filter, sorted by slug."""
+        matches = None
+        if difficulty is not None:
+            matches = set(self._by_difficulty.get(difficulty, ()))
+        if tag is not None:
+            tagged = self._by_tag.get(tag, set())
+            matches = set(tagged) if matches is None else matches & tagged
+        if matches is None:
+            matches = self._problems.keys()
+        return [self._problems[slug] for slug in sorted(matches)]
+
+    def upsert(self, data: Dict[str, Any], slug: str = None) -> bool:
+        """Add or replace a problem; return True if anything changed."""
+        problem = normalize_problem(data, slug)
+        slug = problem["titleSlug"]
+        if not slug:
+            raise ValueError("Problem data has no slug")
+        digest = _content_hash(problem)
+        if self._hashes.get(slug) == digest:
+            return False
+        self._unindex(slug)
+        self._problems[slug] = problem
+        self._hashes[slug] = digest
+        self._index(slug)
+        return True
+
+    def sync(
+        self,
+        fetcher: ProblemFetcher,
+        slugs: Iterable[str] = None,
+        limit: int = 5000,
+        force: bool = False,
+        checkpoint: int = 1,
+    ) -> Dict[str, int]:
+        """Mirror problems from upstream, fetching details only when needed.
+
+        Without explicit slugs the upstream problem list is used: a listing
+        entry whose summary hash is unchanged is skipped, so only new or
+        changed problems pay for a detail request. Explicit slugs are fetched
+        only if missing, unless force=True.
+
+        A problem that fails to fetch is counted, recorded in `errors` and
+        retried by the next sync; the rest carry on. The catalog is saved
+        after every `checkpoint` fetched problems and at the end, so an
+        interrupted sync keeps what it already mirrored.
+        """
+        stats = {"added": 0, "updated": 0, "unchanged": 0, "failed": 0}
+        self.errors = {}
+        unsaved = 0
+        if slugs is not None:
+            listing = [{"titleSlug": slug} for slug in slugs]
+        else:
+            listing = self._fetch_listing(fetcher, limit)
+
+        for summary in listing:
+            slug = summary["titleSlug"]
+            summary_hash = _content_hash(summary)
+            known = slug in self._problems
+            if known and not force and self._listing_hashes.get(slug) == summary_hash:
+                stats["unchanged"] += 1
+                continue
+            try:
+                detail = dict(summary, **fetcher.fetch(slug, force=True))
+                changed = self.upsert(detail, slug)
+            except Exception as e:
+                stats["failed"] += 1
+                self.errors[slug] = f"{type(e).__name__}: {e}"
+                continue
+            self._listing_hashes[slug] = summary_hash
+            if not known:
+                stats["added"] += 1
+            elif changed:
+                stats["updated"] += 1
+            else:
+                stats["unchanged"] += 1
+            unsaved += 1
+            if unsaved >= checkpoint:
+                self.save()
+                unsaved = 0
+
+        if unsaved or not os.path.exists(self.path):
+            self.save()
+        return stats
+
+    def save(self) -> None:
+        """Atomically write the catalog to disk."""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.open(
+                raw, "wt", encoding="utf-8"
+            ) as f:
+                json.dump(
+                    {
+                        "version": 1,
+                        "problems": self._problems,
+                        "listing": self._listing_hashes,
+                    },
+                    f,
+                )
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _load(self) -> None:
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            stored = json.load(f)
+        for slug, problem in stored.get("problems", {}).items():
+            self._problems[slug] = problem
+            self._hashes[slug] = _content_hash(problem)
+            self._index(slug)
+        self._listing_hashes = stored.get("listing", {})
+
+    def _fetch_listing(
+        self, fetcher: ProblemFetcher, limit: int
+    ) -> List[Dict[str, Any]]:
+        url = f"{fetcher.api_base}/problems"
+        response = fetcher.session.get(
+            url, params={"limit": limit}, timeout=fetcher.timeout
+        )
+        response.raise_for_status()
+        payload = response.json()
+        return payload.get("problemsetQuestionList", payload.get("problems", []))
+
+    def _index(self, slug: str) -> None:
+        problem = self._problems[slug]
+        if problem.get("difficulty"):
+            self._by_difficulty.setdefault(problem["difficulty"], set()).add(slug)
+        for tag in problem.get("tags", []):
+            self._by_tag.setdefault(tag, set()).add(slug)
+
+    def _unindex(self, slug: str) -> None:
+        problem = self._problems.get(slug)
+        if problem is None:
+            return
+        self._by_difficulty.get(problem.get("difficulty"), set()).discard(slug)
+        for tag in problem.get("tags", []):
+            self._by_tag.get(tag, set()).discard(slug)
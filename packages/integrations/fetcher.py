@@ -0,0 +1,175 @@
+import os
+import re
+import gzip
+import json
+import time
+import tempfile
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, Optional
+from .cache import default_cache_dir
+
+# LeetCode title slugs; anything else could escape the store directory
+_SLUG_PATTERN = re.compile(r"[a-z0-9-]+")
+
+
+def validate_slug(slug: str) -> str:
+    """Return slug unchanged, or raise ValueError if it is not a title slug."""
+    if not isinstance(slug, str) or not _SLUG_PATTERN.fullmatch(slug):
+        raise ValueError(f"Invalid problem slug: {slug!r}")
+    return slug
+
+
+class ProblemStore:
+    """Local gzip-compressed store of fetched problems with a freshness TTL.
+
+    Defaults to the per-user "problems" cache directory.
+    """
+
+    def __init__(self, store_dir: str = None, ttl: float = 24 * 3600):
+        self.store_dir = store_dir or default_cache_dir("problems")
+        self.ttl = ttl  # Seconds before an entry is revalidated upstream
+        self._memory: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        os.makedirs(self.store_dir, exist_ok=True)
+
+    def get(self, slug: str) -> Optional[Dict[str, Any]]:
+        """Return the stored entry (data, etag, last_modified, fetched_at) or None."""
+        with self._lock:
+            if slug in self._memory:
+                return self._memory[slug]
+        try:
+            with gzip.open(self._path(slug), "rt", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        with self._lock:
+            self._memory[slug] = entry
+        return entry
+
+    def put(
+        self,
+        slug: str,
+        data: Dict[str, Any],
+        etag: str = None,
+        last_modified: str = None,
+    ) -> Dict[str, Any]:
+        """Store problem data with its validators, stamped with the fetch time."""
+        entry = {
+            "data": data,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": time.time(),
+        }
+        self._write(slug, entry)
+        return entry
+
+    def touch(self, slug: str) -> None:
+        """Mark an entry as freshly validated (e.g. after a 304 response)."""
+        entry = self.get(slug)
+        if entry is not None:
+            self._write(slug, dict(entry, fetched_at=time.time()))
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """Whether an entry is younger than the TTL."""
+        return time.time() - entry.get("fetched_at", 0) < self.ttl
+
+    def _write(self, slug: str, entry: Dict[str, Any]) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.store_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.open(
+                raw, "wt", encoding="utf-8"
+            ) as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self._path(slug))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        with self._lock:
+            self._memory[slug] = entry
+
+    def _path(self, slug: str) -> str:
+        return os.path.join(self.store_dir, f"{validate_slug(slug)}.json.gz")
+
+
+class ProblemFetcher:
+    """Fetch problems over a pooled session with retries, revalidation and a local store."""
+
+    def __init__(
+        self,
+        api_base: str = "https://alfa-leetcode-api.onrender.com",
+        store: ProblemStore = None,
+        timeout: float = 10.0,
+        retries: int = 3,
+        backoff: float = 0.5,
+        pool_size: int = 10,
+        offline: bool = False,
+    ):
+        self.api_base = api_base
+        self.store = store
+        self.timeout = timeout
+        self.offline = offline
+        if offline and store is None:
+            raise ValueError("offline mode requires a ProblemStore")
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(
+                total=retries,
+                backoff_factor=backoff,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=("GET",),
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def fetch(self, slug: str, force: bool = False) -> Dict[str, Any]:
+        """Return problem data, from the store when fresh, else from upstream.
+
+        Stale entries are revalidated with If-None-Match / If-Modified-Since
+        so an unchanged problem costs a 304 instead of a full download. In
+        offline mode only the store is consulted.
+        """
+        validate_slug(slug)
+        entry = self.store.get(slug) if self.store is not None else None
+        if self.offline:
+            if entry is None:
+                raise LookupError(f"Problem {slug} is not in the local store")
+            return entry["data"]
+        if entry is not None and not force and self.store.is_fresh(entry):
+            return entry["data"]
+
+        headers = {}
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        url = f"{self.api_base}/problems/{slug}"
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+        if response.status_code == 304 and entry is not None:
+            self.store.touch(slug)
+            return entry["data"]
+        response.raise_for_status()
+
+        data = response.json()
+        if self.store is not None:
+            self.store.put(
+                slug,
+                data,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+        return data
+
+    def close(self) -> None:
+        """Release pooled connections."""
+        self.session.close()
@@ -1,43 +1,132 @@
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 from google import genai
 from google.genai import types
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Iterator
+from .cache import ResponseCache, make_cache_key
+from .streaming import UmpireStepParser
+from .uploads import UploadRegistry
+
+UMPIRE_SYSTEM_INSTRUCTION = "You are an expert LeetCode tutor. Use UMPIRE method: Understand, Match, Plan, Implement, Review, Evaluate. Output structured JSON with steps, code, and narration."
 
 
 class GeminiClient:
     """Client for Google Gemini API for content generation and analysis."""
 
-    def __init__(self, api_key: str = None, model: str = "gemini-1.5-flash"):
+    def __init__(
+        self,
+        api_key: str = None,
+        model: str = "gemini-1.5-flash",
+        cache: ResponseCache = None,
+        client: Any = None,
+        uploads: UploadRegistry = None,
+    ):
         self.api_key = api_key or os.environ.get("GEMINI_API_KEY")
-        if not self.api_key:
+        if client is not None:
+            # Injected clients (e.g. replay stand-ins) need no credentials
+            self.client = client
+        elif not self.api_key:
             raise ValueError(
                 "GEMINI_API_KEY environment variable or api_key parameter required"
             )
-        self.client = genai.Client(api_key=self.api_key)
+        else:
+            self.client = genai.Client(api_key=self.api_key)
         self.model = model
+        self.cache = cache
+        self.uploads = uploads or UploadRegistry()
+
+    def generate_umpire_script(
+        self, problem_data: Dict[str, Any], refresh: bool = False
+    ) -> Dict[str, Any]:
+        """Generate UMPIRE-structured script for a LeetCode problem.
 
-    def generate_umpire_script(self, problem_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate UMPIRE-structured script for a LeetCode problem."""
+        When a cache is configured, identical (model, system instruction,
+        prompt) requests are served from disk. Pass refresh=True to bypass
+        the cached entry and overwrite it with a fresh response.
+        """
         prompt = self._build_umpire_prompt(problem_data)
+        key = self._umpire_cache_key(prompt)
+        if self.cache is not None and not refresh:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
         response = self.client.models.generate_content(
             model=self.model,
             contents=[prompt],
             config=types.GenerateContentConfig(
                 response_mime_type="application/json",
-                system_instruction="You are an expert LeetCode tutor. Use UMPIRE method: Understand, Match, Plan, Implement, Review, Evaluate. Output structured JSON with steps, code, and narration.",
+                system_instruction=UMPIRE_SYSTEM_INSTRUCTION,
             ),
         )
-        return json.loads(response.text)
+        script = json.loads(response.text)
+        if self.cache is not None:
+            self.cache.set(key, script)
+        return script
+
+    def stream_umpire_steps(
+        self, problem_data: Dict[str, Any], refresh: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream UMPIRE steps, yielding each phase as soon as it is complete.
+
+        Uses the same prompt and cache as generate_umpire_script. The full
+        script is stored in the cache once the stream ends and is also the
+        generator's return value, so `script = yield from ...` works.
+        """
+        prompt = self._build_umpire_prompt(problem_data)
+        key = self._umpire_cache_key(prompt)
+        if self.cache is not None and not refresh:
+            cached = self.cache.get(key)
+            if cached is not None:
+                yield from cached.get("umpireSteps", [])
+                return cached
+
+        parser = UmpireStepParser()
+        stream = self.client.models.generate_content_stream(
+            model=self.model,
+            contents=[prompt],
+            config=types.GenerateContentConfig(
+                response_mime_type="application/json",
+                system_instruction=UMPIRE_SYSTEM_INSTRUCTION,
+            ),
+        )
+        for chunk in stream:
+            if chunk.text:
+                yield from parser.feed(chunk.text)
+
+        script = parser.result()
+        if self.cache is not None:
+            self.cache.set(key, script)
+        return script
 
     def analyze_video(self, video_path: str, prompt: str) -> str:
         """Analyze a video using Gemini's video understanding."""
-        video_file = self.client.files.upload(file=video_path)
+        video_file = self.uploads.get_or_upload(self.client, video_path)
         response = self.client.models.generate_content(
             model=self.model, contents=[video_file, prompt]
         )
         return response.text
 
+    def analyze_video_many(
+        self, video_path: str, prompts: List[str], max_workers: int = 4
+    ) -> List[str]:
+        """Run several analysis prompts concurrently against one upload."""
+        video_file = self.uploads.get_or_upload(self.client, video_path)
+
+        def analyze(prompt: str) -> str:
+            response = self.client.models.generate_content(
+                model=self.model, contents=[video_file, prompt]
+            )
+            return response.text
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(analyze, prompts))
+
+    def _umpire_cache_key(self, prompt: str) -> str:
+        """Content-addressed cache key for an UMPIRE request."""
+        return make_cache_key(self.model, UMPIRE_SYSTEM_INSTRUCTION, prompt)
+
     def _build_umpire_prompt(self, problem_data: Dict[str, Any]) -> str:
         """Build prompt for UMPIRE script generation."""
         title = problem_data.get("title", "Unknown Problem")
@@ -57,6 +146,7 @@ Examples:
 Output JSON:
 {{
   "objectives": ["learning goal 1", "learning goal 2"],
+  "recognitionCues": ["cue that signals the pattern 1", "cue 2"],
   "umpireSteps": [
     {{
       "phase": "Understand",
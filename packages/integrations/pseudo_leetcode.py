@@ -1,47 +1,149 @@
-import requests
 import json
+import threading
+from collections import OrderedDict
 from typing import Dict, Any, List
 from google import genai
 from google.genai import types
 from .gemini import GeminiClient
+from .fetcher import ProblemFetcher, ProblemStore
+from .catalog import ProblemCatalog
+
+
+class UmpireSession:
+    """Generate one UMPIRE script per problem and serve every artifact from it."""
+
+    def __init__(self, gemini_client: GeminiClient, problem_data: Dict[str, Any]):
+        self.gemini = gemini_client
+        self.problem_data = problem_data
+        self._script = None
+        self._refresh = False
+
+    @property
+    def script(self) -> Dict[str, Any]:
+        """The UMPIRE script, generated on first access."""
+        if self._script is None:
+            self._script = self.gemini.generate_umpire_script(
+                self.problem_data, refresh=self._refresh
+            )
+            self._refresh = False
+        return self._script
+
+    def invalidate(self) -> None:
+        """Drop the script so the next access regenerates it, bypassing caches."""
+        self._script = None
+        self._refresh = True
+
+    def code_snippet(self, language: str = "python") -> str:
+        """Code from the Implement step."""
+        implement_step = next(
+            (
+                step
+                for step in self.script.get("umpireSteps", [])
+                if step.get("phase") == "Implement"
+            ),
+            None,
+        )
+        return implement_step["code"] if implement_step else ""
+
+    def recognition_cues(self) -> List[str]:
+        """Pattern recognition cues."""
+        return self.script.get("recognitionCues", [])
+
+    def objectives(self) -> List[str]:
+        """Learning objectives."""
+        return self.script.get("objectives", [])
+
+    def storyboard(self) -> List[Dict[str, Any]]:
+        """Storyboard beats for the episode."""
+        return self.script.get("storyboard", [])
+
+    def quizzes(self) -> List[Dict[str, Any]]:
+        """Quiz questions for the episode."""
+        return self.script.get("quizzes", [])
 
 
 class PseudoLeetCodeInterface:
-    """Simulate LeetCode interface for LLM-driven problem solving."""
+    """Simulate LeetCode interface for LLM-driven problem solving.
+
+    UMPIRE sessions are kept for the `max_sessions` most recently used
+    problems, so long batch runs hold a bounded number of scripts. Call
+    close() when done to release the fetcher's pooled connections.
+    """
 
     def __init__(
         self,
         gemini_client: GeminiClient,
         api_base: str = "https://alfa-leetcode-api.onrender.com",
+        fetcher: ProblemFetcher = None,
+        catalog: ProblemCatalog = None,
+        max_sessions: int = 128,
     ):
         self.gemini = gemini_client
         self.api_base = api_base
+        # By default fetches go through the per-user store, with ETag revalidation
+        self.fetcher = fetcher or ProblemFetcher(api_base, store=ProblemStore())
+        # Problems are read from the local mirror first when it has them
+        self.catalog = catalog if catalog is not None else ProblemCatalog()
+        self.max_sessions = max_sessions
+        self._sessions: "OrderedDict[str, UmpireSession]" = OrderedDict()
+        # Batch runs call in from worker threads
+        self._lock = threading.Lock()
 
     def fetch_problem(self, slug: str) -> Dict[str, Any]:
-        """Fetch problem data from unofficial LeetCode API."""
-        url = f"{self.api_base}/problems/{slug}"
-        response = requests.get(url)
-        response.raise_for_status()
-        return response.json()
+        """Fetch problem data, preferring the local catalog mirror."""
+        problem = self.catalog.get(slug)
+        if problem is not None:
+            return problem
+        return self.fetcher.fetch(slug)
 
     def solve_problem(self, slug: str) -> Dict[str, Any]:
         """Fetch problem and generate UMPIRE script using Gemini."""
         problem_data = self.fetch_problem(slug)
-        return self.gemini.generate_umpire_script(problem_data)
+        return self.session(problem_data).script
+
+    def session(self, problem_data: Dict[str, Any]) -> UmpireSession:
+        """Return the shared UMPIRE session for a problem, creating it once."""
+        key = self._session_key(problem_data)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None or session.problem_data != problem_data:
+                session = UmpireSession(self.gemini, problem_data)
+                self._sessions[key] = session
+            self._sessions.move_to_end(key)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        return session
+
+    def invalidate(self, problem_data: Dict[str, Any] = None) -> None:
+        """Invalidate one problem's session, or every session if none is given."""
+        with self._lock:
+            if problem_data is None:
+                sessions = list(self._sessions.values())
+            else:
+                session = self._sessions.get(self._session_key(problem_data))
+                sessions = [session] if session is not None else []
+        for session in sessions:
+            session.invalidate()
+
+    def close(self) -> None:
+        """Drop every session and release the fetcher's pooled connections."""
+        with self._lock:
+            self._sessions.clear()
+        self.fetcher.close()
 
     def generate_code_snippet(
         self, problem_data: Dict[str, Any], language: str = "python"
     ) -> str:
         """Generate code snippet from UMPIRE script."""
-        script = self.gemini.generate_umpire_script(problem_data)
-        implement_step = next(
-            (step for step in script["umpireSteps"] if step["phase"] == "Implement"),
-            None,
-        )
-        return implement_step["code"] if implement_step else ""
+        return self.session(problem_data).code_snippet(language)
 
     def suggest_recognition_cues(self, problem_data: Dict[str, Any]) -> List[str]:
         """Suggest recognition cues based on problem patterns."""
+        cues = self.session(problem_data).recognition_cues()
+        if cues:
+            return cues
+
+        # Scripts generated before cues were part of the UMPIRE output
         prompt = f"Based on this problem: {problem_data.get('title', '')}. Suggest recognition cues for patterns."
         response = self.gemini.client.models.generate_content(
             model=self.gemini.model,
@@ -52,3 +154,10 @@ class PseudoLeetCodeInterface:
             ),
         )
         return json.loads(response.text)
+
+    def _session_key(self, problem_data: Dict[str, Any]) -> str:
+        """Identify a problem by slug when available, else by its full content."""
+        for field in ("titleSlug", "slug", "leetcodeSlug"):
+            if problem_data.get(field):
+                return problem_data[field]
+        return json.dumps(problem_data, sort_keys=True, default=str)
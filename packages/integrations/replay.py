@@ -0,0 +1,267 @@
+import os
+import json
+import time
+import random
+import tempfile
+from typing import Dict, Any, List, Iterable, Iterator
+from .cache import make_cache_key
+from .batch import run_batch
+from .fetcher import ProblemFetcher, ProblemStore
+from .gemini import GeminiClient
+from .pseudo_leetcode import PseudoLeetCodeInterface
+
+
+def request_key(kind: str, model: str, contents: List[Any], config: Any = None) -> str:
+    """Identify a Gemini request by its model, contents and instructions."""
+    parts = [c if isinstance(c, str) else getattr(c, "name", repr(c)) for c in contents]
+    return make_cache_key(
+        kind,
+        model,
+        parts,
+        getattr(config, "system_instruction", None),
+        getattr(config, "response_mime_type", None),
+    )
+
+
+class LatencyModel:
+    """Seeded latency distribution for replayed responses.
+
+    Total latency is log-normal around `median` seconds; streamed responses
+    spend `first_chunk` of it before the first chunk and spread the rest
+    evenly across the remaining chunks.
+    """
+
+    def __init__(
+        self,
+        median: float = 1.0,
+        sigma: float = 0.5,
+        first_chunk: float = 0.3,
+        seed: int = None,
+    ):
+        self.median = median
+        self.sigma = sigma
+        self.first_chunk = first_chunk
+        self._random = random.Random(seed)
+
+    def sample(self) -> float:
+        """Draw one end-to-end latency in seconds."""
+        if self.median <= 0:
+            return 0.0
+        return self.median * self._random.lognormvariate(0.0, self.sigma)
+
+    def chunk_delays(self, count: int) -> List[float]:
+        """Delays to sleep before each of `count` streamed chunks."""
+        if count == 0:
+            return []
+        total = self.sample()
+        first = total * self.first_chunk
+        rest = (total - first) / (count - 1) if count > 1 else 0.0
+        return [first] + [rest] * (count - 1)
+
+
+class Cassette:
+    """Directory of recorded Gemini responses, one JSON file per request."""
+
+    def __init__(self, cassette_dir: str):
+        self.cassette_dir = cassette_dir
+        os.makedirs(cassette_dir, exist_ok=True)
+
+    def load(self, key: str) -> Dict[str, Any]:
+        """Return the recording for key; raise LookupError if none exists."""
+        try:
+            with open(self._path(key), "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            raise LookupError(f"No recorded response for request {key}")
+
+    def save(self, key: str, recording: Dict[str, Any]) -> None:
+        """Atomically write a recording."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.cassette_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(recording, f)
+        os.replace(tmp_path, self._path(key))
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cassette_dir, f"{key}.json")
+
+
+class ReplayResponse:
+    """Minimal stand-in for a Gemini response or stream chunk."""
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+class _RecordingModels:
+    def __init__(self, models: Any, cassette: Cassette):
+        self._models = models
+        self._cassette = cassette
+
+    def generate_content(self, model: str, contents: List[Any], config: Any = None):
+        start = time.monotonic()
+        response = self._models.generate_content(
+            model=model, contents=contents, config=config
+        )
+        self._cassette.save(
+            request_key("generate", model, contents, config),
+            {"text": response.text, "latency": time.monotonic() - start},
+        )
+        return response
+
+    def generate_content_stream(
+        self, model: str, contents: List[Any], config: Any = None
+    ) -> Iterator[Any]:
+        start = time.monotonic()
+        chunks, offsets = [], []
+        for chunk in self._models.generate_content_stream(
+            model=model, contents=contents, config=config
+        ):
+            chunks.append(chunk.text or "")
+            offsets.append(time.monotonic() - start)
+            yield chunk
+        self._cassette.save(
+            request_key("stream", model, contents, config),
+            {"text": "".join(chunks), "chunks": chunks, "offsets": offsets},
+        )
+
+
+class RecordingClient:
+    """Wrap a real genai.Client and save every model response to a cassette."""
+
+    def __init__(self, client: Any, cassette_dir: str):
+        self.cassette = Cassette(cassette_dir)
+        self.models = _RecordingModels(client.models, self.cassette)
+        self.files = client.files
+
+
+class _ReplayModels:
+    def __init__(self, client: "ReplayClient"):
+        self._client = client
+
+    def generate_content(self, model: str, contents: List[Any], config: Any = None):
+        recording = self._client.cassette.load(
+            request_key("generate", model, contents, config)
+        )
+        time.sleep(self._client.delay(recording.get("latency", 0.0)))
+        return ReplayResponse(recording["text"])
+
+    def generate_content_stream(
+        self, model: str, contents: List[Any], config: Any = None
+    ) -> Iterator[ReplayResponse]:
+        key = request_key("stream", model, contents, config)
+        try:
+            recording = self._client.cassette.load(key)
+            chunks = recording["chunks"]
+            offsets = recording.get("offsets", [0.0] * len(chunks))
+        except LookupError:
+            # Fall back to a non-streamed recording, split into even chunks
+            text = self._client.cassette.load(
+                request_key("generate", model, contents, config)
+            )["text"]
+            size = self._client.chunk_size
+            chunks = [text[i : i + size] for i in range(0, len(text), size)]
+            offsets = None
+        for chunk, delay in zip(chunks, self._client.chunk_delays(chunks, offsets)):
+            time.sleep(delay)
+            yield ReplayResponse(chunk)
+
+
+class ReplayFile:
+    """Stand-in for an uploaded file handle."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+
+class _ReplayFiles:
+    def upload(self, file: str) -> ReplayFile:
+        return ReplayFile(f"files/{os.path.basename(str(file))}")
+
+
+class ReplayClient:
+    """Drop-in genai.Client replacement that serves recorded responses.
+
+    With a LatencyModel, delays are sampled from it; otherwise the recorded
+    latencies and chunk timings are reproduced. Pass a LatencyModel with
+    median=0 to replay as fast as possible.
+    """
+
+    def __init__(
+        self,
+        cassette_dir: str,
+        latency: LatencyModel = None,
+        chunk_size: int = 64,
+    ):
+        self.cassette = Cassette(cassette_dir)
+        self.latency = latency
+        self.chunk_size = chunk_size
+        self.models = _ReplayModels(self)
+        self.files = _ReplayFiles()
+
+    def delay(self, recorded: float) -> float:
+        """Latency to simulate for a non-streamed response."""
+        return self.latency.sample() if self.latency else recorded
+
+    def chunk_delays(
+        self, chunks: List[str], offsets: List[float] = None
+    ) -> List[float]:
+        """Per-chunk sleeps, sampled or reconstructed from recorded offsets."""
+        if self.latency is not None or offsets is None:
+            model = self.latency or LatencyModel(median=0.0)
+            return model.chunk_delays(len(chunks))
+        return [b - a for a, b in zip([0.0] + offsets[:-1], offsets)]
+
+
+def recording_interface(
+    cassette_dir: str, api_key: str = None, **interface_kwargs
+) -> PseudoLeetCodeInterface:
+    """Interface that records Gemini responses and fetched problems to cassette_dir."""
+    gemini = GeminiClient(api_key=api_key)
+    gemini.client = RecordingClient(gemini.client, cassette_dir)
+    fetcher = ProblemFetcher(
+        interface_kwargs.pop("api_base", "https://alfa-leetcode-api.onrender.com"),
+        store=ProblemStore(os.path.join(cassette_dir, "problems")),
+    )
+    return PseudoLeetCodeInterface(gemini, fetcher=fetcher, **interface_kwargs)
+
+
+def replay_interface(
+    cassette_dir: str,
+    latency: LatencyModel = None,
+    model: str = "gemini-1.5-flash",
+    **interface_kwargs,
+) -> PseudoLeetCodeInterface:
+    """Fully offline interface replaying a cassette written by recording_interface."""
+    gemini = GeminiClient(model=model, client=ReplayClient(cassette_dir, latency))
+    fetcher = ProblemFetcher(
+        store=ProblemStore(os.path.join(cassette_dir, "problems")), offline=True
+    )
+    return PseudoLeetCodeInterface(gemini, fetcher=fetcher, **interface_kwargs)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of numbers."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+def benchmark_pipeline(
+    interface: PseudoLeetCodeInterface, slugs: Iterable[str], **batch_kwargs
+) -> Dict[str, Any]:
+    """Run a batch over slugs and report throughput and latency percentiles."""
+    start = time.monotonic()
+    results = run_batch(interface, slugs, **batch_kwargs)
+    wall = time.monotonic() - start
+    latencies = [r.elapsed for r in results if r.ok]
+    return {
+        "problems": len(results),
+        "errors": sum(1 for r in results if not r.ok),
+        "wall_seconds": wall,
+        "throughput": len(latencies) / wall if wall else 0.0,
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+    }
@@ -0,0 +1,102 @@
+import json
+from typing import Dict, Any, List
+
+
+class UmpireStepParser:
+    """Incrementally parse a streamed UMPIRE JSON document.
+
+    Text is fed in arbitrary chunks; each call to feed() returns the
+    `umpireSteps` entries whose closing brace arrived in that chunk. Every
+    character is scanned once and only the unconsumed tail (an open step or
+    top-level string) is kept in the scan buffer, so parsing cost stays
+    linear in the response.
+    """
+
+    def __init__(self, array_key: str = "umpireSteps"):
+        self.array_key = array_key
+        self._chunks: List[str] = []
+        self._text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start = None
+        self._last_key = None
+        self._last_string = None
+        self._array_depth = None
+        self._array_done = False
+        self._item_start = None
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """Consume a chunk of text and return any newly completed steps."""
+        self._chunks.append(chunk)
+        self._text += chunk
+        completed = []
+        text = self._text
+        for i in range(self._pos, len(text)):
+            char = text[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._last_string = text[self._string_start : i + 1]
+                continue
+
+            if char == '"':
+                self._in_string = True
+                self._string_start = i
+            elif char == ":" and self._depth == 1 and self._last_string is not None:
+                self._last_key = json.loads(self._last_string)
+                self._last_string = None
+            elif char in "{[":
+                self._depth += 1
+                if (
+                    char == "["
+                    and self._depth == 2
+                    and self._last_key == self.array_key
+                    and not self._array_done
+                ):
+                    self._array_depth = self._depth
+                elif (
+                    char == "{"
+                    and self._array_depth is not None
+                    and not self._array_done
+                    and self._depth == self._array_depth + 1
+                ):
+                    self._item_start = i
+            elif char in "}]":
+                if (
+                    char == "}"
+                    and self._item_start is not None
+                    and self._depth == self._array_depth + 1
+                ):
+                    completed.append(json.loads(text[self._item_start : i + 1]))
+                    self._item_start = None
+                elif char == "]" and self._depth == self._array_depth:
+                    self._array_done = True
+                self._depth -= 1
+        self._trim()
+        return completed
+
+    def _trim(self) -> None:
+        # Drop everything before the earliest position still needed
+        needed = [len(self._text)]
+        if self._item_start is not None:
+            needed.append(self._item_start)
+        if self._in_string and self._depth == 1:
+            needed.append(self._string_start)
+        cut = min(needed)
+        self._text = self._text[cut:]
+        if self._item_start is not None:
+            self._item_start -= cut
+        if self._string_start is not None:
+            self._string_start -= cut
+        self._pos = len(self._text)
+
+    def result(self) -> Dict[str, Any]:
+        """Parse the complete document once the stream has ended."""
+        return json.loads("".join(self._chunks))
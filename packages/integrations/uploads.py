@@ -0,0 +1,102 @@
+import os
+import json
+import time
+import hashlib
+import tempfile
+import threading
+from datetime import datetime
+from typing import Dict, Any
+
+
+def file_digest(path: str, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 of a file's contents, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class UploadRegistry:
+    """Reuse Gemini file uploads for identical content until they expire.
+
+    Handles are keyed by the SHA-256 of the file, so re-rendered episodes
+    with identical bytes share one upload. Concurrent callers for the same
+    content wait on a single upload. With a registry_path, handle names and
+    expiry times persist across processes and are re-fetched with
+    client.files.get instead of re-uploading.
+    """
+
+    # The Files API keeps uploads for 48 hours
+    DEFAULT_TTL = 48 * 3600
+
+    def __init__(self, registry_path: str = None, safety_margin: float = 600.0):
+        self.registry_path = registry_path
+        self.safety_margin = safety_margin
+        self.uploads = 0
+        self.reuses = 0
+        self._handles: Dict[str, Any] = {}
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        if registry_path and os.path.exists(registry_path):
+            with open(registry_path, "r") as f:
+                self._entries = json.load(f)
+
+    def get_or_upload(self, client: Any, path: str) -> Any:
+        """Return a valid remote handle for path, uploading only if needed."""
+        digest = file_digest(path)
+        with self._lock:
+            lock = self._locks.setdefault(digest, threading.Lock())
+
+        with lock:
+            entry = self._entries.get(digest)
+            if entry is not None and self._valid(entry):
+                handle = self._handles.get(digest)
+                if handle is None:
+                    try:
+                        handle = client.files.get(name=entry["name"])
+                    except Exception:
+                        handle = None
+                if handle is not None:
+                    self._handles[digest] = handle
+                    self.reuses += 1
+                    return handle
+
+            handle = client.files.upload(file=path)
+            self.uploads += 1
+            self._handles[digest] = handle
+            self._entries[digest] = {
+                "name": getattr(handle, "name", None),
+                "expires_at": self._expiry(handle),
+            }
+            self._save()
+            return handle
+
+    def forget(self, path: str) -> None:
+        """Drop the handle for a file's current contents."""
+        digest = file_digest(path)
+        with self._lock:
+            self._handles.pop(digest, None)
+            self._entries.pop(digest, None)
+        self._save()
+
+    def _valid(self, entry: Dict[str, Any]) -> bool:
+        return entry["expires_at"] - self.safety_margin > time.time()
+
+    def _expiry(self, handle: Any) -> float:
+        expiration = getattr(handle, "expiration_time", None)
+        if isinstance(expiration, datetime):
+            return expiration.timestamp()
+        return time.time() + self.DEFAULT_TTL
+
+    def _save(self) -> None:
+        if not self.registry_path:
+            return
+        directory = os.path.dirname(os.path.abspath(self.registry_path))
+        with self._lock:
+            snapshot = dict(self._entries)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(snapshot, f)
+        os.replace(tmp_path, self.registry_path)
@@ -0,0 +1,9 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path_factory, monkeypatch):
+    """Keep default per-user caches out of the real home directory."""
+    cache_dir = tmp_path_factory.mktemp("user-cache")
+    monkeypatch.setenv("LC_EXPLAINER_CACHE_DIR", str(cache_dir))
+    return cache_dir
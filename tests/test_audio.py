@@ -0,0 +1,119 @@
+import io
+import struct
+import subprocess
+import wave
+import imageio_ffmpeg
+import numpy as np
+import pytest
+from unittest.mock import patch
+from packages.animations.audio import PCMBuffer, concatenate, decode_wav, mix
+from packages.animations.tts import TTSGenerator
+from packages.animations.video_renderer import audio_clip
+
+
+def _wav(samples, sample_rate=16000, channels=1):
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as w:
+        w.setnchannels(channels)
+        w.setsampwidth(2)
+        w.setframerate(sample_rate)
+        w.writeframes(np.asarray(samples, dtype="<i2").tobytes())
+    return buffer.getvalue()
+
+
+def test_decode_wav_exact_duration():
+    """Test WAV bytes decode to float samples with an exact duration."""
+    pcm = decode_wav(_wav([0, 16384, -32768, 32767] * 4000, channels=2))
+    assert pcm.sample_rate == 16000
+    assert pcm.channels == 2
+    assert pcm.frames == 8000
+    assert pcm.duration == 0.5
+    assert pcm.samples.dtype == np.float32
+    assert pcm.samples[0].tolist() == [0.0, 0.5]
+    assert pcm.samples[1, 0] == -1.0
+
+
+def test_to_wav_round_trip():
+    """Test encoding and decoding preserves samples within 16-bit precision."""
+    pcm = PCMBuffer(np.linspace(-1, 1, 1000, dtype=np.float32), 8000)
+    decoded = decode_wav(pcm.to_wav())
+    assert decoded.frames == 1000
+    assert np.allclose(decoded.samples, pcm.samples, atol=1e-4)
+
+
+def test_concatenate_with_gap_and_mixed_formats():
+    """Test segments of different rates and channels join into one buffer."""
+    a = PCMBuffer(np.full(100, 0.5, dtype=np.float32), 100)
+    b = PCMBuffer(np.full((50, 2), -0.5, dtype=np.float32), 200)
+    out = concatenate([a, b], gap=0.5)
+    assert (out.sample_rate, out.channels) == (200, 2)
+    assert out.duration == pytest.approx(a.duration + 0.5 + b.duration)
+    assert np.all(out.samples[:200] == 0.5)
+    assert np.all(out.samples[200:300] == 0.0)
+    assert np.all(out.samples[300:] == -0.5)
+
+
+def test_mix_overlays_and_clips():
+    """Test tracks are summed at their offsets and clipped."""
+    voice = PCMBuffer(np.full(100, 0.75, dtype=np.float32), 100)
+    music = PCMBuffer(np.full(100, 0.5, dtype=np.float32), 100)
+    out = mix([(voice, 0.0), (music, 0.5)])
+    assert out.frames == 150
+    assert out.samples[0, 0] == 0.75
+    assert out.samples[60, 0] == 1.0
+    assert out.samples[120, 0] == 0.5
+
+
+def test_tts_returns_pcm_and_feeds_audio_clip():
+    """Test TTS can return decoded PCM that MoviePy consumes directly."""
+    wav = _wav([1000] * 1600)
+    with patch.object(TTSGenerator, "_generate_fallback_audio", return_value=wav):
+        tts = TTSGenerator()
+        pcm = tts.generate_audio("Hello", pcm=True)
+        segments = tts.generate_segments([{"text": "a"}, {"text": "b"}], pcm=True)
+
+    assert pcm.duration == 0.1
+    assert [s.frames for s in segments] == [1600, 1600]
+    clip = audio_clip(pcm)
+    assert clip.duration == pytest.approx(0.1)
+    assert clip.fps == 16000
+
+
+def _float_wav(samples, sample_rate=16000):
+    # WAVE_FORMAT_IEEE_FLOAT, which the wave module cannot read
+    data = np.asarray(samples, dtype="<f4").tobytes()
+    fmt = struct.pack("<HHIIHH", 3, 1, sample_rate, sample_rate * 4, 4, 32)
+    chunks = b"WAVE" + b"fmt " + struct.pack("<I", len(fmt)) + fmt
+    chunks += b"data" + struct.pack("<I", len(data)) + data
+    return b"RIFF" + struct.pack("<I", len(chunks)) + chunks
+
+
+def test_decode_wav_float_falls_back_to_ffmpeg():
+    """Test float WAV is decoded through ffmpeg with samples intact."""
+    samples = np.linspace(-1, 1, 1601, dtype=np.float32)
+    pcm = decode_wav(_float_wav(samples))
+    assert (pcm.sample_rate, pcm.channels, pcm.frames) == (16000, 1, 1601)
+    assert pcm.samples.dtype == np.float32
+    assert np.array_equal(pcm.samples[:, 0], samples)
+
+
+def test_decode_wav_aiff(tmp_path):
+    """Test AIFF, as written by pyttsx3 on macOS, decodes like WAV."""
+    pcm = PCMBuffer(np.linspace(-1, 1, 2000, dtype=np.float32).reshape(-1, 2), 8000)
+    # Written to a file: ffmpeg can only fill in the AIFF sizes when seekable
+    path = tmp_path / "speech.aiff"
+    subprocess.run(
+        [imageio_ffmpeg.get_ffmpeg_exe(), "-loglevel", "error", "-i", "pipe:0"]
+        + [str(path)],
+        input=pcm.to_wav(),
+        check=True,
+    )
+    decoded = decode_wav(path.read_bytes())
+    assert (decoded.sample_rate, decoded.channels, decoded.frames) == (8000, 2, 1000)
+    assert np.allclose(decoded.samples, pcm.samples, atol=1e-4)
+
+
+def test_decode_wav_rejects_garbage():
+    """Test undecodable bytes raise ValueError."""
+    with pytest.raises(ValueError):
+        decode_wav(b"not audio at all")
@@ -0,0 +1,113 @@
+import os
+import json
+import time
+import asyncio
+import threading
+import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from packages.integrations.batch import TokenBucket, generate_catalog, run_batch
+from packages.integrations.fetcher import ProblemFetcher
+from packages.integrations.gemini import GeminiClient
+from packages.integrations.pseudo_leetcode import PseudoLeetCodeInterface
+
+
+class StubProblemHandler(BaseHTTPRequestHandler):
+    """Serve /problems/<slug>; slugs starting with 'flaky' fail once, 'broken' always."""
+
+    failures = {}
+
+    def do_GET(self):
+        slug = self.path.rstrip("/").split("/")[-1]
+        seen = self.failures.get(slug, 0)
+        self.failures[slug] = seen + 1
+        if slug.startswith("broken") or (slug.startswith("flaky") and seen == 0):
+            self.send_response(500)
+            self.end_headers()
+            return
+        body = json.dumps({"titleSlug": slug, "title": slug.title()}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    StubProblemHandler.failures = {}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubProblemHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+@pytest.fixture
+def interface(stub_server):
+    with patch.dict(os.environ, {"GEMINI_API_KEY": "test-key"}):
+        gemini = GeminiClient()
+    fetcher = ProblemFetcher(stub_server, retries=0)
+    return PseudoLeetCodeInterface(gemini, api_base=stub_server, fetcher=fetcher)
+
+
+def fake_umpire(problem_data, refresh=False):
+    return {"objectives": [problem_data["title"]]}
+
+
+@patch.object(GeminiClient, "generate_umpire_script", side_effect=fake_umpire)
+def test_run_batch_against_stub_server(mock_generate, interface):
+    """Test every slug is fetched and generated with bounded concurrency."""
+    slugs = [f"problem-{i}" for i in range(8)]
+    results = run_batch(interface, slugs, concurrency=4)
+
+    assert sorted(r.slug for r in results) == slugs
+    assert all(r.ok for r in results)
+    assert results[0].script["objectives"] == [results[0].slug.title()]
+    assert mock_generate.call_count == 8
+
+
+@patch.object(GeminiClient, "generate_umpire_script", side_effect=fake_umpire)
+def test_run_batch_retries_and_reports_failures(mock_generate, interface):
+    """Test transient failures are retried and permanent ones are yielded."""
+    results = {
+        r.slug: r
+        for r in run_batch(
+            interface, ["flaky-one", "broken-one"], retries=2, backoff=0.01
+        )
+    }
+
+    assert results["flaky-one"].ok
+    assert results["flaky-one"].attempts == 2
+    assert not results["broken-one"].ok
+    assert results["broken-one"].attempts == 3
+
+
+def test_generate_catalog_streams_fast_results_first(interface):
+    """Test a slow problem does not hold back results that finish earlier."""
+
+    def solve(slug):
+        time.sleep(0.3 if slug == "slow" else 0.01)
+        return {"slug": slug}
+
+    async def collect():
+        return [r.slug async for r in generate_catalog(interface, ["slow", "fast"])]
+
+    with patch.object(interface, "solve_problem", side_effect=solve):
+        order = asyncio.run(collect())
+    assert order == ["fast", "slow"]
+
+
+def test_token_bucket_limits_rate():
+    """Test the bucket spaces acquisitions beyond its burst capacity."""
+
+    async def acquire_all():
+        bucket = TokenBucket(rate=20, capacity=1)
+        start = time.monotonic()
+        for _ in range(5):
+            await bucket.acquire()
+        return time.monotonic() - start
+
+    assert asyncio.run(acquire_all()) >= 0.18
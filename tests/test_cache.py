@@ -0,0 +1,56 @@
+import os
+import time
+from unittest.mock import patch
+from packages.integrations.cache import ResponseCache, make_cache_key
+
+
+def test_make_cache_key_is_stable():
+    """Test cache keys depend only on content."""
+    assert make_cache_key("model", {"a": 1, "b": 2}) == make_cache_key(
+        "model", {"b": 2, "a": 1}
+    )
+    assert make_cache_key("model", "x") != make_cache_key("other", "x")
+
+
+def test_cache_roundtrip(tmp_path):
+    """Test values survive across cache instances on the same directory."""
+    ResponseCache(str(tmp_path)).set("key", {"objectives": ["A"]})
+    cache = ResponseCache(str(tmp_path))
+    assert cache.get("key") == {"objectives": ["A"]}
+    assert cache.get("missing") is None
+    assert cache.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+
+def test_cache_evicts_oldest_over_capacity(tmp_path):
+    """Test size-based eviction keeps the newest entries."""
+    cache = ResponseCache(str(tmp_path), max_entries=2)
+    for i, key in enumerate(["a", "b", "c"]):
+        cache.set(key, i)
+        os.utime(cache._path(key), (i, i))
+    cache.evict()
+    assert cache.get("a") is None
+    assert cache.get("b") == 1
+    assert cache.get("c") == 2
+
+
+def test_cache_expires_old_entries(tmp_path):
+    """Test age-based eviction treats stale entries as misses."""
+    cache = ResponseCache(str(tmp_path), max_age=60)
+    cache.set("key", "value")
+    old = time.time() - 120
+    os.utime(cache._path("key"), (old, old))
+    assert cache.evict() == 1
+    assert cache.get("key") is None
+
+
+def test_cache_set_scans_directory_only_when_over_capacity(tmp_path):
+    """Test writes track the entry count instead of listing the cache each time."""
+    cache = ResponseCache(str(tmp_path), max_entries=100)
+    listdir = os.listdir
+    with patch("os.listdir", side_effect=listdir) as scans:
+        for i in range(150):
+            cache.set(f"key{i}", i)
+    assert scans.call_count <= 6
+    entries = [name for name in os.listdir(tmp_path) if name.endswith(".json")]
+    assert len(entries) <= 100
+    assert cache.get("key149") == 149
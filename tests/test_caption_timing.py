@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+from packages.animations.audio import PCMBuffer
+from packages.animations.caption_timing import (
+    CaptionTimeline,
+    format_timestamp,
+    voiced_runs,
+    word_timings,
+)
+from packages.animations.captions import CaptionGenerator
+
+
+def _speech(*pattern, rate=1000):
+    """Build a buffer from (seconds, voiced) pairs."""
+    parts = [
+        np.full(int(seconds * rate), 0.5 if voiced else 0.0, dtype=np.float32)
+        for seconds, voiced in pattern
+    ]
+    return PCMBuffer(np.concatenate(parts), rate)
+
+
+def test_format_timestamp():
+    """Test timestamps round to the millisecond and support SRT separators."""
+    assert format_timestamp(0) == "00:00:00.000"
+    assert format_timestamp(3661.5) == "01:01:01.500"
+    assert format_timestamp(59.9996, ",") == "00:01:00,000"
+
+
+def test_timeline_uses_audio_durations():
+    """Test cue boundaries follow real audio durations, not text length."""
+    audio = [PCMBuffer.silence(2.5, 1000), PCMBuffer.silence(1.25, 1000)]
+    timeline = CaptionTimeline.from_segments(
+        [{"text": "A long sentence here"}, {"text": "Hi"}], audio=audio
+    )
+    assert [(c.start, c.end) for c in timeline.cues] == [(0.0, 2.5), (2.5, 3.75)]
+    assert "00:00:02.500 --> 00:00:03.750" in timeline.to_webvtt()
+    assert "00:00:02,500 --> 00:00:03,750" in timeline.to_srt()
+
+
+def test_timeline_duration_precedence():
+    """Test explicit durations beat segment durations, which beat the heuristic."""
+    segments = [{"text": "Hello", "duration": 2.0}, {"text": "World"}]
+    assert [c.end for c in CaptionTimeline.from_segments(segments).cues] == [2.0, 2.5]
+    timeline = CaptionTimeline.from_segments(segments, durations=[1.0, 1.0])
+    assert [c.end for c in timeline.cues] == [1.0, 2.0]
+
+
+def test_measured_audio_beats_declared_duration():
+    """Test a segment's declared duration is ignored when its audio is known."""
+    segments = [{"text": "Hello", "duration": 2.0}, {"text": "World", "duration": 1.0}]
+    audio = [PCMBuffer.silence(1.5, 1000), PCMBuffer.silence(0.5, 1000)]
+    timeline = CaptionTimeline.from_segments(segments, audio=audio)
+    assert [(c.start, c.end) for c in timeline.cues] == [(0.0, 1.5), (1.5, 2.0)]
+
+
+def test_word_timings_follow_pauses():
+    """Test words are placed on voiced stretches, skipping silences."""
+    buffer = _speech((0.2, False), (0.4, True), (0.6, False), (0.4, True))
+    assert voiced_runs(buffer) == pytest.approx([(0.2, 0.6), (1.2, 1.6)])
+
+    timings = word_timings("ping pong", buffer)
+    assert [w for _, _, w in timings] == ["ping", "pong"]
+    assert timings[0][:2] == pytest.approx((0.2, 0.6))
+    assert timings[1][:2] == pytest.approx((1.2, 1.6))
+
+
+def test_generate_all_single_pass():
+    """Test all caption formats come from one timeline with word tags."""
+    buffer = _speech((0.5, True), (0.5, False), (0.5, True))
+    outputs = CaptionGenerator().generate_all(
+        [{"text": "one two"}], audio=[buffer], words=True
+    )
+    assert set(outputs) == {"srt", "vtt", "transcript"}
+    assert "00:00:00.000 --> 00:00:01.500" in outputs["vtt"]
+    assert "one <00:00:01.000>two" in outputs["vtt"]
+    assert outputs["transcript"] == "one two"
@@ -1,4 +1,8 @@
-from packages.animations.captions import CaptionGenerator
+import io
+import os
+import srt
+from datetime import timedelta
+from packages.animations.captions import CaptionGenerator, caption_batch
 
 
 def test_caption_generator_initialization():
@@ -40,3 +44,61 @@ def test_format_time():
     gen = CaptionGenerator()
     assert gen._format_time(0) == "00:00:00.000"
     assert gen._format_time(3661.5) == "01:01:01.500"  # 1 hour, 1 min, 1.5 sec
+
+
+def test_streaming_writers_match_string_output():
+    """Test streaming writers produce the same text as the in-memory methods."""
+    gen = CaptionGenerator()
+    segments = [{"text": "Hello"}, {"text": "World", "duration": 2.0}]
+    srt_out, vtt_out, txt_out = io.StringIO(), io.StringIO(), io.StringIO()
+    assert gen.write_srt(iter(segments), srt_out) == 2
+    assert gen.write_webvtt(iter(segments), vtt_out) == 2
+    assert gen.write_transcript(iter(segments), txt_out) == 2
+    assert srt_out.getvalue() == gen.generate_srt(segments)
+    assert vtt_out.getvalue() == gen.generate_webvtt(segments)
+    assert txt_out.getvalue() == gen.generate_transcript(segments)
+
+
+def test_streaming_writer_consumes_lazily():
+    """Test each cue is written before the next segment is requested."""
+    gen = CaptionGenerator()
+    out = io.StringIO()
+
+    def segments():
+        yield {"text": "First"}
+        assert "First" in out.getvalue()
+        yield {"text": "Second"}
+
+    gen.write_srt(segments(), out)
+    assert "Second" in out.getvalue()
+
+
+def test_caption_batch(tmp_path):
+    """Test batch mode writes every format for every episode, in order."""
+    episodes = ((f"ep{i}", [{"text": f"Line {i}"}]) for i in range(5))
+    results = list(caption_batch(episodes, str(tmp_path), workers=2, window=2))
+    assert [name for name, _ in results] == [f"ep{i}" for i in range(5)]
+    assert sorted(os.listdir(tmp_path))[:3] == ["ep0.srt", "ep0.txt", "ep0.vtt"]
+    assert (tmp_path / "ep3.txt").read_text() == "Line 3"
+    assert "00:00:00.000 --> 00:00:00.600" in (tmp_path / "ep3.vtt").read_text()
+
+
+def test_srt_skips_and_renumbers_empty_cues_like_compose():
+    """Test blank and zero-length cues are dropped and indexes stay contiguous."""
+    segments = [{"text": "Hello"}, {"text": ""}, {"text": "   "}, {"text": "World"}]
+    durations = [1.0, 0.5, 0.5, 1.0]
+    gen = CaptionGenerator()
+    expected = srt.compose(
+        srt.Subtitle(i + 1, timedelta(seconds=s), timedelta(seconds=e), seg["text"])
+        for i, (seg, s, e) in enumerate(
+            zip(segments, [0.0, 1.0, 1.5, 2.0], [1.0, 1.5, 2.0, 3.0])
+        )
+    )
+    assert gen.generate_srt(segments, durations) == expected
+    assert "2\n00:00:02,000 --> 00:00:03,000\nWorld" in expected
+
+    out = io.StringIO()
+    assert gen.write_srt(segments, out, durations) == 2
+    assert out.getvalue() == expected
+    zero = gen.generate_srt([{"text": "a"}, {"text": "b"}], durations=[0.0, 1.0])
+    assert zero.startswith("1\n00:00:00,000 --> 00:00:01,000\nb")
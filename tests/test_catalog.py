@@ -0,0 +1,136 @@
+import os
+import pytest
+from unittest.mock import Mock, patch
+from packages.integrations.catalog import ProblemCatalog, normalize_problem
+from packages.integrations.gemini import GeminiClient
+from packages.integrations.pseudo_leetcode import PseudoLeetCodeInterface
+
+LISTING = [
+    {
+        "titleSlug": "two-sum",
+        "difficulty": "Easy",
+        "topicTags": [{"name": "Hash Table", "slug": "hash-table"}],
+    },
+    {
+        "titleSlug": "3sum",
+        "difficulty": "Medium",
+        "topicTags": [{"name": "Two Pointers", "slug": "two-pointers"}],
+    },
+]
+
+
+def make_fetcher(listing):
+    fetcher = Mock()
+    fetcher.api_base = "http://stub"
+    fetcher.timeout = 1.0
+    fetcher.session.get.return_value.json.return_value = {
+        "problemsetQuestionList": listing
+    }
+    fetcher.fetch.side_effect = lambda slug, force=False: {
+        "questionTitle": slug.title(),
+        "question": f"Description of {slug}",
+    }
+    return fetcher
+
+
+def test_normalize_problem():
+    """Test upstream payloads are reduced to pipeline fields."""
+    problem = normalize_problem(
+        {
+            "questionTitle": "Two Sum",
+            "question": "Find",
+            "topicTags": LISTING[0]["topicTags"],
+        },
+        slug="two-sum",
+    )
+    assert problem["titleSlug"] == "two-sum"
+    assert problem["title"] == "Two Sum"
+    assert problem["description"] == "Find"
+    assert problem["tags"] == ["hash-table"]
+
+
+def test_sync_and_indexed_lookup(tmp_path):
+    """Test a sync mirrors the listing and indexes it by difficulty and tag."""
+    path = str(tmp_path / "catalog.json.gz")
+    catalog = ProblemCatalog(path)
+    stats = catalog.sync(make_fetcher(LISTING))
+
+    assert stats == {"added": 2, "updated": 0, "unchanged": 0, "failed": 0}
+    reloaded = ProblemCatalog(path)
+    assert len(reloaded) == 2
+    assert reloaded.get("two-sum")["description"] == "Description of two-sum"
+    assert [p["titleSlug"] for p in reloaded.find(difficulty="Medium")] == ["3sum"]
+    assert [p["titleSlug"] for p in reloaded.find(tag="hash-table")] == ["two-sum"]
+    assert reloaded.find(difficulty="Easy", tag="two-pointers") == []
+
+
+def test_incremental_sync_fetches_only_changed(tmp_path):
+    """Test unchanged listing entries skip the detail request."""
+    catalog = ProblemCatalog(str(tmp_path / "catalog.json.gz"))
+    catalog.sync(make_fetcher(LISTING))
+
+    changed = [LISTING[0], dict(LISTING[1], difficulty="Hard"), {"titleSlug": "new"}]
+    fetcher = make_fetcher(changed)
+    stats = catalog.sync(fetcher)
+
+    assert stats == {"added": 1, "updated": 1, "unchanged": 1, "failed": 0}
+    assert sorted(c.args[0] for c in fetcher.fetch.call_args_list) == ["3sum", "new"]
+    assert [p["titleSlug"] for p in catalog.find(difficulty="Hard")] == ["3sum"]
+    assert catalog.find(difficulty="Medium") == []
+
+
+def test_interface_reads_from_catalog(tmp_path):
+    """Test fetch_problem serves mirrored problems without the network."""
+    catalog = ProblemCatalog(str(tmp_path / "catalog.json.gz"))
+    catalog.upsert({"titleSlug": "two-sum", "title": "Two Sum"})
+    fetcher = Mock()
+    with patch.dict(os.environ, {"GEMINI_API_KEY": "test-key"}):
+        interface = PseudoLeetCodeInterface(
+            GeminiClient(), fetcher=fetcher, catalog=catalog
+        )
+
+    assert interface.fetch_problem("two-sum")["title"] == "Two Sum"
+    fetcher.fetch.assert_not_called()
+    interface.fetch_problem("unknown")
+    fetcher.fetch.assert_called_once_with("unknown")
+
+
+def test_sync_checkpoints_and_survives_failures(tmp_path):
+    """Test a failed fetch is recorded while every other problem is saved."""
+    path = str(tmp_path / "catalog.json.gz")
+    listing = LISTING + [{"titleSlug": "broken"}]
+    fetcher = make_fetcher(listing)
+    fetch = fetcher.fetch.side_effect
+
+    def flaky(slug, force=False):
+        if slug == "broken":
+            raise ConnectionError("upstream down")
+        return fetch(slug, force)
+
+    fetcher.fetch.side_effect = flaky
+    catalog = ProblemCatalog(path)
+    with patch.object(catalog, "save", wraps=catalog.save) as save:
+        stats = catalog.sync(fetcher)
+
+    assert stats == {"added": 2, "updated": 0, "unchanged": 0, "failed": 1}
+    assert catalog.errors == {"broken": "ConnectionError: upstream down"}
+    assert save.call_count == 2
+    assert ProblemCatalog(path).slugs() == ["3sum", "two-sum"]
+
+    fetcher.fetch.side_effect = fetch
+    assert catalog.sync(fetcher)["added"] == 1
+    assert catalog.errors == {}
+
+
+def test_interface_uses_default_catalog(isolated_cache_dir):
+    """Test the default interface reads the per-user catalog mirror."""
+    catalog = ProblemCatalog()
+    assert catalog.path == str(isolated_cache_dir / "catalog.json.gz")
+    catalog.upsert({"titleSlug": "two-sum", "title": "Two Sum"})
+    catalog.save()
+    fetcher = Mock()
+    with patch.dict(os.environ, {"GEMINI_API_KEY": "test-key"}):
+        interface = PseudoLeetCodeInterface(GeminiClient(), fetcher=fetcher)
+
+    assert interface.fetch_problem("two-sum")["title"] == "Two Sum"
+    fetcher.fetch.assert_not_called()
@@ -0,0 +1,67 @@
+import json
+import os
+from packages.cli.catalog_index import CatalogIndex
+
+EPISODE = {
+    "id": "two-sum",
+    "title": "Two Sum",
+    "leetcodeSlug": "two-sum",
+    "difficulty": "Easy",
+    "pattern": ["hash-map"],
+    "objectives": ["Recognize complement pairs"],
+}
+
+MARKDOWN = """---
+id: three-sum
+title: 3Sum
+leetcodeSlug: 3sum
+difficulty: Medium
+pattern: [two-pointers]
+objectives:
+  - Sort then sweep
+---
+Body
+"""
+
+
+def write_catalog(root):
+    (root / "two-sum.json").write_text(json.dumps(EPISODE))
+    (root / "three-sum.md").write_text(MARKDOWN)
+
+
+def test_refresh_indexes_metadata(tmp_path):
+    """Test a refresh lists every episode with its indexed fields."""
+    write_catalog(tmp_path)
+    index = CatalogIndex(str(tmp_path))
+    assert index.refresh() == {"added": 2, "updated": 0, "unchanged": 0, "removed": 0}
+
+    reloaded = CatalogIndex(str(tmp_path))
+    assert [e["path"] for e in reloaded.find(difficulty="Medium")] == ["three-sum.md"]
+    assert [e["id"] for e in reloaded.find(pattern="hash-map")] == ["two-sum"]
+    assert reloaded.find(slug="3sum")[0]["title"] == "3Sum"
+
+
+def test_refresh_is_incremental(tmp_path):
+    """Test only changed, added or removed files are re-read."""
+    write_catalog(tmp_path)
+    index = CatalogIndex(str(tmp_path))
+    index.refresh()
+
+    (tmp_path / "two-sum.json").write_text(
+        json.dumps({**EPISODE, "difficulty": "Hard"})
+    )
+    os.remove(tmp_path / "three-sum.md")
+    stats = index.refresh()
+
+    assert stats == {"added": 0, "updated": 1, "unchanged": 0, "removed": 1}
+    assert [e["id"] for e in index.find(difficulty="Hard")] == ["two-sum"]
+
+
+def test_touched_but_unchanged_files_are_not_reparsed(tmp_path):
+    """Test an mtime bump with identical content keeps the entry."""
+    write_catalog(tmp_path)
+    index = CatalogIndex(str(tmp_path))
+    index.refresh()
+    os.utime(tmp_path / "three-sum.md", (1, 1))
+
+    assert index.refresh()["unchanged"] == 2
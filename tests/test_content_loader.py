@@ -1,5 +1,11 @@
 import os
-from packages.cli.content_loader import load_markdown_episode, save_markdown_episode
+import pytest
+from packages.cli.content_loader import (
+    load_markdown_episode,
+    read_front_matter,
+    save_markdown_episode,
+    save_markdown_episodes,
+)
 
 # Sample Markdown content
 SAMPLE_MARKDOWN = """---
@@ -53,3 +59,93 @@ def test_save_markdown_episode():
 
     # Clean up
     os.remove("test_episode.md")
+
+
+def test_load_markdown_episode_lazy_body(tmp_path):
+    """Test the body is only read when accessed."""
+    path = tmp_path / "episode.md"
+    path.write_text(SAMPLE_MARKDOWN)
+
+    loaded = load_markdown_episode(str(path), lazy=True)
+    assert loaded["title"] == "Two Sum"
+    assert not loaded.body_loaded
+    assert loaded["body"] == "# Two Sum Explanation\nThis is the body content."
+    assert loaded.body_loaded
+
+
+def test_read_front_matter_stops_at_closing_marker(tmp_path):
+    """Test front matter parsing returns the body offset without reading it."""
+    path = tmp_path / "episode.md"
+    path.write_text(SAMPLE_MARKDOWN)
+
+    metadata, offset = read_front_matter(str(path))
+    assert metadata["difficulty"] == "Easy"
+    assert SAMPLE_MARKDOWN.encode()[offset:].startswith(b"\n# Two Sum")
+
+
+def test_read_front_matter_requires_closing_marker(tmp_path):
+    """Test unterminated front matter is rejected."""
+    path = tmp_path / "episode.md"
+    path.write_text("---\nid: two-sum\n")
+    with pytest.raises(ValueError, match="front matter"):
+        read_front_matter(str(path))
+
+
+EPISODE = {
+    "id": "test-episode",
+    "title": "Test Episode",
+    "leetcodeSlug": "test-slug",
+    "difficulty": "Medium",
+    "pattern": ["test"],
+    "objectives": ["Test objective"],
+    "body": "Test content",
+}
+
+
+def test_save_markdown_episode_skips_unchanged(tmp_path):
+    """Test identical content is not rewritten and mtimes are preserved."""
+    path = tmp_path / "episode.md"
+    assert save_markdown_episode(str(path), EPISODE) is True
+    os.utime(path, (1, 1))
+
+    assert save_markdown_episode(str(path), EPISODE) is False
+    assert os.path.getmtime(path) == 1
+    assert save_markdown_episode(str(path), {**EPISODE, "body": "New"}) is True
+    assert load_markdown_episode(str(path))["body"] == "New"
+
+
+def test_save_markdown_episodes_batch(tmp_path):
+    """Test batch saves report written and unchanged files without temp leftovers."""
+    first, second = str(tmp_path / "a.md"), str(tmp_path / "b.md")
+    save_markdown_episode(first, EPISODE)
+
+    report = save_markdown_episodes(
+        [(first, EPISODE), (second, {**EPISODE, "id": "other"})]
+    )
+    assert report == {"written": [second], "unchanged": [first]}
+    assert sorted(os.listdir(tmp_path)) == ["a.md", "b.md"]
+
+
+def test_save_markdown_episode_file_modes(tmp_path):
+    """Test new files get the fixed mode and rewrites keep the existing one."""
+    path = tmp_path / "episode.md"
+    save_markdown_episode(str(path), EPISODE)
+    assert os.stat(path).st_mode & 0o777 == 0o644
+
+    os.chmod(path, 0o600)
+    save_markdown_episode(str(path), {**EPISODE, "body": "New"})
+    assert os.stat(path).st_mode & 0o777 == 0o600
+
+
+def test_front_matter_body_key_is_reserved(tmp_path):
+    """Test a body key in front matter neither duplicates nor replaces the body."""
+    path = tmp_path / "episode.md"
+    path.write_text(
+        SAMPLE_MARKDOWN.replace("title: Two Sum\n", "title: Two Sum\nbody: stray\n")
+    )
+
+    lazy = load_markdown_episode(str(path), lazy=True)
+    assert list(lazy).count("body") == 1
+    assert len(lazy) == len(list(lazy))
+    assert lazy["body"].startswith("# Two Sum Explanation")
+    assert load_markdown_episode(str(path))["body"] == lazy["body"]
@@ -1,4 +1,10 @@
+import csv
+import json
+from unittest.mock import patch
+from packages.cli.content_loader import LazyEpisode
 from packages.cli.distribution import (
+    _feed_record_for_file,
+    export_feeds,
     generate_deep_links,
     generate_youtube_description,
     generate_chapters,
@@ -53,3 +59,93 @@ def test_generate_chapters_sorting():
     chapters = generate_chapters(episode_data)
     assert chapters[0]["time"] == 30
     assert chapters[1]["time"] == 60
+
+
+def write_episodes(content_dir, count):
+    content_dir.mkdir()
+    for i in range(count):
+        episode = {
+            "id": f"episode-{i}",
+            "title": f"Episode {i}",
+            "leetcodeSlug": f"slug-{i}",
+            "difficulty": "Easy",
+            "pattern": ["hash-map"],
+            "objectives": ["Learn"],
+            "storyboard": [{"time": "00:30", "visual": "Intro"}],
+        }
+        (content_dir / f"episode-{i}.json").write_text(json.dumps(episode))
+    (content_dir / "broken.json").write_text("{}")
+
+
+def test_export_feeds_streams_jsonl_and_csv(tmp_path):
+    """Test the catalog is exported to JSONL and CSV feeds."""
+    content_dir = tmp_path / "content"
+    write_episodes(content_dir, 5)
+    jsonl_path, csv_path = tmp_path / "feed.jsonl", tmp_path / "feed.csv"
+
+    stats = export_feeds(str(content_dir), str(jsonl_path), str(csv_path), workers=2)
+
+    assert stats["exported"] == 5
+    assert [e["path"].rsplit("/", 1)[1] for e in stats["errors"]] == ["broken.json"]
+    records = [json.loads(line) for line in jsonl_path.read_text().splitlines()]
+    assert [r["slug"] for r in records] == [f"slug-{i}" for i in range(5)]
+    assert records[0]["chapters"] == [{"time": 30, "title": "Intro"}]
+    rows = list(csv.DictReader(csv_path.open()))
+    assert rows[2]["leetcode"] == "https://leetcode.com/problems/slug-2/"
+
+
+def test_export_feeds_regenerates_only_changed(tmp_path):
+    """Test the content-hash cache skips unchanged episodes."""
+    content_dir, cache_dir = tmp_path / "content", str(tmp_path / "cache")
+    write_episodes(content_dir, 3)
+    export_feeds(str(content_dir), str(tmp_path / "feed.jsonl"), cache_dir=cache_dir)
+
+    changed = json.loads((content_dir / "episode-1.json").read_text())
+    changed["title"] = "Renamed"
+    (content_dir / "episode-1.json").write_text(json.dumps(changed))
+    stats = export_feeds(
+        str(content_dir), str(tmp_path / "feed.jsonl"), cache_dir=cache_dir
+    )
+
+    assert stats["exported"] == 3
+    assert stats["regenerated"] == 1
+    titles = [
+        json.loads(line)["title"]
+        for line in (tmp_path / "feed.jsonl").read_text().splitlines()
+    ]
+    assert titles == ["Episode 0", "Renamed", "Episode 2"]
+
+
+def test_export_feeds_prunes_and_versions_cache(tmp_path):
+    """Test deleted files leave the cache and a format bump regenerates all."""
+    content_dir, cache_dir = tmp_path / "content", tmp_path / "cache"
+    write_episodes(content_dir, 3)
+    feed = str(tmp_path / "feed.jsonl")
+    export_feeds(str(content_dir), feed, cache_dir=str(cache_dir))
+    assert len(list(cache_dir.iterdir())) == 3
+
+    (content_dir / "episode-2.json").unlink()
+    assert (
+        export_feeds(str(content_dir), feed, cache_dir=str(cache_dir))["regenerated"]
+        == 0
+    )
+    assert len(list(cache_dir.iterdir())) == 2
+
+    with patch("packages.cli.distribution.FEED_FORMAT_VERSION", 2):
+        stats = export_feeds(
+            str(content_dir), feed, cache_dir=str(cache_dir), workers=1
+        )
+    assert stats["regenerated"] == 2
+
+
+def test_markdown_feed_record_leaves_body_unread(tmp_path):
+    """Test building a record from Markdown reads only the front matter."""
+    path = tmp_path / "episode.md"
+    path.write_text(
+        "---\nid: two-sum\ntitle: Two Sum\nleetcodeSlug: two-sum\n"
+        "difficulty: Easy\npattern: [hash-map]\nobjectives: [Learn]\n---\nBody\n"
+    )
+    with patch.object(LazyEpisode, "_load_body") as load_body:
+        result = _feed_record_for_file(str(path))
+    assert result["record"]["slug"] == "two-sum"
+    load_body.assert_not_called()
@@ -0,0 +1,127 @@
+import json
+import os
+import pytest
+from unittest.mock import patch
+from packages.cli.episode_index import EpisodeIndex
+
+
+def episode(slug, difficulty, pattern, **extra):
+    data = {
+        "id": slug,
+        "title": slug.replace("-", " ").title(),
+        "leetcodeSlug": slug,
+        "difficulty": difficulty,
+        "pattern": pattern,
+        "objectives": ["Learn"],
+    }
+    data.update(extra)
+    return data
+
+
+@pytest.fixture
+def content_dir(tmp_path):
+    content = tmp_path / "content"
+    content.mkdir()
+    episodes = [
+        episode("two-sum", "Easy", ["hash-map"], storyboard=[{"time": "00:00"}]),
+        episode("3sum", "Medium", ["two-pointers", "sorting"]),
+        episode("container-with-most-water", "Medium", ["two-pointers"]),
+    ]
+    for data in episodes:
+        (content / f"{data['id']}.json").write_text(json.dumps(data))
+    (content / "draft.md").write_text(
+        "---\nid: draft\ntitle: Draft\ndifficulty: Unknown\n---\nBody\n"
+    )
+    return content
+
+
+def test_query_by_pattern_and_difficulty(tmp_path, content_dir):
+    """Test indexed queries over pattern, difficulty, slug and missing fields."""
+    index = EpisodeIndex(str(tmp_path / "index.sqlite"))
+    assert index.sync(str(content_dir))["added"] == 4
+
+    medium_two_pointers = index.query(difficulty="Medium", pattern="two-pointers")
+    assert [e["leetcodeSlug"] for e in medium_two_pointers] == [
+        "3sum",
+        "container-with-most-water",
+    ]
+    assert medium_two_pointers[0]["pattern"] == ["two-pointers", "sorting"]
+    assert [e["id"] for e in index.query(missing="storyboard", valid=True)] == [
+        "3sum",
+        "container-with-most-water",
+    ]
+    assert index.query(slug="two-sum")[0]["storyboard"] == [{"time": "00:00"}]
+    assert [e["path"] for e in index.query(valid=False)] == ["draft.md"]
+
+
+def test_sync_is_incremental(tmp_path, content_dir):
+    """Test re-syncing only touches changed, added or removed files."""
+    db_path = str(tmp_path / "index.sqlite")
+    EpisodeIndex(db_path).sync(str(content_dir))
+
+    (content_dir / "3sum.json").write_text(
+        json.dumps(episode("3sum", "Hard", ["two-pointers"]))
+    )
+    os.remove(content_dir / "draft.md")
+    index = EpisodeIndex(db_path)
+    stats = index.sync(str(content_dir))
+
+    assert stats == {"added": 0, "updated": 1, "unchanged": 2, "removed": 1}
+    assert [e["id"] for e in index.query(difficulty="Hard")] == ["3sum"]
+    assert [e["id"] for e in index.query(pattern="sorting")] == []
+
+
+def test_query_rejects_unknown_fields(tmp_path):
+    """Test missing= only accepts schema fields."""
+    index = EpisodeIndex(str(tmp_path / "index.sqlite"))
+    with pytest.raises(ValueError, match="Unknown episode field"):
+        index.query(missing="body; DROP TABLE episodes")
+
+
+def test_scalar_pattern_is_one_pattern(tmp_path, content_dir):
+    """Test a scalar pattern value is indexed as a single pattern."""
+    data = episode("valid-palindrome", "Easy", "Two Pointers")
+    (content_dir / "valid-palindrome.json").write_text(json.dumps(data))
+    index = EpisodeIndex(str(tmp_path / "index.sqlite"))
+    index.sync(str(content_dir))
+    rows = index.conn.execute(
+        "SELECT pattern FROM episode_patterns WHERE path = 'valid-palindrome.json'"
+    ).fetchall()
+    assert [row["pattern"] for row in rows] == ["Two Pointers"]
+    assert [e["id"] for e in index.query(pattern="Two Pointers")] == [
+        "valid-palindrome"
+    ]
+    index.close()
+
+
+def test_outdated_schema_is_rebuilt(tmp_path, content_dir):
+    """Test an index created with an older column set is rebuilt on open."""
+    import sqlite3
+
+    db_path = str(tmp_path / "index.sqlite")
+    conn = sqlite3.connect(db_path)
+    conn.executescript(
+        "CREATE TABLE episodes (path TEXT PRIMARY KEY, mtime INTEGER, size INTEGER,"
+        " hash TEXT, valid INTEGER, error TEXT, id TEXT);"
+        "INSERT INTO episodes VALUES ('two-sum.json', 0, 0, 'x', 1, NULL, 'old');"
+    )
+    conn.close()
+
+    index = EpisodeIndex(db_path)
+    assert index.sync(str(content_dir))["added"] == 4
+    assert index.query(slug="two-sum")[0]["difficulty"] == "Easy"
+    index.close()
+    assert EpisodeIndex(db_path).sync(str(content_dir))["unchanged"] == 4
+
+
+def test_validation_rule_changes_rebuild_the_index(tmp_path, content_dir):
+    """Test stored valid flags are discarded when the schema hash changes."""
+    db_path = str(tmp_path / "index.sqlite")
+    index = EpisodeIndex(db_path)
+    index.sync(str(content_dir))
+    index.close()
+
+    with patch("packages.cli.episode_index.SCHEMA_HASH", "other"):
+        index = EpisodeIndex(db_path)
+    assert index.sync(str(content_dir))["added"] == 4
+    index.close()
@@ -0,0 +1,104 @@
+import gc
+import json
+import threading
+import warnings
+import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from packages.integrations.fetcher import ProblemFetcher, ProblemStore
+
+
+class ETagHandler(BaseHTTPRequestHandler):
+    """Serve problems with an ETag and honour If-None-Match."""
+
+    requests_seen = []
+
+    def do_GET(self):
+        self.requests_seen.append((self.path, self.headers.get("If-None-Match")))
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = json.dumps({"title": "Two Sum", "difficulty": "Easy"}).encode()
+        self.send_response(200)
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    ETagHandler.requests_seen = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ETagHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def test_fresh_store_entries_skip_network(stub_server, tmp_path):
+    """Test repeated fetches within the TTL are served locally."""
+    fetcher = ProblemFetcher(stub_server, store=ProblemStore(str(tmp_path)))
+    assert fetcher.fetch("two-sum")["title"] == "Two Sum"
+    assert fetcher.fetch("two-sum")["title"] == "Two Sum"
+    assert len(ETagHandler.requests_seen) == 1
+    assert (tmp_path / "two-sum.json.gz").exists()
+
+
+def test_stale_entries_are_revalidated(stub_server, tmp_path):
+    """Test stale entries send If-None-Match and reuse data on 304."""
+    store = ProblemStore(str(tmp_path), ttl=0)
+    fetcher = ProblemFetcher(stub_server, store=store)
+    fetcher.fetch("two-sum")
+    data = fetcher.fetch("two-sum")
+
+    assert data["difficulty"] == "Easy"
+    assert ETagHandler.requests_seen == [
+        ("/problems/two-sum", None),
+        ("/problems/two-sum", '"v1"'),
+    ]
+
+
+def test_offline_mode_serves_only_from_store(stub_server, tmp_path):
+    """Test offline fetchers never touch the network."""
+    ProblemFetcher(stub_server, store=ProblemStore(str(tmp_path))).fetch("two-sum")
+    offline = ProblemFetcher(
+        stub_server, store=ProblemStore(str(tmp_path), ttl=0), offline=True
+    )
+
+    assert offline.fetch("two-sum")["title"] == "Two Sum"
+    with pytest.raises(LookupError):
+        offline.fetch("unknown")
+    assert len(ETagHandler.requests_seen) == 1
+
+
+def test_offline_mode_requires_store():
+    """Test offline mode without a store is rejected."""
+    with pytest.raises(ValueError, match="ProblemStore"):
+        ProblemFetcher(offline=True)
+
+
+def test_store_rejects_unsafe_slugs(tmp_path):
+    """Test slugs that could escape the store directory are refused."""
+    store = ProblemStore(str(tmp_path / "store"))
+    for slug in ["../escape", "Two Sum", "a/b", ""]:
+        with pytest.raises(ValueError):
+            store.put(slug, {})
+        with pytest.raises(ValueError):
+            ProblemFetcher("http://127.0.0.1:9", store=store).fetch(slug)
+    assert list((tmp_path / "store").iterdir()) == []
+
+
+def test_store_write_closes_files(tmp_path):
+    """Test entries are flushed and closed before being renamed into place."""
+    store = ProblemStore(str(tmp_path))
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always", ResourceWarning)
+        store.put("two-sum", {"title": "Two Sum"})
+        gc.collect()
+    assert not [w for w in caught if issubclass(w.category, ResourceWarning)]
+    assert ProblemStore(str(tmp_path)).get("two-sum")["data"]["title"] == "Two Sum"
@@ -2,6 +2,7 @@ import pytest
 import os
 from unittest.mock import Mock, patch
 from packages.integrations.gemini import GeminiClient
+from packages.integrations.cache import ResponseCache
 
 
 # Mock environment for testing
@@ -50,7 +51,7 @@ def test_generate_umpire_script(mock_client_class):
 
 
 @patch("packages.integrations.gemini.genai.Client")
-def test_analyze_video(mock_client_class):
+def test_analyze_video(mock_client_class, tmp_path):
     """Test video analysis with mocked response."""
     mock_client = Mock()
     mock_client_class.return_value = mock_client
@@ -60,7 +61,100 @@ def test_analyze_video(mock_client_class):
 
     with patch.dict(os.environ, {"GEMINI_API_KEY": "test-key"}):
         client = GeminiClient()
-        result = client.analyze_video("test_video.mp4", "Analyze this video")
+        video_path = tmp_path / "test_video.mp4"
+        video_path.write_bytes(b"video")
+        result = client.analyze_video(str(video_path), "Analyze this video")
 
         assert result == "Video analysis result"
         mock_client.models.generate_content.assert_called_once()
+
+
+@patch("packages.integrations.gemini.genai.Client")
+def test_generate_umpire_script_uses_cache(mock_client_class, tmp_path):
+    """Test repeated UMPIRE requests are served from the response cache."""
+    mock_client = Mock()
+    mock_client_class.return_value = mock_client
+    mock_response = Mock()
+    mock_response.text = '{"objectives": ["Cached objective"]}'
+    mock_client.models.generate_content.return_value = mock_response
+
+    cache = ResponseCache(str(tmp_path))
+    with patch.dict(os.environ, {"GEMINI_API_KEY": "test-key"}):
+        client = GeminiClient(cache=cache)
+        problem_data = {"title": "Test Problem", "description": "Test desc"}
+        first = client.generate_umpire_script(problem_data)
+        second = client.generate_umpire_script(problem_data)
+
+    assert first == second == {"objectives": ["Cached objective"]}
+    mock_client.models.generate_content.assert_called_once()
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+@patch("packages.integrations.gemini.genai.Client")
+def test_generate_umpire_script_refresh_bypasses_cache(mock_client_class, tmp_path):
+    """Test refresh=True skips the cached entry and overwrites it."""
+    mock_client = Mock()
+    mock_client_class.return_value = mock_client
+    mock_client.models.generate_content.side_effect = [
+        Mock(text='{"objectives": ["Old"]}'),
+        Mock(text='{"objectives": ["New"]}'),
+    ]
+
+    cache = ResponseCache(str(tmp_path))
+    with patch.dict(os.environ, {"GEMINI_API_KEY": "test-key"}):
+        client = GeminiClient(cache=cache)
+        problem_data = {"title": "Test Problem"}
+        client.generate_umpire_script(problem_data)
+        refreshed = client.generate_umpire_script(problem_data, refresh=True)
+        cached = client.generate_umpire_script(problem_data)
+
+    assert refreshed == {"objectives": ["New"]}
+    assert cached == {"objectives": ["New"]}
+    assert mock_client.models.generate_content.call_count == 2
+
+
+@patch("packages.integrations.gemini.genai.Client")
+def test_stream_umpire_steps(mock_client_class, tmp_path):
+    """Test streamed phases are yielded in order and the script is cached."""
+    mock_client = Mock()
+    mock_client_class.return_value = mock_client
+    text = '{"umpireSteps": [{"phase": "Understand"}, {"phase": "Match"}]}'
+    chunks = [Mock(text=text[i : i + 7]) for i in range(0, len(text), 7)]
+    mock_client.models.generate_content_stream.return_value = iter(chunks)
+
+    cache = ResponseCache(str(tmp_path))
+    with patch.dict(os.environ, {"GEMINI_API_KEY": "test-key"}):
+        client = GeminiClient(cache=cache)
+        problem_data = {"title": "Test Problem"}
+        phases = [s["phase"] for s in client.stream_umpire_steps(problem_data)]
+        replayed = [s["phase"] for s in client.stream_umpire_steps(problem_data)]
+
+    assert phases == replayed == ["Understand", "Match"]
+    mock_client.models.generate_content_stream.assert_called_once()
+    assert client.generate_umpire_script(problem_data)["umpireSteps"][1] == {
+        "phase": "Match"
+    }
+
+
+@patch("packages.integrations.gemini.genai.Client")
+def test_analyze_video_reuses_upload(mock_client_class, tmp_path):
+    """Test identical video content is uploaded once for many prompts."""
+    mock_client = Mock()
+    mock_client_class.return_value = mock_client
+    mock_client.models.generate_content.side_effect = lambda model, contents: Mock(
+        text=f"answer: {contents[1]}"
+    )
+    first = tmp_path / "episode.mp4"
+    copy = tmp_path / "episode-copy.mp4"
+    first.write_bytes(b"rendered episode")
+    copy.write_bytes(b"rendered episode")
+
+    with patch.dict(os.environ, {"GEMINI_API_KEY": "test-key"}):
+        client = GeminiClient()
+        answers = client.analyze_video_many(str(first), ["pacing?", "captions?"])
+        client.analyze_video(str(copy), "audio?")
+
+    assert answers == ["answer: pacing?", "answer: captions?"]
+    mock_client.files.upload.assert_called_once()
+    assert client.uploads.reuses == 1
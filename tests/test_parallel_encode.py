@@ -0,0 +1,112 @@
+import functools
+import imageio_ffmpeg
+import moviepy as mp
+import numpy as np
+import pytest
+from unittest.mock import patch
+from packages.animations import parallel_encode
+from packages.animations.parallel_encode import (
+    encode_parallel,
+    plan_chunks,
+    serial_frame_count,
+    verify_encode,
+)
+
+
+def moving_clip(duration):
+    """A clip whose frames change over time, with a tone track."""
+
+    def frame(t):
+        img = np.zeros((90, 160, 3), dtype=np.uint8)
+        img[:, : int(t * 40) % 160] = (200, 80, 40)
+        return img
+
+    tone = np.sin(np.arange(int(duration * 22050)) / 10.0) * 0.2
+    audio = mp.AudioArrayClip(np.stack([tone, tone], axis=1), fps=22050)
+    return mp.VideoClip(frame, duration=duration).with_audio(audio)
+
+
+def test_plan_chunks_split_frames_evenly():
+    """Test chunk ranges are contiguous, even and exactly as many as asked."""
+    assert plan_chunks(72, 4) == [(0, 18), (18, 36), (36, 54), (54, 72)]
+    sizes = [end - start for start, end in plan_chunks(30, 7)]
+    assert sizes == [5, 5, 4, 4, 4, 4, 4]
+    assert plan_chunks(30, 7)[-1] == (26, 30)
+    assert len(plan_chunks(12, 100)) == 12
+    assert plan_chunks(12, 100)[-1] == (11, 12)
+    assert plan_chunks(0, 4) == []
+
+
+def test_serial_frame_count_matches_moviepy():
+    """Test the planned frame count is what write_videofile iterates over."""
+    for duration, fps in [(2.37, 24), (0.53, 24), (3.3, 25), (2.0, 29.97)]:
+        clip = mp.ColorClip((16, 16), (0, 0, 0), duration=duration)
+        assert serial_frame_count(duration, fps) == len(list(clip.iter_frames(fps)))
+
+
+def test_encode_parallel_rejects_empty_clip(tmp_path):
+    """Test a clip shorter than one frame is an error, not an empty video."""
+    with pytest.raises(ValueError):
+        encode_parallel(
+            functools.partial(moving_clip, 0.01), str(tmp_path / "out.mp4"), fps=24
+        )
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_parallel_encode_matches_serial(tmp_path):
+    """Test a chunked encode has the same frames and duration as a serial one."""
+    factory = functools.partial(moving_clip, 2.5)
+    serial = str(tmp_path / "serial.mp4")
+    clip = factory()
+    clip.write_videofile(serial, fps=24, logger=None)
+    clip.close()
+
+    parallel = str(tmp_path / "parallel.mp4")
+    report = encode_parallel(factory, parallel, fps=24, workers=2, chunks=3)
+
+    assert report["chunks"] == 3
+    serial_frames, serial_seconds = imageio_ffmpeg.count_frames_and_secs(serial)
+    frames, seconds = imageio_ffmpeg.count_frames_and_secs(parallel)
+    assert frames == serial_frames == 60
+    assert seconds == pytest.approx(serial_seconds, abs=0.05)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["parallel.mp4", "serial.mp4"]
+
+    with pytest.raises(ValueError):
+        verify_encode(parallel, 61, 2.5)
+
+
+def test_failed_verification_leaves_no_output(tmp_path):
+    """Test a chunked encode that fails its check is never published."""
+    output = tmp_path / "out.mp4"
+    output.write_bytes(b"previous")
+    with patch.object(
+        parallel_encode, "verify_encode", side_effect=ValueError("bad encode")
+    ):
+        with pytest.raises(ValueError):
+            encode_parallel(
+                functools.partial(moving_clip, 1.0), str(output), fps=24, workers=1
+            )
+    assert output.read_bytes() == b"previous"
+    assert [p.name for p in tmp_path.iterdir()] == ["out.mp4"]
+
+
+@pytest.mark.parametrize(
+    "duration, fps, chunks",
+    [(2.37, 24, 3), (3.3, 25, 4), (2.0, 29.97, 3), (1.0, 30, 7), (1.0, 24, 5)],
+)
+def test_parallel_encode_uneven_timelines(tmp_path, duration, fps, chunks):
+    """Test non-integral lengths and uneven chunk splits match a serial encode."""
+    factory = functools.partial(moving_clip, duration)
+    serial = str(tmp_path / "serial.mp4")
+    clip = factory()
+    clip.write_videofile(serial, fps=fps, logger=None)
+    clip.close()
+
+    parallel = str(tmp_path / "parallel.mp4")
+    report = encode_parallel(factory, parallel, fps=fps, workers=2, chunks=chunks)
+
+    serial_frames, serial_seconds = imageio_ffmpeg.count_frames_and_secs(serial)
+    frames, seconds = imageio_ffmpeg.count_frames_and_secs(parallel)
+    assert report["chunks"] == chunks
+    assert frames == serial_frames == report["frames"]
+    assert seconds == pytest.approx(serial_seconds, abs=0.05)
@@ -11,11 +11,13 @@ def mock_gemini():
         return GeminiClient()
 
 
-@patch("packages.integrations.pseudo_leetcode.requests.get")
+@patch("packages.integrations.fetcher.requests.Session.get")
 def test_fetch_problem(mock_get, mock_gemini):
     """Test fetching problem data from API."""
     mock_response = Mock()
     mock_response.raise_for_status.return_value = None
+    mock_response.status_code = 200
+    mock_response.headers = {}
     mock_response.json.return_value = {"title": "Two Sum", "difficulty": "Easy"}
     mock_get.return_value = mock_response
 
@@ -24,17 +26,21 @@ def test_fetch_problem(mock_get, mock_gemini):
 
     assert data["title"] == "Two Sum"
     mock_get.assert_called_once_with(
-        "https://alfa-leetcode-api.onrender.com/problems/two-sum"
+        "https://alfa-leetcode-api.onrender.com/problems/two-sum",
+        headers={},
+        timeout=10.0,
     )
 
 
-@patch("packages.integrations.pseudo_leetcode.requests.get")
+@patch("packages.integrations.fetcher.requests.Session.get")
 @patch.object(GeminiClient, "generate_umpire_script")
 def test_solve_problem(mock_generate_umpire, mock_get, mock_gemini):
     """Test solving problem with UMPIRE script generation."""
     # Mock API response
     mock_response = Mock()
     mock_response.raise_for_status.return_value = None
+    mock_response.status_code = 200
+    mock_response.headers = {}
     mock_response.json.return_value = {
         "title": "Two Sum",
         "description": "Find two numbers that sum to target.",
@@ -64,3 +70,63 @@ def test_suggest_recognition_cues(mock_gemini):
 
     assert isinstance(cues, list)
     assert len(cues) > 0
+
+
+SCRIPT = {
+    "objectives": ["Use a hash map"],
+    "recognitionCues": ["Pairs summing to a target"],
+    "umpireSteps": [
+        {"phase": "Understand", "code": "N/A"},
+        {"phase": "Implement", "code": "def two_sum(nums, target): ..."},
+    ],
+    "storyboard": [{"time": "00:00", "visual": "Intro"}],
+    "quizzes": [{"question": "Complexity?", "choices": ["O(n)"], "answer": 0}],
+}
+
+
+@patch.object(GeminiClient, "generate_umpire_script", return_value=SCRIPT)
+def test_session_serves_all_artifacts_from_one_call(mock_generate, mock_gemini):
+    """Test snippets, cues, quizzes, storyboard and objectives share one script."""
+    interface = PseudoLeetCodeInterface(mock_gemini)
+    problem_data = {"titleSlug": "two-sum", "title": "Two Sum"}
+
+    assert (
+        interface.generate_code_snippet(problem_data)
+        == SCRIPT["umpireSteps"][1]["code"]
+    )
+    assert interface.suggest_recognition_cues(problem_data) == [
+        "Pairs summing to a target"
+    ]
+    session = interface.session(problem_data)
+    assert session.quizzes() == SCRIPT["quizzes"]
+    assert session.storyboard() == SCRIPT["storyboard"]
+    assert session.objectives() == SCRIPT["objectives"]
+    mock_generate.assert_called_once()
+
+
+@patch.object(GeminiClient, "generate_umpire_script", return_value=SCRIPT)
+def test_session_invalidate_regenerates(mock_generate, mock_gemini):
+    """Test invalidation forces a fresh, cache-bypassing generation."""
+    interface = PseudoLeetCodeInterface(mock_gemini)
+    problem_data = {"titleSlug": "two-sum"}
+
+    interface.generate_code_snippet(problem_data)
+    interface.invalidate(problem_data)
+    interface.generate_code_snippet(problem_data)
+
+    assert mock_generate.call_count == 2
+    assert mock_generate.call_args.kwargs["refresh"] is True
+
+
+@patch.object(GeminiClient, "generate_umpire_script", return_value=SCRIPT)
+def test_sessions_are_bounded_and_closed(mock_generate, mock_gemini):
+    """Test only the most recently used sessions are kept, and close drops them."""
+    interface = PseudoLeetCodeInterface(mock_gemini, max_sessions=2)
+    for slug in ["a", "b", "a", "c"]:
+        interface.session({"titleSlug": slug})
+    assert list(interface._sessions) == ["a", "c"]
+
+    with patch.object(interface.fetcher, "close") as close:
+        interface.close()
+    close.assert_called_once()
+    assert not interface._sessions
@@ -0,0 +1,123 @@
+import os
+import time
+from packages.cli.render_farm import RenderQueue, run_worker, run_workers
+
+
+def fake_render(episode_path, output_path):
+    """Write a marker file instead of a video; fail for paths containing "bad"."""
+    if "bad" in episode_path:
+        raise RuntimeError("encoder crashed")
+    with open(output_path, "w") as f:
+        f.write(f"{os.getpid()}:{episode_path}")
+
+
+def test_claim_order_and_retries(tmp_path):
+    """Test jobs are claimed by priority and retried up to max_attempts."""
+    queue = RenderQueue(str(tmp_path / "jobs.sqlite"))
+    low = queue.submit("a.md", "a.mp4")
+    high = queue.submit("b.md", "b.mp4", priority=5, max_attempts=2)
+
+    assert queue.claim("w1")["id"] == high
+    assert queue.fail(high, "w1", "boom") == "queued"
+    assert queue.claim("w1")["id"] == high
+    assert queue.fail(high, "w1", "boom") == "failed"
+    assert queue.claim("w1")["id"] == low
+    assert queue.claim("w1") is None
+
+    assert queue.complete(low, "w1")
+    assert queue.counts() == {"queued": 0, "running": 0, "done": 1, "failed": 1}
+    assert queue.retry_failed() == 1
+    assert queue.get(high)["attempts"] == 0
+    queue.close()
+
+
+def test_recover_stale_requeues_crashed_jobs(tmp_path):
+    """Test running jobs without recent heartbeats go back to the queue."""
+    queue = RenderQueue(str(tmp_path / "jobs.sqlite"))
+    job_id = queue.submit("a.md", "a.mp4")
+    queue.claim("crashed-worker")
+    assert queue.recover_stale(stale_after=60) == 0
+
+    queue.conn.execute("UPDATE jobs SET heartbeat = ?", (time.time() - 120,))
+    assert queue.recover_stale(stale_after=60) == 1
+    job = queue.get(job_id)
+    assert (job["status"], job["error"]) == ("queued", "worker stopped responding")
+    queue.close()
+
+
+def test_stale_worker_cannot_finish_a_reclaimed_job(tmp_path):
+    """Test a worker whose job was requeued and reclaimed no longer owns it."""
+    queue = RenderQueue(str(tmp_path / "jobs.sqlite"))
+    job_id = queue.submit("a.md", "a.mp4")
+    queue.claim("slow")
+    queue.conn.execute("UPDATE jobs SET heartbeat = ?", (time.time() - 120,))
+    assert queue.recover_stale(stale_after=60) == 1
+    queue.claim("fast")
+
+    assert queue.heartbeat(job_id, "slow") is False
+    assert queue.complete(job_id, "slow") is False
+    assert queue.fail(job_id, "slow", "boom") is None
+    job = queue.get(job_id)
+    assert (job["status"], job["worker"], job["attempts"]) == ("running", "fast", 2)
+
+    assert queue.heartbeat(job_id, "fast") is True
+    assert queue.complete(job_id, "fast") is True
+    assert queue.complete(job_id, "fast") is False
+    assert queue.get(job_id)["status"] == "done"
+    queue.close()
+
+
+def test_reclaimed_worker_finishing_late_does_not_publish(tmp_path):
+    """Test a worker that lost its job discards its output instead of publishing."""
+    db = str(tmp_path / "jobs.sqlite")
+    queue = RenderQueue(db)
+    output = tmp_path / "ep.mp4"
+    job_id = queue.submit("ep.md", str(output))
+    staged = []
+
+    def slow_render(episode_path, output_path):
+        staged.append(output_path)
+        fake_render(episode_path, output_path)
+        # Stalls long enough to be declared stale and picked up by another worker
+        queue.conn.execute("UPDATE jobs SET heartbeat = ?", (time.time() - 120,))
+        queue.recover_stale(stale_after=60)
+        queue.claim("w2")
+
+    assert run_worker(db, "w1", render=slow_render) == 1
+    job = queue.get(job_id)
+    assert (job["status"], job["worker"]) == ("running", "w2")
+    assert not output.exists()
+    assert not any(name.startswith("ep.") for name in os.listdir(tmp_path))
+    assert staged[0] != str(output) and "w1" in staged[0]
+    queue.close()
+
+
+def test_run_worker_records_outcomes(tmp_path):
+    """Test a worker drains the queue, completing and failing jobs."""
+    db = str(tmp_path / "jobs.sqlite")
+    queue = RenderQueue(db)
+    ok = queue.submit("good.md", str(tmp_path / "good.mp4"))
+    bad = queue.submit("bad.md", str(tmp_path / "bad.mp4"), max_attempts=2)
+
+    assert run_worker(db, "w1", render=fake_render) == 3
+    assert queue.get(ok)["status"] == "done"
+    failed = queue.get(bad)
+    assert (failed["status"], failed["attempts"]) == ("failed", 2)
+    assert failed["error"] == "RuntimeError: encoder crashed"
+    queue.close()
+
+
+def test_run_workers_across_processes(tmp_path):
+    """Test several worker processes share the queue without double work."""
+    db = str(tmp_path / "jobs.sqlite")
+    queue = RenderQueue(db)
+    for i in range(8):
+        queue.submit(f"ep{i}.md", str(tmp_path / f"ep{i}.mp4"))
+
+    run_workers(db, processes=3, render=fake_render)
+
+    assert queue.counts()["done"] == 8
+    assert all(job["attempts"] == 1 for job in queue.jobs())
+    outputs = [(tmp_path / f"ep{i}.mp4").read_text() for i in range(8)]
+    assert [o.split(":", 1)[1] for o in outputs] == [f"ep{i}.md" for i in range(8)]
+    queue.close()
@@ -0,0 +1,84 @@
+import json
+import time
+from unittest.mock import Mock
+from packages.integrations.fetcher import ProblemStore
+from packages.integrations.gemini import GeminiClient
+from packages.integrations.replay import (
+    LatencyModel,
+    RecordingClient,
+    ReplayClient,
+    benchmark_pipeline,
+    percentile,
+    replay_interface,
+)
+
+SCRIPT = {"objectives": ["Replay"], "umpireSteps": [{"phase": "Understand"}]}
+
+
+def record(cassette_dir, problem_data):
+    """Record one generate and one stream call through a fake real client."""
+    real = Mock()
+    text = json.dumps(SCRIPT)
+    real.models.generate_content.return_value = Mock(text=text)
+    real.models.generate_content_stream.return_value = iter(
+        [Mock(text=text[:10]), Mock(text=text[10:])]
+    )
+    gemini = GeminiClient(client=RecordingClient(real, str(cassette_dir)))
+    gemini.generate_umpire_script(problem_data)
+    list(gemini.stream_umpire_steps(problem_data))
+
+
+def test_latency_model_is_seeded():
+    """Test latency samples are reproducible and chunk delays sum sensibly."""
+    first = [LatencyModel(seed=7).sample() for _ in range(3)]
+    second = [LatencyModel(seed=7).sample() for _ in range(3)]
+    assert first == second
+    delays = LatencyModel(median=1.0, sigma=0.0, first_chunk=0.5).chunk_delays(3)
+    assert delays == [0.5, 0.25, 0.25]
+    assert LatencyModel(median=0.0).chunk_delays(2) == [0.0, 0.0]
+
+
+def test_record_then_replay(tmp_path):
+    """Test recorded responses replay without the real API."""
+    problem_data = {"title": "Two Sum"}
+    record(tmp_path, problem_data)
+
+    replay = ReplayClient(str(tmp_path), latency=LatencyModel(median=0.0))
+    gemini = GeminiClient(client=replay)
+    assert gemini.generate_umpire_script(problem_data) == SCRIPT
+    steps = list(gemini.stream_umpire_steps(problem_data))
+    assert steps == SCRIPT["umpireSteps"]
+
+
+def test_replay_applies_latency(tmp_path):
+    """Test replayed calls sleep according to the latency model."""
+    problem_data = {"title": "Two Sum"}
+    record(tmp_path, problem_data)
+    gemini = GeminiClient(
+        client=ReplayClient(str(tmp_path), LatencyModel(median=0.05, sigma=0.0))
+    )
+    start = time.monotonic()
+    gemini.generate_umpire_script(problem_data)
+    assert time.monotonic() - start >= 0.05
+
+
+def test_benchmark_replayed_pipeline(tmp_path):
+    """Test an offline benchmark over a replayed cassette."""
+    problem_data = {"titleSlug": "two-sum", "title": "Two Sum"}
+    record(tmp_path, problem_data)
+    ProblemStore(str(tmp_path / "problems")).put("two-sum", problem_data)
+
+    interface = replay_interface(str(tmp_path), LatencyModel(median=0.0))
+    report = benchmark_pipeline(interface, ["two-sum"] * 4, concurrency=2)
+
+    assert report["problems"] == 4
+    assert report["errors"] == 0
+    assert report["p50"] <= report["p99"]
+
+
+def test_percentile():
+    """Test nearest-rank percentiles."""
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([], 50) == 0.0
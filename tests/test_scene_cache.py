@@ -0,0 +1,80 @@
+import os
+import imageio_ffmpeg
+import numpy as np
+import pytest
+from unittest.mock import patch
+from packages.animations import scene_cache
+from packages.animations.audio import PCMBuffer
+from packages.animations.mobjects.data_structures import Stack
+from packages.animations.scene_cache import SceneCache, render_scenes, scene_key
+from packages.animations.scenes.base_scene import LeetCodeScene
+
+
+class StackDemo(LeetCodeScene):
+    def __init__(self, items, duration=1.0, theme=None):
+        super().__init__({"id": "demo", "title": "Demo"}, theme)
+        self.items = items
+        self.scene_duration = duration
+
+    def construct(self):
+        self.add_mobject(Stack(items=list(self.items)))
+        self.duration = self.scene_duration
+
+
+def _constructed(*args, **kwargs):
+    scene = StackDemo(*args, **kwargs)
+    scene.construct()
+    return scene
+
+
+def test_scene_key_tracks_inputs():
+    """Test the key changes with title, mobjects, timing, theme and audio only."""
+    base = scene_key(_constructed([1, 2]))
+    assert scene_key(_constructed([1, 2])) == base
+    assert scene_key(_constructed([1, 2, 3])) != base
+    assert scene_key(_constructed([1, 2], duration=2.0)) != base
+    assert scene_key(_constructed([1, 2], theme={"background": "#000"})) != base
+    retitled = _constructed([1, 2])
+    retitled.episode_data["title"] = "Two Sum"
+    assert scene_key(retitled) != base
+    tone = PCMBuffer(np.ones(100, dtype=np.float32) * 0.1, 1000)
+    assert scene_key(_constructed([1, 2]), tone) != base
+
+
+def test_render_scenes_reencodes_only_changed_scenes(tmp_path):
+    """Test an edited scene is the only one re-encoded and output is stream copied."""
+    cache = SceneCache(str(tmp_path / "cache"))
+    narration = [PCMBuffer(np.zeros(8000, dtype=np.float32), 16000), None, None]
+    scenes = [StackDemo([1]), StackDemo([1, 2]), StackDemo([1, 2, 3], duration=0.5)]
+    output = str(tmp_path / "episode.mp4")
+
+    first = render_scenes(scenes, output, cache, narration)
+    assert (len(first["encoded"]), len(first["reused"])) == (3, 0)
+    frames, seconds = imageio_ffmpeg.count_frames_and_secs(output)
+    assert frames == 60
+    assert seconds == pytest.approx(2.5, abs=0.1)
+
+    scenes = [StackDemo([1]), StackDemo([4, 5]), StackDemo([1, 2, 3], duration=0.5)]
+    with patch.object(
+        scene_cache, "encode_scene_segment", wraps=scene_cache.encode_scene_segment
+    ) as encode:
+        second = render_scenes(scenes, output, cache, narration)
+    assert encode.call_count == 1
+    assert second["reused"] == [first["encoded"][0], first["encoded"][2]]
+    assert imageio_ffmpeg.count_frames_and_secs(output)[0] == 60
+    assert cache.stats()["hits"] == 2
+
+
+def test_scene_cache_prunes_least_recently_used(tmp_path):
+    """Test pruning drops the oldest segments first and spares kept ones."""
+    cache = SceneCache(str(tmp_path), max_bytes=250)
+    for i, key in enumerate(["a", "b", "c", "d"]):
+        with open(cache.path(key), "wb") as f:
+            f.write(b"x" * 100)
+        os.utime(cache.path(key), (i, i))
+    assert cache.get("a") == cache.path("a")
+
+    assert cache.prune(keep=[cache.path("b")]) == 2
+    assert sorted(os.listdir(tmp_path)) == ["a.mp4", "b.mp4"]
+    assert cache.get("c") is None
+    assert cache.stats()["evictions"] == 2
@@ -1,6 +1,12 @@
 import json
 import pytest
-from packages.cli.schema import validate_episode, load_episode_from_file
+from packages.cli.schema import (
+    EPISODE_SCHEMA,
+    compile_schema,
+    load_episode_from_file,
+    validate_episode,
+    validate_many,
+)
 import jsonschema
 
 # Sample valid episode data
@@ -55,3 +61,37 @@ def test_load_episode_from_file():
     import os
 
     os.remove("temp_episode.json")
+
+
+def test_compiled_schema_agrees_with_jsonschema():
+    """Test the fast path accepts exactly what jsonschema accepts."""
+    check = compile_schema(EPISODE_SCHEMA)
+    variants = [
+        VALID_EPISODE,
+        {**VALID_EPISODE, "pattern": "hash-map"},
+        {**VALID_EPISODE, "pattern": [1]},
+        {**VALID_EPISODE, "difficulty": "Invalid"},
+        {**VALID_EPISODE, "accessibility": []},
+        {**VALID_EPISODE, "extra": object()},
+        {k: v for k, v in VALID_EPISODE.items() if k != "objectives"},
+        [],
+    ]
+    validator = jsonschema.Draft202012Validator(EPISODE_SCHEMA)
+    assert check(VALID_EPISODE)
+    for variant in variants:
+        if check(variant):
+            assert validator.is_valid(variant)
+
+
+def test_compile_schema_defers_unknown_keywords():
+    """Test unsupported keywords always fall back to full validation."""
+    check = compile_schema({"type": "string", "minLength": 3})
+    assert check("long enough") is False
+
+
+def test_validate_many_reports_invalid_indexes():
+    """Test bulk validation returns errors keyed by position."""
+    invalid = {**VALID_EPISODE, "difficulty": "Invalid"}
+    errors = validate_many([VALID_EPISODE, invalid, VALID_EPISODE])
+    assert [index for index, _ in errors] == [1]
+    assert isinstance(errors[0][1], jsonschema.ValidationError)
@@ -0,0 +1,58 @@
+import json
+from packages.integrations.streaming import UmpireStepParser
+
+SCRIPT = {
+    "objectives": ['Spot {braces} and "quotes" in strings'],
+    "umpireSteps": [
+        {"phase": "Understand", "narration": "Restate: find [i, j]", "code": "N/A"},
+        {"phase": "Match", "narration": "Hash map } pattern", "code": "N/A"},
+        {
+            "phase": "Implement",
+            "code": "def f(nums):\n    return {n: i for i, n in enumerate(nums)}",
+        },
+    ],
+    "quizzes": [{"question": "Complexity?", "choices": ["O(n)"], "answer": 0}],
+}
+
+
+def test_parser_yields_steps_char_by_char():
+    """Test steps complete incrementally even when split at every character."""
+    text = json.dumps(SCRIPT, indent=2)
+    parser = UmpireStepParser()
+    seen = []
+    for i, char in enumerate(text):
+        for step in parser.feed(char):
+            seen.append((step["phase"], i))
+
+    assert [phase for phase, _ in seen] == ["Understand", "Match", "Implement"]
+    # Each phase is available before the document ends
+    assert seen[0][1] < seen[1][1] < seen[2][1] < len(text) - 1
+    assert parser.result() == SCRIPT
+
+
+def test_parser_ignores_nested_and_other_arrays():
+    """Test only top-level umpireSteps entries are emitted."""
+    doc = {
+        "storyboard": [{"phase": "NotAStep"}],
+        "umpireSteps": [{"phase": "Plan", "extra": [{"nested": True}]}],
+    }
+    parser = UmpireStepParser()
+    steps = parser.feed(json.dumps(doc))
+    assert steps == [{"phase": "Plan", "extra": [{"nested": True}]}]
+
+
+def test_parser_keeps_only_unconsumed_tail():
+    """Test the scan buffer stays bounded by one step, not the whole response."""
+    doc = {
+        "umpireSteps": [{"phase": f"Step {i}", "code": "x" * 50} for i in range(500)]
+    }
+    text = json.dumps(doc)
+    parser = UmpireStepParser()
+    steps, longest = [], 0
+    for i in range(0, len(text), 7):
+        steps.extend(parser.feed(text[i : i + 7]))
+        longest = max(longest, len(parser._text))
+
+    assert len(steps) == 500
+    assert longest < 100
+    assert parser.result() == doc
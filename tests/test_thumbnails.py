@@ -1,5 +1,14 @@
 import io
-from packages.animations.thumbnails import ThumbnailGenerator
+import os
+import pytest
+from unittest.mock import patch
+from PIL import Image
+from packages.animations import thumbnails
+from packages.animations.thumbnails import (
+    ThumbnailGenerator,
+    load_font,
+    render_thumbnails,
+)
 
 
 def test_thumbnail_generator_initialization():
@@ -45,3 +54,107 @@ def test_thumbnail_custom_size():
 
     pil_img = Image.open(img)
     assert pil_img.size == (640, 360)
+
+
+def test_fonts_and_templates_are_cached():
+    """Test fonts load once per size and templates once per difficulty."""
+    load_font.cache_clear()
+    gen = ThumbnailGenerator()
+    with patch(
+        "packages.animations.thumbnails.ImageFont.truetype",
+        wraps=thumbnails.ImageFont.truetype,
+    ) as truetype:
+        for title in ("Two Sum", "Three Sum", "Four Sum"):
+            gen.generate_thumbnail({"title": title, "difficulty": "Easy"})
+    assert truetype.call_count == 2  # title and badge sizes
+    assert list(gen._templates) == ["Easy"]
+
+
+def test_render_thumbnails_skips_unchanged(tmp_path):
+    """Test batch rendering writes PNGs and skips unchanged metadata."""
+    episodes = [
+        ("two-sum", {"title": "Two Sum", "difficulty": "Easy"}),
+        ("lru-cache", {"title": "LRU Cache", "difficulty": "Medium"}),
+    ]
+    assert render_thumbnails(episodes, str(tmp_path), workers=2) == {
+        "rendered": 2,
+        "unchanged": 0,
+    }
+    assert Image.open(tmp_path / "two-sum.png").size == (1280, 720)
+
+    episodes[1][1]["title"] = "LFU Cache"
+    assert render_thumbnails(episodes, str(tmp_path), workers=1) == {
+        "rendered": 1,
+        "unchanged": 1,
+    }
+    assert (
+        render_thumbnails(episodes, str(tmp_path), width=640, height=360)["rendered"]
+        == 2
+    )
+    assert Image.open(tmp_path / "lru-cache.png").size == (640, 360)
+
+
+def test_generate_outputs_default_set():
+    """Test one render yields every format and size variant."""
+    gen = ThumbnailGenerator()
+    with patch.object(gen, "render", wraps=gen.render) as render:
+        outputs = gen.generate_outputs({"title": "Two Sum", "difficulty": "Easy"})
+    assert render.call_count == 1
+
+    expected = {
+        "poster": ("PNG", (1280, 720)),
+        "social": ("JPEG", (1200, 675)),
+        "card": ("WEBP", (640, 360)),
+        "icon": ("PNG", (320, 180)),
+    }
+    for name, (fmt, size) in expected.items():
+        img = Image.open(io.BytesIO(outputs[name]))
+        assert (img.format, img.size) == (fmt, size)
+
+
+def test_generate_outputs_quality_and_sizes(tmp_path):
+    """Test JPEG quality is honored and outputs larger than the generator work."""
+    gen = ThumbnailGenerator(width=640, height=360)
+    episode = {"title": "Two Sum", "difficulty": "Easy"}
+    low, high = (
+        gen.generate_outputs(episode, [{"name": "j", "format": "jpeg", "quality": q}])[
+            "j"
+        ]
+        for q in (20, 95)
+    )
+    assert len(low) < len(high)
+
+    big = gen.generate_outputs(
+        episode, [{"name": "big", "format": "PNG", "size": (1280, 720)}]
+    )["big"]
+    assert Image.open(io.BytesIO(big)).size == (1280, 720)
+    with pytest.raises(ValueError):
+        gen.generate_outputs(episode, [{"name": "x", "format": "TIFF"}])
+
+    paths = gen.save_outputs(episode, str(tmp_path), "two-sum")
+    assert sorted(os.path.basename(p) for p in paths.values()) == [
+        "two-sum-card.webp",
+        "two-sum-icon.png",
+        "two-sum-poster.png",
+        "two-sum-social.jpg",
+    ]
+
+
+def test_generate_outputs_one_master_per_aspect_ratio():
+    """Test outputs of another aspect ratio are rendered, not stretched."""
+    gen = ThumbnailGenerator()
+    episode = {"title": "Two Sum", "difficulty": "Easy"}
+    outputs = [
+        {"name": "poster", "format": "PNG"},
+        {"name": "square", "format": "PNG", "size": (400, 400)},
+        {"name": "small-square", "format": "PNG", "size": (200, 200)},
+    ]
+    result = gen.generate_outputs(episode, outputs)
+
+    square = Image.open(io.BytesIO(result["square"]))
+    direct = ThumbnailGenerator(400, 400).render(episode)
+    assert square.size == (400, 400)
+    assert list(square.convert("RGB").getdata()) == list(
+        direct.convert("RGB").getdata()
+    )
+    assert Image.open(io.BytesIO(result["small-square"])).size == (200, 200)
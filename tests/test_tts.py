@@ -1,5 +1,7 @@
 import pytest
+from unittest.mock import MagicMock, patch
 from packages.animations.tts import TTSGenerator
+from packages.animations.tts_cache import TTSCache
 
 
 def test_tts_generator_initialization():
@@ -32,3 +34,49 @@ def test_tts_with_custom_voice():
     tts = TTSGenerator(use_fallback=True)
     audio = tts.generate_audio("Test", voice_name="en-US-Wavenet-F", speaking_rate=1.2)
     assert isinstance(audio, bytes)
+
+
+def test_generate_segments_uses_cache(tmp_path):
+    """Test unchanged narration is served from the cache without synthesis."""
+    cache = TTSCache(str(tmp_path))
+    tts = TTSGenerator(use_fallback=True, cache=cache)
+    segments = [{"text": "Hello"}, {"text": "World"}, {"text": "Hello"}]
+    with patch.object(
+        TTSGenerator, "_generate_fallback_audio", side_effect=lambda t: t.encode()
+    ) as synth:
+        first = tts.generate_segments(segments)
+        second = TTSGenerator(cache=cache).generate_segments(segments)
+
+    assert first == second == [b"Hello", b"World", b"Hello"]
+    assert synth.call_count == 2
+    assert cache.stats()["hits"] == 4
+
+
+def test_cache_is_on_by_default(isolated_cache_dir):
+    """Test a second generator reuses lines from the default cache."""
+    segments = [{"text": "Hello"}, {"text": "World"}]
+    with patch.object(
+        TTSGenerator, "_generate_fallback_audio", side_effect=lambda t: t.encode()
+    ) as synth:
+        TTSGenerator().generate_segments(segments)
+        assert TTSGenerator().generate_segments(segments) == [b"Hello", b"World"]
+        assert TTSGenerator(use_cache=False).cache is None
+
+    assert synth.call_count == 2
+    assert TTSGenerator().cache.cache_dir == str(isolated_cache_dir / "tts")
+
+
+def test_cloud_fallback_is_cached_under_the_requested_engine(tmp_path):
+    """Test audio that fell back to pyttsx3 is found again while cloud is down."""
+    tts = TTSGenerator(cache=TTSCache(str(tmp_path)))
+    tts.tts_available = True
+    tts.client = MagicMock()
+    tts.client.synthesize_speech.side_effect = RuntimeError("quota exceeded")
+    with patch.object(
+        TTSGenerator, "_generate_fallback_audio", side_effect=lambda t: t.encode()
+    ) as synth:
+        assert tts.generate_audio("Hello") == b"Hello"
+        assert tts.generate_audio("Hello") == b"Hello"
+
+    assert synth.call_count == 1
+    assert tts.client.synthesize_speech.call_count == 1
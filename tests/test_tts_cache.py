@@ -0,0 +1,51 @@
+import os
+from packages.animations.tts_cache import TTSCache
+
+
+def test_key_depends_on_all_inputs():
+    """Test keys change with text, voice, rate and engine."""
+    base = TTSCache.key("Hello", "en-US-Wavenet-D", 1.0, "google")
+    assert base == TTSCache.key("Hello", "en-US-Wavenet-D", 1, "google")
+    assert base != TTSCache.key("Hello!", "en-US-Wavenet-D", 1.0, "google")
+    assert base != TTSCache.key("Hello", "en-US-Wavenet-F", 1.0, "google")
+    assert base != TTSCache.key("Hello", "en-US-Wavenet-D", 1.2, "google")
+    assert base != TTSCache.key("Hello", "en-US-Wavenet-D", 1.0, "pyttsx3")
+
+
+def test_roundtrip_and_stats(tmp_path):
+    """Test cached audio survives across instances and counts hits."""
+    TTSCache(str(tmp_path)).put("k", b"RIFF audio")
+    cache = TTSCache(str(tmp_path))
+    assert cache.get("k") == b"RIFF audio"
+    assert cache.get("missing") is None
+    assert cache.stats()["hit_rate"] == 0.5
+
+
+def test_corrupt_entries_are_discarded(tmp_path):
+    """Test entries failing the integrity check become misses."""
+    cache = TTSCache(str(tmp_path))
+    cache.put("k", b"RIFF audio")
+    path = cache._path("k")
+    with open(path, "r+b") as f:
+        f.seek(-1, os.SEEK_END)
+        f.write(b"X")
+
+    assert cache.get("k") is None
+    assert cache.stats()["corrupt"] == 1
+    assert not os.path.exists(path)
+
+
+def test_lru_eviction(tmp_path):
+    """Test the least recently used entries are evicted first."""
+    cache = TTSCache(str(tmp_path), max_bytes=2 * (32 + 100))
+    cache.put("a", b"a" * 100)
+    cache.put("b", b"b" * 100)
+    os.utime(cache._path("a"), (1, 1))
+    os.utime(cache._path("b"), (2, 2))
+    cache.get("a")  # Refreshes "a", leaving "b" least recently used
+    cache.put("c", b"c" * 100)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"a" * 100
+    assert cache.get("c") == b"c" * 100
+    assert cache.stats()["evictions"] == 1
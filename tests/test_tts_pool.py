@@ -0,0 +1,100 @@
+import os
+from unittest.mock import MagicMock, patch
+from packages.animations import tts_pool
+from packages.animations.tts import TTSGenerator
+from packages.animations.tts_cache import TTSCache
+from packages.animations.tts_pool import SynthesisPool
+
+
+def fake_fallback(text):
+    """Stand-in for pyttsx3 synthesis that runs in the worker processes."""
+    return f"{os.getpid()}:{text}".encode()
+
+
+def _text(audio):
+    return audio.split(b":", 1)[1]
+
+
+def test_pool_preserves_order_across_processes(tmp_path):
+    """Test fallback synthesis runs in worker processes and keeps input order."""
+    tts = TTSGenerator(cache=TTSCache(str(tmp_path)), workers=2)
+    segments = [{"text": f"line {i}"} for i in range(8)]
+    with patch.object(tts_pool, "_synthesize_fallback", fake_fallback):
+        try:
+            audios = tts.generate_segments(segments)
+        finally:
+            tts.close()
+
+    assert [_text(a) for a in audios] == [f"line {i}".encode() for i in range(8)]
+    assert all(not a.startswith(f"{os.getpid()}:".encode()) for a in audios)
+
+
+def test_pool_consults_cache_and_dedupes(tmp_path):
+    """Test cached and repeated lines are not sent to the workers."""
+    cache = TTSCache(str(tmp_path))
+    tts = TTSGenerator(cache=cache)
+    cache.put(cache.key("cached", "en-US-Wavenet-D", 1.0, "pyttsx3"), b"hit")
+    segments = [{"text": "cached"}, {"text": "new"}, {"text": "new"}]
+    with SynthesisPool(tts, processes=1) as pool:
+        with patch.object(pool, "_submit", wraps=pool._submit) as submit:
+            with patch.object(tts_pool, "_synthesize_fallback", fake_fallback):
+                audios = pool.generate_segments(segments)
+
+    assert audios[0] == b"hit"
+    assert _text(audios[1]) == _text(audios[2]) == b"new"
+    assert submit.call_count == 1
+    assert cache.get(cache.key("new", "en-US-Wavenet-D", 1.0, "pyttsx3")) == audios[1]
+
+
+def test_pool_uses_threads_for_cloud_client():
+    """Test cloud synthesis shares one client across the thread pool."""
+    tts = TTSGenerator()
+    tts.tts_available = True
+    tts.client = MagicMock()
+    tts.client.synthesize_speech.side_effect = lambda input, **kw: MagicMock(
+        audio_content=input.text.encode()
+    )
+    with SynthesisPool(tts, threads=4) as pool:
+        audios = pool.generate_segments([{"text": "a"}, {"text": "b"}])
+
+    assert audios == [b"a", b"b"]
+    assert pool._process_pool is None
+
+
+def test_fallback_audio_uses_unique_temp_files():
+    """Test fallback synthesis never writes to a shared path in the cwd."""
+    paths = []
+
+    def save_to_file(text, path):
+        paths.append(path)
+        with open(path, "wb") as f:
+            f.write(text.encode())
+
+    engine = MagicMock()
+    engine.save_to_file.side_effect = save_to_file
+    with patch("packages.animations.tts.pyttsx3.init", return_value=engine):
+        tts = TTSGenerator()
+        assert tts._generate_fallback_audio("one") == b"one"
+        assert tts._generate_fallback_audio("two") == b"two"
+
+    assert paths[0] != paths[1]
+    assert not any(os.path.exists(p) for p in paths)
+    assert "temp_audio.wav" not in paths
+
+
+def test_pool_caches_cloud_fallback_under_requested_engine(tmp_path):
+    """Test lines that fell back to pyttsx3 are cache hits on the next batch."""
+    cache = TTSCache(str(tmp_path))
+    tts = TTSGenerator(cache=cache)
+    tts.tts_available = True
+    tts.client = MagicMock()
+    tts.client.synthesize_speech.side_effect = RuntimeError("quota exceeded")
+    segments = [{"text": "a"}, {"text": "b"}]
+    with SynthesisPool(tts, processes=1) as pool:
+        with patch.object(tts_pool, "_synthesize_fallback", fake_fallback):
+            first = pool.generate_segments(segments)
+            second = pool.generate_segments(segments)
+
+    assert first == second
+    assert tts.client.synthesize_speech.call_count == 2
+    assert cache.get(cache.key("a", "en-US-Wavenet-D", 1.0, "google")) == first[0]
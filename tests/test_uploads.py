@@ -0,0 +1,55 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+from packages.integrations.uploads import UploadRegistry, file_digest
+
+
+def make_handle(name, expires_in):
+    handle = Mock()
+    handle.name = name
+    handle.expiration_time = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
+    return handle
+
+
+def test_file_digest_depends_on_content(tmp_path):
+    """Test digests match for equal bytes and differ otherwise."""
+    a, b, c = tmp_path / "a", tmp_path / "b", tmp_path / "c"
+    a.write_bytes(b"same")
+    b.write_bytes(b"same")
+    c.write_bytes(b"other")
+    assert file_digest(str(a)) == file_digest(str(b)) != file_digest(str(c))
+
+
+def test_expired_handles_are_reuploaded(tmp_path):
+    """Test handles inside the safety margin trigger a fresh upload."""
+    video = tmp_path / "video.mp4"
+    video.write_bytes(b"video")
+    client = Mock()
+    client.files.upload.side_effect = [
+        make_handle("files/old", 60),
+        make_handle("files/new", 3600),
+    ]
+    registry = UploadRegistry(safety_margin=300)
+
+    assert registry.get_or_upload(client, str(video)).name == "files/old"
+    assert registry.get_or_upload(client, str(video)).name == "files/new"
+    assert registry.get_or_upload(client, str(video)).name == "files/new"
+    assert registry.uploads == 2
+    assert registry.reuses == 1
+
+
+def test_registry_persists_across_processes(tmp_path):
+    """Test a persisted registry re-fetches the handle instead of uploading."""
+    video = tmp_path / "video.mp4"
+    video.write_bytes(b"video")
+    registry_path = str(tmp_path / "uploads.json")
+    client = Mock()
+    client.files.upload.return_value = make_handle("files/abc", 3600)
+    UploadRegistry(registry_path).get_or_upload(client, str(video))
+
+    fresh_client = Mock()
+    fresh_client.files.get.return_value = make_handle("files/abc", 3500)
+    handle = UploadRegistry(registry_path).get_or_upload(fresh_client, str(video))
+
+    assert handle.name == "files/abc"
+    fresh_client.files.get.assert_called_once_with(name="files/abc")
+    fresh_client.files.upload.assert_not_called()
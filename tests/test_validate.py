@@ -0,0 +1,99 @@
+import json
+from unittest.mock import patch
+from packages.cli.validate import build_report, expand_paths, validate_paths
+
+EPISODE = {
+    "id": "two-sum",
+    "title": "Two Sum",
+    "leetcodeSlug": "two-sum",
+    "difficulty": "Easy",
+    "pattern": ["hash-map"],
+    "objectives": ["Recognize complement pairs"],
+}
+
+MARKDOWN = """---
+id: three-sum
+title: 3Sum
+leetcodeSlug: 3sum
+difficulty: Medium
+pattern: [two-pointers]
+objectives:
+  - Sort then sweep
+---
+Body
+"""
+
+
+def write_catalog(root):
+    (root / "episodes").mkdir()
+    (root / "episodes" / "two-sum.json").write_text(json.dumps(EPISODE))
+    (root / "episodes" / "three-sum.md").write_text(MARKDOWN)
+    (root / "episodes" / "broken.json").write_text("{not json")
+    (root / "episodes" / "notes.txt").write_text("ignored")
+
+
+def test_expand_paths_handles_dirs_and_globs(tmp_path):
+    """Test directories and glob patterns expand to episode files only."""
+    write_catalog(tmp_path)
+    from_dir = expand_paths([str(tmp_path / "episodes")])
+    from_glob = expand_paths([str(tmp_path / "episodes" / "*.json")])
+    assert [p.rsplit("/", 1)[1] for p in from_dir] == [
+        "broken.json",
+        "three-sum.md",
+        "two-sum.json",
+    ]
+    assert len(from_glob) == 2
+
+
+def test_validate_paths_in_process_pool(tmp_path):
+    """Test JSON and Markdown episodes are validated with per-file timing."""
+    write_catalog(tmp_path)
+    results = validate_paths([str(tmp_path / "episodes")], workers=2)
+    by_name = {r["path"].rsplit("/", 1)[1]: r for r in results}
+
+    assert by_name["two-sum.json"]["valid"]
+    assert by_name["three-sum.md"]["id"] == "three-sum"
+    assert not by_name["broken.json"]["valid"]
+    assert "Invalid JSON" in by_name["broken.json"]["error"]
+    assert all(r["seconds"] >= 0 for r in results)
+    report = build_report(results, 0.1)
+    assert (report["total"], report["valid"], report["invalid"]) == (3, 2, 1)
+
+
+def test_manifest_skips_unchanged_files(tmp_path):
+    """Test only files whose content changed are re-validated."""
+    write_catalog(tmp_path)
+    manifest = str(tmp_path / "manifest.json")
+    validate_paths([str(tmp_path / "episodes")], manifest_path=manifest)
+
+    (tmp_path / "episodes" / "two-sum.json").write_text(
+        json.dumps({**EPISODE, "title": "Two Sum II"})
+    )
+    results = validate_paths([str(tmp_path / "episodes")], manifest_path=manifest)
+    cached = {r["path"].rsplit("/", 1)[1]: r.get("cached", False) for r in results}
+
+    assert cached == {"broken.json": True, "three-sum.md": True, "two-sum.json": False}
+    assert [r["title"] for r in results if r.get("id") == "two-sum"] == ["Two Sum II"]
+
+
+def test_manifest_is_invalidated_by_schema_changes(tmp_path):
+    """Test results recorded under another schema version are not reused."""
+    write_catalog(tmp_path)
+    manifest = str(tmp_path / "manifest.json")
+    validate_paths([str(tmp_path / "episodes")], manifest_path=manifest)
+
+    with patch("packages.cli.validate.SCHEMA_HASH", "other"):
+        results = validate_paths([str(tmp_path / "episodes")], manifest_path=manifest)
+    assert not any(r.get("cached") for r in results)
+
+
+def test_manifest_keeps_entries_from_other_runs(tmp_path):
+    """Test validating a subset merges into, not replaces, the manifest."""
+    write_catalog(tmp_path)
+    manifest = str(tmp_path / "manifest.json")
+    episodes = tmp_path / "episodes"
+    validate_paths([str(episodes)], manifest_path=manifest)
+    validate_paths([str(episodes / "two-sum.json")], manifest_path=manifest)
+
+    results = validate_paths([str(episodes)], manifest_path=manifest)
+    assert all(r.get("cached") for r in results)
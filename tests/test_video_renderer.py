@@ -0,0 +1,57 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+import imageio_ffmpeg
+import numpy as np
+import pytest
+from unittest.mock import patch
+from packages.animations.audio import PCMBuffer
+from packages.animations.tts import TTSGenerator
+from packages.animations.video_renderer import VideoRenderer
+
+
+def _narration_wav(samples=8000):
+    tone = np.sin(np.arange(samples) / 8.0).astype(np.float32) * 0.3
+    return PCMBuffer(tone, 16000).to_wav()
+
+
+def test_concurrent_renders_leave_no_temp_files(tmp_path, monkeypatch):
+    """Test parallel renders produce complete videos without shared temp files."""
+    monkeypatch.chdir(tmp_path)
+    episodes = [
+        {"title": "Two Sum", "difficulty": "Easy"},
+        {"title": "LRU Cache", "difficulty": "Medium"},
+    ]
+
+    def render(i):
+        VideoRenderer(episodes[i]).render_video(
+            f"ep{i}.mp4", captions_path=f"ep{i}.srt"
+        )
+
+    with patch.object(
+        TTSGenerator, "_generate_fallback_audio", return_value=_narration_wav()
+    ):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(render, range(2)))
+
+    assert sorted(os.listdir(tmp_path)) == ["ep0.mp4", "ep0.srt", "ep1.mp4", "ep1.srt"]
+    frames, seconds = imageio_ffmpeg.count_frames_and_secs(str(tmp_path / "ep0.mp4"))
+    assert frames == 12
+    assert "00:00:00,000 --> 00:00:00,500" in (tmp_path / "ep1.srt").read_text()
+
+
+@pytest.mark.parametrize("samples, frames", [(8000, 12), (51360, 77)])
+def test_parallel_render_matches_serial(tmp_path, samples, frames):
+    """Test the chunked encode mode yields the same frames as a serial render.
+
+    51360 samples is 3.21s of narration, not a whole number of frames.
+    """
+    with patch.object(
+        TTSGenerator, "_generate_fallback_audio", return_value=_narration_wav(samples)
+    ):
+        renderer = VideoRenderer({"title": "Two Sum", "difficulty": "Easy"})
+        renderer.render_video(str(tmp_path / "serial.mp4"))
+        renderer.render_video(str(tmp_path / "parallel.mp4"), workers=2)
+
+    serial = imageio_ffmpeg.count_frames_and_secs(str(tmp_path / "serial.mp4"))
+    parallel = imageio_ffmpeg.count_frames_and_secs(str(tmp_path / "parallel.mp4"))
+    assert parallel[0] == serial[0] == frames